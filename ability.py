@@ -1,4 +1,41 @@
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, NamedTuple
+
+# List of positive player statistic modifiers
+POSITIVE_PLAYER_STAT_MODIFIERS = [
+    "health_regeneration",
+    "mana_regeneration",
+    "absorption",
+    "physical_damage",
+    "magical_damage",
+    "physical_defense",
+    "magical_defense",
+    "mana_points",
+    "physical_power",
+    "spell_power",
+]
+
+# List of negative player statistic modifiers
+NEGATIVE_PLAYER_STAT_MODIFIERS = [
+    "stun",
+    "physical_defense_reduction",
+    "physical_damage_reduction",
+    "bleed",
+]
+
+
+class AbilityEffect(NamedTuple):
+    """
+    AbilityEffect holding an ability's stats pre-sorted into what happens when it is cast,
+    so combat applies them without classifying the ability's stats every cast.
+    """
+
+    critical: float  # Added to the critical rate of the cast
+    buffs: Tuple[Tuple[str, float], ...]  # Stat increases reverted after the duration
+    # Debuffs inflicted, as (name, (value, duration))
+    debuffs: Tuple[Tuple[str, Tuple[float, int]], ...]
+    cost: Tuple[Tuple[str, float], ...]  # Stats spent on the cast
+    cooldown: int  # Attacks before the ability can be cast again
+    duration: int  # Turns the buffs last
 
 
 class Ability:
@@ -14,6 +51,7 @@ class Ability:
     __duration: int = 0
     __upgrades: List[Tuple[str, float]] = None
     __icon_URL: str = None
+    __effect: AbilityEffect = None
 
     def __init__(
         self,
@@ -50,15 +88,17 @@ class Ability:
 
         :return: A new instance of Ability with the same attributes.
         """
-        return Ability(
+        ability_copy = Ability(
             self.get_name(),
             self.get_description(),
-            self.get_stats(),
-            self.get_cost(),
+            dict(self.get_stats()),
+            list(self.get_cost()),
             self.get_duration(),
             self.get_icon_URL(),
-            self.get_upgrades(),
+            list(self.get_upgrades()),
         )
+        ability_copy.set_effect(self.__effect)
+        return ability_copy
 
     def upgrade(self) -> None:
         """
@@ -69,6 +109,50 @@ class Ability:
                 self.get_stats()[upgrade[0]] += upgrade[1]
             else:
                 self.get_stats()[upgrade[0]] = upgrade[1]
+        self.set_effect(None)
+
+    def compile_effect(self) -> AbilityEffect:
+        """
+        Sorts the ability's stats into the effect applied when it is cast.
+
+        :return: The compiled effect.
+        """
+        critical = 0
+        buffs: List[Tuple[str, float]] = []
+        debuffs: List[Tuple[str, Tuple[float, int]]] = []
+        for modifier, value in self.get_stats().items():
+            if modifier == "critical":
+                critical += value
+            elif modifier in NEGATIVE_PLAYER_STAT_MODIFIERS:
+                debuffs.append((modifier, (value, self.get_duration())))
+            elif modifier in POSITIVE_PLAYER_STAT_MODIFIERS:
+                buffs.append((modifier, value))
+        return AbilityEffect(
+            critical,
+            tuple(buffs),
+            tuple(debuffs),
+            tuple(self.get_cost()),
+            self.get_stats()["cooldown"],
+            self.get_duration(),
+        )
+
+    def get_effect(self) -> AbilityEffect:
+        """
+        Gets the compiled effect of the ability, compiling it on first use.
+
+        :return: The compiled effect.
+        """
+        if self.__effect is None:
+            self.__effect = self.compile_effect()
+        return self.__effect
+
+    def set_effect(self, effect: AbilityEffect) -> None:
+        """
+        Sets the compiled effect of the ability, or None to recompile it on next use.
+
+        :param effect: The compiled effect.
+        """
+        self.__effect = effect
 
     def get_name(self) -> str:
         """
@@ -117,6 +201,7 @@ class Ability:
         :param stats: The new stats of the ability.
         """
         self.__stats = stats
+        self.set_effect(None)
 
     def get_cost(self) -> List[Tuple[str, float]]:
         """
@@ -133,6 +218,7 @@ class Ability:
         :param cost: The new cost of the ability.
         """
         self.__cost = cost
+        self.set_effect(None)
 
     def get_duration(self) -> int:
         """
@@ -149,6 +235,7 @@ class Ability:
         :param duration: The new duration of the ability.
         """
         self.__duration = duration
+        self.set_effect(None)
 
     def get_upgrades(self) -> List[Tuple[str, float]]:
         """
@@ -312,3 +399,7 @@ ENEMY_ABILITY_LIST: dict[str, Ability] = {
         "assets/abilities/Tail Swipe.webp",
     ),
 }
+
+# Compile every ability once at load time
+for listed_ability in [*PLAYER_ABILITY_LIST.values(), *ENEMY_ABILITY_LIST.values()]:
+    listed_ability.get_effect()
@@ -0,0 +1,301 @@
+import argparse
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+import pygame
+from utilities.json_utility import write_json_atomic
+
+ASSETS_FOLDER = "assets"
+
+# Generated index of every image under the assets folder
+MANIFEST_PATH = "assets/manifest.json"
+
+# Version of the manifest layout, raised whenever it changes
+MANIFEST_VERSION = 2
+
+# File types indexed by the manifest
+IMAGE_TYPES: Tuple[str, ...] = (".png", ".jpg", ".webp")
+
+
+def hash_contents(contents: bytes) -> bytes:
+    """
+    Hashes the contents of an asset file.
+
+    :param contents: The file contents.
+    :return: The 16-byte BLAKE2 digest.
+    """
+    return hashlib.blake2b(contents, digest_size=16).digest()
+
+
+def get_asset_id(path: str) -> str:
+    """
+    Gets the logical ID of an asset file: its path under the assets folder without
+    the extension, e.g. "characters/players/warrior/idle/0".
+
+    :param path: Path to the asset file, e.g. "assets/characters/.../0.png".
+    :return: The asset ID.
+    """
+    relative_path = os.path.relpath(path, ASSETS_FOLDER).replace(os.sep, "/")
+    return os.path.splitext(relative_path)[0]
+
+
+def get_folder_id(directory: str) -> str:
+    """
+    Gets the path of a folder under the assets folder, as used in asset IDs, e.g.
+    "characters/players/warrior/idle".
+
+    :param directory: Path to the folder, e.g. "assets/characters/.../idle".
+    :return: The folder's path relative to the assets folder.
+    """
+    return os.path.relpath(directory, ASSETS_FOLDER).replace(os.sep, "/")
+
+
+def build_manifest(
+    previous_entries: Dict[str, Dict[str, Any]]
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, int], int]:
+    """
+    Indexes every image under the assets folder, and the modification time of every
+    folder holding images. Files whose size and modification time match their
+    previous entry keep it, and only the others are read, hashed and decoded for
+    their dimensions.
+
+    :param previous_entries: The entries of the last manifest, by asset ID.
+    :return: The new entries by asset ID, the folder modification times by folder,
+        and how many files were indexed again.
+    """
+    entries: Dict[str, Dict[str, Any]] = {}
+    folder_mtimes: Dict[str, int] = {}
+    indexed_count = 0
+    for directory, folders, files in os.walk(ASSETS_FOLDER):
+        # Skip generated and hidden folders, such as the pixel cache
+        folders[:] = sorted(
+            folder
+            for folder in folders
+            if not folder.startswith(".") and folder != "__pycache__"
+        )
+        if any(os.path.splitext(name)[1].lower() in IMAGE_TYPES for name in files):
+            folder_mtimes[get_folder_id(directory)] = os.stat(directory).st_mtime_ns
+        for file_name in sorted(files):
+            if os.path.splitext(file_name)[1].lower() not in IMAGE_TYPES:
+                continue
+            path = (directory + "/" + file_name).replace(os.sep, "/")
+            stat = os.stat(path)
+            entry = previous_entries.get(get_asset_id(path))
+            if (
+                entry is None
+                or entry["path"] != path
+                or entry["size"] != stat.st_size
+                or entry["mtime_ns"] != stat.st_mtime_ns
+            ):
+                with open(path, "rb") as file:
+                    contents = file.read()
+                width, height = pygame.image.load(path).get_size()
+                entry = {
+                    "path": path,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "hash": hash_contents(contents).hex(),
+                    "width": width,
+                    "height": height,
+                }
+                indexed_count += 1
+            entries[get_asset_id(path)] = entry
+    return entries, folder_mtimes, indexed_count
+
+
+class AssetManifest:
+    """
+    AssetManifest class giving access to the generated index of every image under the
+    assets folder, read in one go. Each entry holds the file's path, size,
+    modification time, content hash and dimensions, under a logical asset ID unique
+    across the whole tree.
+
+    The manifest lets the game check whether an asset is unchanged, or list an
+    animation's frames, with a single stat instead of reading the file or the
+    folder. An asset or folder missing from it, or changed since it was generated,
+    is read from disk as usual.
+    """
+
+    __entries: Dict[str, Dict[str, Any]] = None
+    __ids_by_path: Dict[str, str] = None
+    __folder_mtimes: Dict[str, int] = None
+    __names_by_folder: Dict[str, List[str]] = None
+
+    def __init__(self, manifest_path: str = MANIFEST_PATH) -> None:
+        """
+        Initializes the AssetManifest class, reading the manifest if it exists.
+
+        :param manifest_path: Path to the manifest.
+        """
+        self.set_entries({})
+        self.set_folder_mtimes({})
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as file:
+                manifest = json.load(file)
+            if manifest.get("version") == MANIFEST_VERSION:
+                self.set_entries(manifest["assets"])
+                self.set_folder_mtimes(manifest["folders"])
+        self.set_ids_by_path(
+            {entry["path"]: asset_id for asset_id, entry in self.get_entries().items()}
+        )
+        names_by_folder: Dict[str, List[str]] = {}
+        for entry in self.get_entries().values():
+            directory, file_name = entry["path"].rsplit("/", 1)
+            names_by_folder.setdefault(get_folder_id(directory), []).append(file_name)
+        for names in names_by_folder.values():
+            names.sort()
+        self.set_names_by_folder(names_by_folder)
+
+    def get_entry(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Gets the entry of an asset file.
+
+        :param path: Path to the asset file.
+        :return: The entry, or None if the file is not in the manifest.
+        """
+        asset_id = self.get_ids_by_path().get(path)
+        return self.get_entries()[asset_id] if asset_id is not None else None
+
+    def get_unchanged_hash(self, path: str) -> Optional[bytes]:
+        """
+        Gets the content hash of an asset file if the file still has the size and
+        modification time it had when the manifest was generated.
+
+        :param path: Path to the asset file.
+        :return: The digest from the manifest, or None if the file is not in the
+            manifest or may have changed.
+        """
+        entry = self.get_entry(path)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            return None
+        return bytes.fromhex(entry["hash"])
+
+    def list_folder(self, folder: str) -> Optional[List[str]]:
+        """
+        Lists the images directly inside a folder, if the folder still has the
+        modification time it had when the manifest was generated. Adding, removing or
+        renaming a file changes it.
+
+        :param folder: The folder, relative to the assets folder.
+        :return: The image file names, sorted, or None if the manifest has no image
+            in that folder or the folder may have changed.
+        """
+        folder = folder.rstrip("/")
+        names = self.get_names_by_folder().get(folder)
+        if names is None:
+            return None
+        try:
+            stat = os.stat(ASSETS_FOLDER + "/" + folder)
+        except OSError:
+            return None
+        if stat.st_mtime_ns != self.get_folder_mtimes().get(folder):
+            return None
+        return list(names)
+
+    # Getters and setters with docstrings
+
+    def get_entries(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Gets the entries of the manifest.
+
+        :return: The entries by asset ID.
+        """
+        return self.__entries
+
+    def set_entries(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Sets the entries of the manifest.
+
+        :param entries: The new entries by asset ID.
+        """
+        self.__entries = entries
+
+    def get_ids_by_path(self) -> Dict[str, str]:
+        """
+        Gets the asset IDs by file path.
+
+        :return: The asset IDs by path.
+        """
+        return self.__ids_by_path
+
+    def set_ids_by_path(self, ids_by_path: Dict[str, str]) -> None:
+        """
+        Sets the asset IDs by file path.
+
+        :param ids_by_path: The new asset IDs by path.
+        """
+        self.__ids_by_path = ids_by_path
+
+    def get_folder_mtimes(self) -> Dict[str, int]:
+        """
+        Gets the modification times of the folders when the manifest was generated.
+
+        :return: The modification times in nanoseconds by folder.
+        """
+        return self.__folder_mtimes
+
+    def set_folder_mtimes(self, folder_mtimes: Dict[str, int]) -> None:
+        """
+        Sets the modification times of the folders when the manifest was generated.
+
+        :param folder_mtimes: The new modification times in nanoseconds by folder.
+        """
+        self.__folder_mtimes = folder_mtimes
+
+    def get_names_by_folder(self) -> Dict[str, List[str]]:
+        """
+        Gets the image file names of each folder in the manifest.
+
+        :return: The sorted file names by folder.
+        """
+        return self.__names_by_folder
+
+    def set_names_by_folder(self, names_by_folder: Dict[str, List[str]]) -> None:
+        """
+        Sets the image file names of each folder in the manifest.
+
+        :param names_by_folder: The new sorted file names by folder.
+        """
+        self.__names_by_folder = names_by_folder
+
+
+# The manifest shared by the whole game, read on first use
+_asset_manifest: AssetManifest = None
+
+
+def get_asset_manifest() -> AssetManifest:
+    """
+    Gets the manifest shared by the whole game.
+
+    :return: The shared asset manifest.
+    """
+    global _asset_manifest
+    if _asset_manifest is None:
+        _asset_manifest = AssetManifest()
+    return _asset_manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Index every image under the assets folder into the manifest."
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="index every file again, not just changes"
+    )
+    args = parser.parse_args()
+
+    previous_entries = {} if args.full else AssetManifest().get_entries()
+    entries, folder_mtimes, indexed_count = build_manifest(previous_entries)
+    write_json_atomic(
+        MANIFEST_PATH,
+        {"version": MANIFEST_VERSION, "assets": entries, "folders": folder_mtimes},
+        "none",
+    )
+    print(f"{len(entries)} assets, {indexed_count} indexed again")
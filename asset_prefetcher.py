@@ -0,0 +1,157 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List
+import os
+import pygame
+from asset_manifest import get_asset_manifest
+from pixel_cache import load_pixels
+from sprite_atlas import find_atlas
+from surface_cache import get_surface_cache
+
+BASE_IMG_PATH = "assets/"
+
+
+def decode_images(path: str) -> List[pygame.Surface]:
+    """
+    Decodes every image of a folder, through the pixel cache, without converting it
+    to the display format. The folder is listed from the asset manifest, and only
+    read if the manifest does not cover it.
+
+    :param path: The folder, relative to the assets folder.
+    :return: The decoded images, sorted by file name.
+    """
+    img_names = get_asset_manifest().list_folder(path)
+    if img_names is None:
+        img_names = sorted(os.listdir(BASE_IMG_PATH + path))
+    return [
+        load_pixels(BASE_IMG_PATH + path + "/" + img_name) for img_name in img_names
+    ]
+
+
+class AssetPrefetcher:
+    """
+    AssetPrefetcher class decoding image folders on a worker thread ahead of the state
+    that needs them. States hint the folders their likely successors will load, and
+    load then picks up the decoded images instead of reading them from disk, waiting
+    only if the decoding is not finished yet. Converting the images to the display
+    format is left to the main thread.
+
+    A folder packed into a character's atlas is prefetched by decoding the atlas
+    image instead, once for all of the character's animations and only if the
+    surface cache does not hold it already. The decoded atlas is picked up by
+    load_image, keyed by the atlas image's path.
+
+    Prefetched folders are kept until they are loaded, so an unused hint costs the
+    memory of one folder until the same folder is loaded.
+    """
+
+    __executor: ThreadPoolExecutor = None
+    __pending: Dict[str, Future] = None
+
+    def __init__(self) -> None:
+        """
+        Initializes the AssetPrefetcher class.
+        """
+        self.set_executor(ThreadPoolExecutor(max_workers=1))
+        self.set_pending({})
+
+    def prefetch(self, path: str) -> None:
+        """
+        Starts decoding a folder on the worker thread, unless it already is.
+
+        :param path: The folder, relative to the assets folder.
+        """
+        atlas = find_atlas(path)
+        if atlas is not None:
+            atlas_path = atlas[0]
+            is_cached = get_surface_cache().contains(atlas_path, convert="colorkey")
+            if atlas_path not in self.get_pending() and not is_cached:
+                self.get_pending()[atlas_path] = self.get_executor().submit(
+                    load_pixels, atlas_path
+                )
+        elif path not in self.get_pending():
+            self.get_pending()[path] = self.get_executor().submit(decode_images, path)
+
+    def prefetch_all(self, paths: Iterable[str]) -> None:
+        """
+        Starts decoding several folders on the worker thread.
+
+        :param paths: The folders, relative to the assets folder.
+        """
+        for path in paths:
+            self.prefetch(path)
+
+    def load(self, path: str) -> List[pygame.Surface]:
+        """
+        Gets the decoded images of a folder, prefetched if it was hinted and decoded
+        right away otherwise.
+
+        :param path: The folder, relative to the assets folder.
+        :return: The decoded images, sorted by file name.
+        """
+        future = self.get_pending().pop(path, None)
+        if future is None:
+            return decode_images(path)
+        return future.result()
+
+    def load_image(self, image_path: str) -> pygame.Surface:
+        """
+        Gets a decoded image, prefetched if it was hinted and decoded right away
+        otherwise.
+
+        :param image_path: Path to the image file, e.g. a character's atlas.
+        :return: The decoded image.
+        """
+        future = self.get_pending().pop(image_path, None)
+        if future is None:
+            return load_pixels(image_path)
+        return future.result()
+
+    # Getters and setters with docstrings
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        Gets the worker the folders are decoded on.
+
+        :return: The single-thread executor.
+        """
+        return self.__executor
+
+    def set_executor(self, executor: ThreadPoolExecutor) -> None:
+        """
+        Sets the worker the folders are decoded on.
+
+        :param executor: The new executor.
+        """
+        self.__executor = executor
+
+    def get_pending(self) -> Dict[str, Future]:
+        """
+        Gets the prefetched folders and atlases not loaded yet.
+
+        :return: The futures of the decoded images by folder or atlas path.
+        """
+        return self.__pending
+
+    def set_pending(self, pending: Dict[str, Future]) -> None:
+        """
+        Sets the prefetched folders and atlases not loaded yet.
+
+        :param pending: The new futures of the decoded images by folder or atlas path.
+        """
+        self.__pending = pending
+
+
+# The prefetcher shared by the whole game, created on first use
+_asset_prefetcher: AssetPrefetcher = None
+
+
+def get_asset_prefetcher() -> AssetPrefetcher:
+    """
+    Gets the prefetcher shared by the whole game.
+
+    :return: The shared asset prefetcher.
+    """
+    global _asset_prefetcher
+    if _asset_prefetcher is None:
+        _asset_prefetcher = AssetPrefetcher()
+    return _asset_prefetcher
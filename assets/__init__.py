@@ -1,43 +1,24 @@
 from pathlib import Path
+from asset_manifest import MANIFEST_PATH, get_asset_manifest
 
 # Global Variables
 GAME_ASSETS: dict[str, Path] = {}
 
 
-def __iterate_files(directory: Path, image_types: tuple):
-    """
-        Iterates over files in a directory adding them
-        to the game assets. Recursively calls itself when
-        a sub-directory is found
-
-    Args:
-        directory (Path): Path to sub-directory
-        image_types (tuple): tuple of valid image file types
-    """
-    for item in Path.iterdir(directory):
-        if item.is_file and item.suffix in image_types:
-            GAME_ASSETS[item.stem] = item
-
-        # if a sub-folder is found
-        elif item.is_dir():
-            __iterate_files(item, image_types)
-
-
 def load_assets():
     """
-    Searches the local directory for assets
-    using current working directory.
-    """
-    # Constants
-    cwd: Path = Path.cwd()
-    assets_folder = Path.joinpath(cwd, "assets")
-    image_types = (".jpg", ".png")
+    Fills the game assets from the asset manifest, in one read,
+    keyed by logical asset ID, e.g. "characters/players/warrior/idle/0",
+    so same-named frames of different characters never collide.
 
-    # Verify assets folder exists
-    if not assets_folder.exists():
-        raise FileNotFoundError(f"Assets directory not found: {assets_folder}")
+    Raises:
+        FileNotFoundError: If the manifest has not been generated
+            with python asset_manifest.py
+    """
+    # Verify the manifest exists
+    if not Path(MANIFEST_PATH).exists():
+        raise FileNotFoundError(f"Asset manifest not found: {MANIFEST_PATH}")
 
-    # Iterate over files in the directory adding    \
-    #   each image to the dictionary. Images will  \
-    #   be added by the file name, sans the suffix
-    __iterate_files(assets_folder, image_types)
+    # Map each asset ID to the path of its file
+    for asset_id, entry in get_asset_manifest().get_entries().items():
+        GAME_ASSETS[asset_id] = Path(entry["path"])
@@ -0,0 +1,191 @@
+import argparse
+import copy
+import csv
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+from characters.players.base_player import BasePlayer
+from characters.players.warrior import Warrior
+from characters.players.mage import Mage
+from characters.players.berserker import Berserker
+from characters.players.ranger import Ranger
+from characters.enemies.base_enemy import BaseEnemy
+from characters.enemies.dreadnought import DreadNought
+from characters.enemies.devourer import Devourer
+from characters.enemies.enigma import Enigma
+from combat_simulator import CombatSimulator
+from user_settings import DEFAULT_USER_DATA
+from utilities.general_utility import percentile
+
+# Player classes covered by the matrix
+PLAYER_CLASSES: Dict[str, type] = {
+    "Warrior": Warrior,
+    "Mage": Mage,
+    "Berserker": Berserker,
+    "Ranger": Ranger,
+}
+
+# Enemy classes covered by the matrix
+ENEMY_CLASSES: Dict[str, type] = {
+    "DreadNought": DreadNought,
+    "Devourer": Devourer,
+    "Enigma": Enigma,
+}
+
+# Player levels covered by the matrix
+PLAYER_LEVELS = [1, 2, 3, 4]
+
+# Damage percentiles reported for every matchup
+DAMAGE_PERCENTILES = [10, 50, 90, 99]
+
+
+def create_player(
+    player_name: str, level: int, unlock_ability: bool = False
+) -> BasePlayer:
+    """
+    Builds a player at the given level from in-memory user data, without touching the user settings file.
+
+    :param player_name: The player class name, e.g. "Warrior".
+    :param level: The character level to build.
+    :param unlock_ability: Whether the purchasable ability is unlocked as well.
+    :return: The player character.
+    """
+    user_data = copy.deepcopy(DEFAULT_USER_DATA)
+    user_data["character_level"][player_name] = level
+    player = PLAYER_CLASSES[player_name]("", user_data)
+    if unlock_ability:
+        player.unlock_ability()
+    return player
+
+
+def create_enemy(enemy_name: str) -> BaseEnemy:
+    """
+    Builds an enemy.
+
+    :param enemy_name: The enemy class name, e.g. "DreadNought".
+    :return: The enemy character.
+    """
+    return ENEMY_CLASSES[enemy_name]("")
+
+
+def simulate_matchup(
+    player_name: str,
+    level: int,
+    enemy_name: str,
+    fight_count: int,
+    hit_height: float,
+    unlock_ability: bool,
+) -> Dict[str, Any]:
+    """
+    Runs every fight of one matchup. Executed inside a worker process.
+
+    :param player_name: The player class name.
+    :param level: The player level.
+    :param enemy_name: The enemy class name.
+    :param fight_count: The number of fights to run.
+    :param hit_height: How high up the enemy sprite the player hits.
+    :param unlock_ability: Whether the purchasable ability is unlocked as well.
+    :return: A row of summary statistics for the matchup.
+    """
+    simulator = CombatSimulator(
+        create_player(player_name, level, unlock_ability),
+        create_enemy(enemy_name),
+        hit_height=hit_height,
+    )
+    results = simulator.run_fights(fight_count)
+    player_damages = sorted(result.get_player_damage() for result in results)
+
+    row: Dict[str, Any] = {
+        "player": player_name,
+        "level": level,
+        "enemy": enemy_name,
+        "fights": fight_count,
+        "win_rate": sum(result.get_winner() == "player" for result in results)
+        / fight_count,
+        "draw_rate": sum(result.get_winner() == "draw" for result in results)
+        / fight_count,
+        "mean_rounds": sum(result.get_rounds() for result in results) / fight_count,
+    }
+    for percent in DAMAGE_PERCENTILES:
+        row[f"damage_p{percent}"] = percentile(player_damages, percent)
+    return row
+
+
+def run_matrix(
+    fight_count: int,
+    hit_height: float = 100,
+    unlock_ability: bool = False,
+    workers: int = None,
+) -> List[Dict[str, Any]]:
+    """
+    Simulates every player class and level against every enemy across a pool of worker processes.
+
+    :param fight_count: The number of fights per matchup.
+    :param hit_height: How high up the enemy sprite the player hits.
+    :param unlock_ability: Whether the purchasable ability is unlocked as well.
+    :param workers: The number of worker processes, defaults to the number of cores.
+    :return: One row of summary statistics per matchup.
+    """
+    matchups = [
+        (player_name, level, enemy_name)
+        for player_name in PLAYER_CLASSES
+        for level in PLAYER_LEVELS
+        for enemy_name in ENEMY_CLASSES
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                simulate_matchup,
+                player_name,
+                level,
+                enemy_name,
+                fight_count,
+                hit_height,
+                unlock_ability,
+            )
+            for player_name, level, enemy_name in matchups
+        ]
+        return [future.result() for future in futures]
+
+
+def write_rows(file_path: str, rows: List[Dict[str, Any]]) -> None:
+    """
+    Writes the matrix to a CSV or JSON file, chosen by the file extension.
+
+    :param file_path: Path to the output file.
+    :param rows: The rows to write.
+    """
+    if os.path.splitext(file_path)[1].lower() == ".json":
+        with open(file_path, "w") as file:
+            json.dump(rows, file, indent=4)
+    else:
+        with open(file_path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Simulate the win-rate matrix of every player class and level against every enemy."
+    )
+    parser.add_argument("--fights", type=int, default=1000, help="fights per matchup")
+    parser.add_argument(
+        "--hit-height", type=float, default=100, help="hit height on a 200px sprite"
+    )
+    parser.add_argument(
+        "--unlock-ability",
+        action="store_true",
+        help="also unlock each class's purchasable ability",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument(
+        "--output", default="balance_matrix.csv", help="output .csv or .json file"
+    )
+    args = parser.parse_args()
+
+    write_rows(
+        args.output,
+        run_matrix(args.fights, args.hit_height, args.unlock_ability, args.workers),
+    )
@@ -1,5 +1,5 @@
 from ability import Ability
-import copy
+from stat_block import StatBlock
 
 
 class BaseCharacter:
@@ -9,20 +9,20 @@ class BaseCharacter:
 
     Attributes:
         __name (str): The name of the character.
-        __stats (dict[str, int]): Dictionary holding the character's stats.
+        __stats (StatBlock): The character's stats.
         __abilities (list[Ability]): List of abilities the character possesses.
         __sprite_location (str): File path to the character's sprite image.
     """
 
     __name: str = ""
-    __stats: dict[str, int] = {}
+    __stats: StatBlock = None
     __abilities: list[Ability] = []
     __sprite_location: str = ""
 
     def __init__(
         self,
         name: str,
-        stats: dict[str, int],
+        stats: StatBlock,
         sprite_location: str,
         abilities: list[Ability],
     ) -> None:
@@ -30,7 +30,7 @@ class BaseCharacter:
         Initializes the BaseCharacter class with the provided attributes.
 
         :param name: The name of the character.
-        :param stats: Dictionary containing the character's stats.
+        :param stats: The character's stats.
         :param sprite_location: The file path to the character's sprite image.
         :param abilities: List of abilities the character possesses.
         """
@@ -47,7 +47,7 @@ class BaseCharacter:
         """
         return BaseCharacter(
             self.get_name(),
-            copy.deepcopy(self.get_stats()),
+            self.get_stats().copy(),
             self.get_sprite_location(),
             self.get_abilities(),
         )
@@ -68,11 +68,11 @@ class BaseCharacter:
         """
         return self.__sprite_location
 
-    def get_stats(self) -> dict[str, int]:
+    def get_stats(self) -> StatBlock:
         """
         Gets the stats of the character.
 
-        :return: Dictionary of stats.
+        :return: The character's stats.
         """
         return self.__stats
 
@@ -100,11 +100,11 @@ class BaseCharacter:
         """
         self.__sprite_location = sprite_location
 
-    def set_stats(self, stats: dict[str, int]) -> None:
+    def set_stats(self, stats: StatBlock) -> None:
         """
         Sets the stats for the character.
 
-        :param stats: Dictionary of stats.
+        :param stats: The character's stats.
         """
         self.__stats = stats
 
@@ -1,6 +1,6 @@
 from characters.base_character import BaseCharacter
 from ability import Ability
-import copy
+from stat_block import StatBlock
 
 
 class BaseEnemy(BaseCharacter):
@@ -23,7 +23,7 @@ class BaseEnemy(BaseCharacter):
     def __init__(
         self,
         name: str,
-        stats: dict,
+        stats: StatBlock,
         sprite_location: str,
         abilities: list[Ability],
     ) -> None:
@@ -31,7 +31,7 @@ class BaseEnemy(BaseCharacter):
         Initializes the BaseEnemy class with the provided attributes.
 
         :param name: The name of the enemy.
-        :param stats: Dictionary containing the enemy's stats.
+        :param stats: The enemy's stats.
         :param sprite_location: The file path to the enemy's sprite image.
         :param abilities: List of abilities the enemy possesses.
         """
@@ -45,7 +45,7 @@ class BaseEnemy(BaseCharacter):
         """
         return BaseEnemy(
             self.get_name(),
-            copy.deepcopy(self.get_stats()),
+            self.get_stats().copy(),
             self.get_sprite_location(),
             self.get_abilities(),
         )
@@ -66,11 +66,11 @@ class BaseEnemy(BaseCharacter):
         """
         return super().get_sprite_location()
 
-    def get_stats(self) -> dict:
+    def get_stats(self) -> StatBlock:
         """
         Gets the stats of the enemy.
 
-        :return: Dictionary of stats.
+        :return: The stats.
         """
         return super().get_stats()
 
@@ -98,11 +98,11 @@ class BaseEnemy(BaseCharacter):
         """
         super().set_sprite_location(sprite_location)
 
-    def set_stats(self, stats: dict[str, int]) -> None:
+    def set_stats(self, stats: StatBlock) -> None:
         """
         Sets the stats for the enemy.
 
-        :param stats: Dictionary of stats.
+        :param stats: The stats.
         """
         super().set_stats(stats)
 
@@ -1,6 +1,6 @@
 from characters.enemies.base_enemy import BaseEnemy
 from ability import Ability, ENEMY_ABILITY_LIST
-import copy
+from stat_block import StatBlock
 
 
 class DreadNought(BaseEnemy):
@@ -27,7 +27,7 @@ class DreadNought(BaseEnemy):
     def __init__(self, sprite_location: str) -> None:
         super().__init__(
             "DreadNought",
-            copy.deepcopy(self.__stats),
+            StatBlock(self.__stats),
             sprite_location,
             self.__abilities,
         )
@@ -41,7 +41,7 @@ class DreadNought(BaseEnemy):
     def get_sprite_location(self) -> str:
         return super().get_sprite_location()
 
-    def get_stats(self) -> dict:
+    def get_stats(self) -> StatBlock:
         return super().get_stats()
 
     def get_abilities(self) -> list[Ability]:
@@ -53,7 +53,7 @@ class DreadNought(BaseEnemy):
     def set_sprite_location(self, sprite_location: str) -> None:
         super().set_sprite_location(sprite_location)
 
-    def set_stats(self, stats: dict) -> None:
+    def set_stats(self, stats: StatBlock) -> None:
         super().set_stats(stats)
 
     def set_abilities(self, abilities: list[Ability]) -> None:
@@ -1,8 +1,9 @@
 import abc
 from ability import Ability
 from characters.base_character import BaseCharacter
-import copy
-from utilities.json_utility import read_json, write_json
+from typing import Any
+from settings_store import get_settings_store
+from stat_block import StatBlock
 
 
 class BasePlayer(abc.ABC, BaseCharacter):
@@ -13,40 +14,48 @@ class BasePlayer(abc.ABC, BaseCharacter):
     Attributes:
         __unlocked_abilities (list[Ability]): List of abilities unlocked by the player.
         __character_level (int): Current level of the player character.
+        __user_data (dict[str, Any]): In-memory user data to persist into instead of the shared user settings.
 
     Methods:
         copy: Creates a deep copy of the player instance.
         upgrade: Abstract method to upgrade the player character.
         unlock_ability: Abstract method to unlock a new ability for the player character.
         get_character_level: Gets the character level.
+        has_unlocked_ability: Checks if an ability has been unlocked.
         get_unlocked_abilities: Gets the list of unlocked abilities.
-        set_character_level: Sets the character level and updates the user settings file.
-        set_unlocked_abilities: Sets the unlocked abilities and updates the user settings file.
+        get_user_data: Gets the in-memory user data.
+        set_character_level: Sets the character level and updates the user settings.
+        set_unlocked_abilities: Sets the unlocked abilities and updates the user settings.
+        set_user_data: Sets the in-memory user data.
     """
 
     __unlocked_abilities: list[Ability] = []
     __character_level: int = 1
+    __user_data: dict[str, Any] = None
 
     def __init__(
         self,
         name: str,
-        stats: dict,
+        stats: StatBlock,
         sprite_location: str,
         abilities: list[Ability],
         unlocked_abilities: list[Ability],
         character_level: int = 1,
+        user_data: dict[str, Any] = None,
     ) -> None:
         """
         Initializes the BasePlayer class with the provided attributes.
 
         :param name: The name of the player character.
-        :param stats: Dictionary containing the player's stats.
+        :param stats: The player's stats.
         :param sprite_location: The file path to the player's sprite image.
         :param abilities: List of abilities the player possesses.
         :param unlocked_abilities: List of abilities unlocked by the player.
         :param character_level: Initial level of the player character.
+        :param user_data: In-memory user data to persist into, or None to use the shared user settings.
         """
         super().__init__(name, stats, sprite_location, abilities)
+        self.set_user_data(user_data)
         self.set_character_level(character_level)
         self.set_unlocked_abilities(unlocked_abilities)
 
@@ -58,7 +67,7 @@ class BasePlayer(abc.ABC, BaseCharacter):
         """
         return self.__class__(
             self.get_name(),
-            copy.deepcopy(self.get_stats()),  # Deep copy the stats dictionary
+            self.get_stats().copy(),
             self.get_sprite_location(),
             self.get_abilities(),
             self.get_unlocked_abilities(),
@@ -89,6 +98,19 @@ class BasePlayer(abc.ABC, BaseCharacter):
         """
         return self.__character_level
 
+    def has_unlocked_ability(self, ability: Ability) -> bool:
+        """
+        Checks if an ability has been unlocked, matching abilities by name
+        since upgraded abilities are copies of the ones in the ability list.
+
+        :param ability: The ability to check.
+        :return: True if the ability is unlocked, False otherwise.
+        """
+        return any(
+            unlocked_ability.get_name() == ability.get_name()
+            for unlocked_ability in self.get_unlocked_abilities()
+        )
+
     def get_unlocked_abilities(self) -> list[Ability]:
         """
         Gets the list of unlocked abilities.
@@ -99,27 +121,53 @@ class BasePlayer(abc.ABC, BaseCharacter):
 
     def set_character_level(self, character_level: int) -> None:
         """
-        Sets the character level and updates the user settings file.
+        Sets the character level and updates the user settings.
 
         :param character_level: New character level.
         """
         self.__character_level = character_level
-        user_data = read_json("settings/user_settings.json")
-        user_data["character_level"][self.get_name()] = character_level
-        write_json("settings/user_settings.json", user_data)
+        self.save_user_setting("character_level", character_level)
 
     def set_unlocked_abilities(self, unlocked_abilities: list[Ability]) -> None:
         """
-        Sets the unlocked abilities and updates the user settings file.
+        Sets the unlocked abilities and updates the user settings.
 
         :param unlocked_abilities: List of new unlocked abilities.
         """
         self.__unlocked_abilities = list(set(unlocked_abilities))
-        user_data = read_json("settings/user_settings.json")
-        user_data["character_abilities"][self.get_name()] = list(
-            set([ability.get_name() for ability in unlocked_abilities])
+        self.save_user_setting(
+            "character_abilities",
+            list(set([ability.get_name() for ability in unlocked_abilities])),
         )
-        write_json("settings/user_settings.json", user_data)
+
+    def save_user_setting(self, section: str, value: Any) -> None:
+        """
+        Stores a value for this character in the in-memory user data if there is one,
+        otherwise in the shared user settings.
+
+        :param section: The user settings section, e.g. "character_level".
+        :param value: The value to store under the character's name.
+        """
+        if self.get_user_data() is not None:
+            self.get_user_data()[section][self.get_name()] = value
+            return
+        get_settings_store().set_entry(section, self.get_name(), value)
+
+    def get_user_data(self) -> dict[str, Any]:
+        """
+        Gets the in-memory user data.
+
+        :return: The in-memory user data, or None if the shared user settings are used.
+        """
+        return self.__user_data
+
+    def set_user_data(self, user_data: dict[str, Any]) -> None:
+        """
+        Sets the in-memory user data.
+
+        :param user_data: The in-memory user data, or None to use the shared user settings.
+        """
+        self.__user_data = user_data
 
     # Methods inherited from BaseCharacter
     def get_name(self) -> str:
@@ -138,11 +186,11 @@ class BasePlayer(abc.ABC, BaseCharacter):
         """
         return super().get_sprite_location()
 
-    def get_stats(self) -> dict[str, int]:
+    def get_stats(self) -> StatBlock:
         """
         Gets the stats of the player character.
 
-        :return: Dictionary of stats.
+        :return: The stats.
         """
         return super().get_stats()
 
@@ -170,11 +218,11 @@ class BasePlayer(abc.ABC, BaseCharacter):
         """
         super().set_sprite_location(sprite_location)
 
-    def set_stats(self, stats: dict[str, int]) -> None:
+    def set_stats(self, stats: StatBlock) -> None:
         """
         Sets the stats for the player character.
 
-        :param stats: Dictionary of stats.
+        :param stats: The stats.
         """
         super().set_stats(stats)
 
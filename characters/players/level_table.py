@@ -0,0 +1,71 @@
+from ability import PLAYER_ABILITY_LIST, Ability
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+from stat_block import StatBlock
+
+
+class LevelUp(NamedTuple):
+    """
+    LevelUp describing what a player character gains when reaching the next level.
+    """
+
+    stat_gains: Tuple[Tuple[str, int], ...] = ()  # Stats increased, as (stat, amount)
+    upgraded_abilities: Tuple[str, ...] = ()  # Abilities upgraded if unlocked
+    granted_abilities: Tuple[str, ...] = ()  # Abilities unlocked by the level
+
+
+class LevelEntry(NamedTuple):
+    """
+    LevelEntry holding a player character's stats and abilities at one level, with
+    every level up before it already applied. The entries are shared, so their stats
+    must be copied before being changed.
+    """
+
+    level: int
+    stats: StatBlock
+    granted_abilities: Tuple[str, ...]  # Abilities unlocked by reaching this level
+    upgraded_abilities: Dict[str, Ability]  # Upgraded copies by ability name
+
+    def resolve_abilities(self, ability_names: Iterable[str]) -> List[Ability]:
+        """
+        Resolves saved ability names into the unlocked abilities at this level.
+
+        :param ability_names: Names of the abilities unlocked by the player.
+        :return: The unlocked abilities, upgraded as of this level, including the
+            abilities granted by the levels reached.
+        """
+        names = list(ability_names)
+        names += [name for name in self.granted_abilities if name not in names]
+        return [
+            self.upgraded_abilities.get(name, PLAYER_ABILITY_LIST[name])
+            for name in names
+        ]
+
+
+def build_level_table(
+    base_stats: Dict[str, int], level_ups: List[LevelUp]
+) -> Dict[int, LevelEntry]:
+    """
+    Builds a player character's stats and abilities at every level from its upgrade path.
+
+    :param base_stats: The stats at level 1.
+    :param level_ups: The gains of each level up, starting with reaching level 2.
+    :return: The level entries by level.
+    """
+    stats = StatBlock(base_stats)
+    granted_abilities: Tuple[str, ...] = ()
+    upgraded_abilities: Dict[str, Ability] = {}
+    level_table = {1: LevelEntry(1, stats.copy(), granted_abilities, {})}
+    for level, level_up in enumerate(level_ups, start=2):
+        for stat_name, amount in level_up.stat_gains:
+            stats.set(stat_name, stats.get(stat_name) + amount)
+        upgraded_abilities = dict(upgraded_abilities)
+        for name in level_up.upgraded_abilities:
+            # Upgrade a copy so the shared ability list is left untouched
+            ability = upgraded_abilities.get(name, PLAYER_ABILITY_LIST[name]).copy()
+            ability.upgrade()
+            upgraded_abilities[name] = ability
+        granted_abilities += level_up.granted_abilities
+        level_table[level] = LevelEntry(
+            level, stats.copy(), granted_abilities, upgraded_abilities
+        )
+    return level_table
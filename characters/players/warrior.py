@@ -1,7 +1,9 @@
 from characters.players.base_player import BasePlayer
+from characters.players.level_table import LevelEntry, LevelUp, build_level_table
 from ability import PLAYER_ABILITY_LIST, Ability
-import copy
-from utilities.json_utility import read_json
+from typing import Any
+from settings_store import get_settings_store
+from stat_block import StatBlock
 
 
 class Warrior(BasePlayer):
@@ -17,7 +19,6 @@ class Warrior(BasePlayer):
         "physical_damage": 75,
     }
     __unlocked_abilities_string: list[str] = []
-    __unlocked_abilities: list[Ability] = []
 
     __abilities: list[Ability] = [
         PLAYER_ABILITY_LIST["Power Slash"],
@@ -25,63 +26,55 @@ class Warrior(BasePlayer):
         PLAYER_ABILITY_LIST["Shield War"],
     ]
 
+    # Everything gained on reaching levels 2, 3 and 4
+    __level_ups: list[LevelUp] = [
+        LevelUp(stat_gains=(("health_points", 100), ("physical_power", 90))),
+        LevelUp(upgraded_abilities=("Power Slash",)),
+        LevelUp(granted_abilities=("War Cry",)),
+    ]
+    __level_table: dict[int, LevelEntry] = build_level_table(__stats, __level_ups)
+
     def __init__(
         self,
         sprite_location: str,
+        user_data: dict[str, Any] = None,
     ) -> None:
-        self.__unlocked_abilities_string = read_json("settings/user_settings.json")[
-            "character_abilities"
-        ]["Warrior"]
-        for unlocked_ability_string in self.__unlocked_abilities_string:
-            self.__unlocked_abilities.append(
-                PLAYER_ABILITY_LIST[unlocked_ability_string]
-            )
-        character_level_user_setting = read_json("settings/user_settings.json")[
-            "character_level"
-        ]["Warrior"]
+        saved_data = user_data if user_data is not None else get_settings_store()
+        level_entry = self.__level_table[saved_data["character_level"]["Warrior"]]
         super().__init__(
             "Warrior",
-            copy.deepcopy(self.__stats),
+            level_entry.stats.copy(),
             sprite_location,
             self.__abilities,
-            self.__unlocked_abilities,
+            level_entry.resolve_abilities(
+                saved_data["character_abilities"]["Warrior"]
+            ),
+            level_entry.level,
+            user_data=user_data,
+        )
+
+    def upgrade(self) -> None:
+        level_entry = self.__level_table.get(self.get_character_level() + 1)
+        if level_entry is None:
+            return
+        self.set_character_level(level_entry.level)
+        self.set_stats(level_entry.stats.copy())
+        self.set_unlocked_abilities(
+            level_entry.resolve_abilities(self.__unlocked_abilities_string)
         )
-        for _ in range(1, character_level_user_setting):
-            self.upgrade()
-
-    def upgrade(self):
-        new_stat: dict[str, int] = self.get_stats()
-        new_unlocked_abilities: list[Ability] = self.get_unlocked_abilities()
-        if self.get_character_level() == 1:
-            self.set_character_level(2)
-            new_stat["health_points"] += 100
-            new_stat["physical_power"] += 90
-        elif self.get_character_level() == 2:
-            self.set_character_level(3)
-            index = next(
-                (
-                    i
-                    for i, ability in enumerate(new_unlocked_abilities)
-                    if ability.get_name() == "Power Slash"
-                ),
-                None,
-            )
-            if index is not None:
-                new_unlocked_abilities[index].upgrade()
-        elif self.get_character_level() == 3:
-            self.set_character_level(4)
-            new_unlocked_abilities.append(PLAYER_ABILITY_LIST["War Cry"])
-        self.set_stats(new_stat)
-        self.set_unlocked_abilities(new_unlocked_abilities)
 
     def unlock_ability(self) -> None:
-        new_unlocked_abilities: list[Ability] = self.get_unlocked_abilities()
-        new_unlocked_abilities.append(PLAYER_ABILITY_LIST["Shield War"])
-        self.set_unlocked_abilities(new_unlocked_abilities)
+        level_entry = self.__level_table[self.get_character_level()]
+        self.set_unlocked_abilities(
+            level_entry.resolve_abilities(
+                self.__unlocked_abilities_string + ["Shield War"]
+            )
+        )
 
     def copy(self) -> "Warrior":
         return Warrior(
             self.get_sprite_location(),
+            self.get_user_data(),
         )
 
     def get_name(self) -> str:
@@ -90,7 +83,7 @@ class Warrior(BasePlayer):
     def get_sprite_location(self) -> str:
         return super().get_sprite_location()
 
-    def get_stats(self) -> dict:
+    def get_stats(self) -> StatBlock:
         return super().get_stats()
 
     def get_character_level(self) -> int:
@@ -108,7 +101,7 @@ class Warrior(BasePlayer):
     def set_sprite_location(self, sprite_location: str) -> None:
         super().set_sprite_location(sprite_location)
 
-    def set_stats(self, stats: dict) -> None:
+    def set_stats(self, stats: StatBlock) -> None:
         super().set_stats(stats)
 
     def set_character_level(self, character_level: int) -> None:
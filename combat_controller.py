@@ -1,9 +1,10 @@
 from characters.base_character import BaseCharacter
 from ability import Ability
-from typing import Tuple, Dict, List
+from stat_block import StatBlock
+from timeline import Timeline
+from typing import Tuple, Dict
 import random
 from utilities.general_utility import min_max_bound
-from pygame_gui.elements import UIImage
 
 # Mapping debuff effects to player statistics
 DEBUFF_STAT_MAPPER = {
@@ -12,28 +13,6 @@ DEBUFF_STAT_MAPPER = {
     "bleed": "health_points",
 }
 
-# List of positive player statistic modifiers
-POSITIVE_PLAYER_STAT_MODIFIERS = [
-    "health_regeneration",
-    "mana_regeneration",
-    "absorption",
-    "physical_damage",
-    "magical_damage",
-    "physical_defense",
-    "magical_defense",
-    "mana_points",
-    "physical_power",
-    "spell_power",
-]
-
-# List of negative player statistic modifiers
-NEGATIVE_PLAYER_STAT_MODIFIERS = [
-    "stun",
-    "physical_defense_reduction",
-    "physical_damage_reduction",
-    "bleed",
-]
-
 
 class CombatController:
     """
@@ -41,29 +20,63 @@ class CombatController:
     including handling abilities, buffs, debuffs, and damage calculations.
     """
 
-    __player_stat: Dict[str, int] = {}
-    __player_stat_cap: Dict[str, int] = {}
+    __player_stat: StatBlock = None
+    __player_stat_cap: StatBlock = None
     __debuff_dict: Dict[str, Tuple[int, int]] = {}
-    __ability_histories: List[Ability] = []
+    __debuff_timeline: Timeline = None
+    __buff_timeline: Timeline = None
     __cooldown_abilities: Dict[str, int] = {}
-    __player_sprite: UIImage = None
+    __cooldown_timeline: Timeline = None
+    __sprite_height: float = 0
     __is_stunned: bool = False
+    __rng: random.Random = None
 
-    def __init__(self, player: BaseCharacter, player_sprite: UIImage) -> None:
+    def __init__(
+        self,
+        player: BaseCharacter,
+        sprite_height: float,
+        rng: random.Random = None,
+    ) -> None:
         """
         Initializes the CombatController class.
 
         :param player: The player character.
-        :param player_sprite: The player sprite.
+        :param sprite_height: The height of the sprite being hit, used to scale the critical rate.
+        :param rng: The fight's random stream, or None for an unseeded one.
         """
-        # Initialize player statistics and sprite
+        # Initialize player statistics; the cap is a snapshot of the starting stats
         self.set_player_stat(player.get_stats())
-        self.set_player_stat_cap(player.get_stats())
-        self.set_player_sprite(player_sprite)
+        self.set_player_stat_cap(player.get_stats().copy())
+        self.set_sprite_height(sprite_height)
         self.set_debuff_dict({})
-        self.set_ability_histories([])
+        self.set_debuff_timeline(Timeline())
+        self.set_buff_timeline(Timeline())
         self.set_cooldown_abilities({})
+        self.set_cooldown_timeline(Timeline())
         self.set_is_stunned(False)
+        self.set_rng(rng if rng is not None else random.Random())
+
+    def clone(self, rng: random.Random = None) -> "CombatController":
+        """
+        Creates an independent copy of the combat state, cheap enough to make many
+        times per turn for look-ahead. Stats, cooldowns, buffs and debuffs are copied;
+        the character itself is not.
+
+        :param rng: The random stream of the copy, or None to share this controller's.
+        :return: A new CombatController in the same state.
+        """
+        controller = CombatController.__new__(CombatController)
+        controller.set_player_stat(self.get_player_stat().copy())
+        controller.set_player_stat_cap(self.get_player_stat_cap())
+        controller.set_sprite_height(self.get_sprite_height())
+        controller.set_debuff_dict(dict(self.get_debuff_dict()))
+        controller.set_debuff_timeline(self.get_debuff_timeline().copy())
+        controller.set_buff_timeline(self.get_buff_timeline().copy())
+        controller.set_cooldown_abilities(dict(self.get_cooldown_abilities()))
+        controller.set_cooldown_timeline(self.get_cooldown_timeline().copy())
+        controller.set_is_stunned(self.get_is_stunned())
+        controller.set_rng(rng if rng is not None else self.get_rng())
+        return controller
 
     def is_ability_on_cooldown(self, ability: Ability) -> bool:
         """
@@ -72,7 +85,21 @@ class CombatController:
         :param ability: The ability to check.
         :return: True if the ability is on cooldown, False otherwise.
         """
-        return ability.get_name() in self.get_cooldown_abilities().keys()
+        return ability.get_name() in self.get_cooldown_abilities()
+
+    def get_cooldown_remaining(self, ability: Ability) -> int:
+        """
+        Gets the number of attacks left before an ability comes off cooldown.
+
+        :param ability: The ability to check.
+        :return: The remaining cooldown, or 0 if the ability is not on cooldown.
+        """
+        if not self.is_ability_on_cooldown(ability):
+            return 0
+        return (
+            self.get_cooldown_abilities()[ability.get_name()]
+            - self.get_cooldown_timeline().get_round()
+        )
 
     def stunned_round(self) -> None:
         """
@@ -84,56 +111,28 @@ class CombatController:
 
     def handle_ability_cooldowns(self) -> None:
         """
-        Handles the cooldowns of abilities, decrementing their cooldown counters and
-        removing them from the cooldown dictionary when the cooldown expires.
+        Advances the cooldown timeline by one attack, taking abilities whose cooldown
+        has run out off the cooldown dictionary.
         """
-        cooldown_abilities_to_remove = []
-
-        # Iterate through cooldown abilities
-        for (
-            cooldown_ability_name,
-            cooldown_count,
-        ) in self.get_cooldown_abilities().items():
-            if cooldown_count > 1:
-                self.get_cooldown_abilities()[cooldown_ability_name] -= 1
-            else:
-                cooldown_abilities_to_remove.append(cooldown_ability_name)
-
-        # Remove abilities that are no longer on cooldown
-        for cooldown_ability_name in cooldown_abilities_to_remove:
-            del self.get_cooldown_abilities()[cooldown_ability_name]
+        for due_round, ability_name in self.get_cooldown_timeline().advance():
+            # Skip entries superseded by a later use of the same ability
+            if self.get_cooldown_abilities().get(ability_name) == due_round:
+                del self.get_cooldown_abilities()[ability_name]
 
     def handle_ability_durations(self) -> None:
         """
-        Handles the durations of abilities, decrementing their duration counters and
-        removing expired abilities from the history.
+        Advances the buff timeline by one turn, reverting the stat modifiers of the
+        abilities whose duration has passed.
         """
-        abilities_to_remove = []
-
-        # Iterate through ability histories
-        for player_ability in self.get_ability_histories():
-            if player_ability.get_duration() > 0:
-                player_ability.set_duration(player_ability.get_duration() - 1)
-            else:
-                # Remove buff effect if duration of the ability has passed
-                for modifier, value in player_ability.get_stats().items():
-                    if (
-                        modifier in POSITIVE_PLAYER_STAT_MODIFIERS
-                        and modifier in self.get_player_stat().keys()
-                    ):
-                        self.get_player_stat()[modifier] -= value
-                        self.get_player_stat()[modifier] = max(
-                            0, self.get_player_stat()[modifier]
-                        )
-                abilities_to_remove.append(player_ability)
-
-        # Remove expired abilities from history
-        for ability_to_remove in abilities_to_remove:
-            self.get_ability_histories().remove(ability_to_remove)
+        stats = self.get_player_stat()
+        for _, modifiers in self.get_buff_timeline().advance():
+            # Remove buff effect if duration of the ability has passed
+            for modifier, value in modifiers:
+                stats.set(modifier, max(0, stats.get(modifier) - value))
 
     def attack(
         self, hit_height: float, ability: Ability = None
-    ) -> Tuple[int, int, Dict[str, Tuple[int, int]]]:
+    ) -> Tuple[int, int, Tuple[Tuple[str, Tuple[float, int]], ...]]:
         """
         Calculates the physical and magical damage dealt in an attack, applying any ability effects.
 
@@ -141,195 +140,158 @@ class CombatController:
         :param ability: The ability used in the attack (optional).
         :return: A tuple containing the physical damage, magical damage, and any debuffs applied.
         """
-        debuff_dict: Dict[str, Tuple[int, int]] = {}
+        stats = self.get_player_stat()
         self.handle_ability_cooldowns()  # Handle ability cooldowns
 
         # Calculate critical rate
-        critical_rate = hit_height / self.get_player_sprite().rect.height * 100
-        if ability is not None:
-            self.get_ability_histories().append(ability.copy())
-            self.get_cooldown_abilities()[ability.get_name()] = ability.get_stats()[
-                "cooldown"
-            ]
+        critical_rate = hit_height / self.get_sprite_height() * 100
+        if ability is None:
+            debuffs: Tuple[Tuple[str, Tuple[float, int]], ...] = ()
+        else:
+            effect = ability.get_effect()
+
+            # An ability comes off cooldown at the start of the attack it is due
+            self.get_cooldown_abilities()[ability.get_name()] = (
+                self.get_cooldown_timeline().schedule(
+                    max(1, effect.cooldown), ability.get_name()
+                )
+            )
 
             # Deduct ability cost from player stats
-            for cost in ability.get_cost():
-                self.get_player_stat()[cost[0]] -= cost[1]
+            for stat_name, value in effect.cost:
+                stats.set(stat_name, stats.get(stat_name) - value)
 
             # Apply ability modifiers to player stats
-            for modifier, value in ability.get_stats().items():
-                if modifier == "critical":
-                    critical_rate += value
-                elif modifier in NEGATIVE_PLAYER_STAT_MODIFIERS:
-                    debuff_dict[modifier] = (value, ability.get_duration())
-                elif modifier in POSITIVE_PLAYER_STAT_MODIFIERS:
-                    if modifier in self.get_player_stat().keys():
-                        self.get_player_stat()[modifier] += value
-                    else:
-                        self.get_player_stat()[modifier] = value
+            critical_rate += effect.critical
+            debuffs = effect.debuffs
+            for modifier, value in effect.buffs:
+                stats.set(modifier, stats.get(modifier) + value)
+
+            # Buffs are reverted once the duration has passed, counted from this turn
+            self.get_buff_timeline().schedule(effect.duration + 1, effect.buffs)
 
         self.handle_ability_durations()  # Handle ability durations
 
         # Calculate physical and magical damage with critical rate
-        critical_dmg_addition = random.randint(0, int(critical_rate))
-        physical_dmg = magical_dmg = 0
-        if (
-            "physical_damage" in self.get_player_stat().keys()
-            and "physical_power" in self.get_player_stat().keys()
-        ):
-            physical_dmg = max(
-                0,
-                int(
-                    self.get_player_stat()["physical_damage"]
-                    * self.get_player_stat()["physical_power"]
-                    / 50
-                    + critical_dmg_addition
-                ),
-            )
-        if (
-            "magical_damage" in self.get_player_stat().keys()
-            and "spell_power" in self.get_player_stat().keys()
-        ):
-            magical_dmg = max(
-                0,
-                int(
-                    self.get_player_stat()["magical_damage"]
-                    * self.get_player_stat()["spell_power"]
-                    / 50
-                    + critical_dmg_addition
-                ),
-            )
-        return (physical_dmg, magical_dmg, debuff_dict)
+        critical_dmg_addition = self.get_rng().randint(0, int(critical_rate))
+        physical_dmg = max(
+            0,
+            int(
+                stats.physical_damage * stats.physical_power / 50
+                + critical_dmg_addition
+            ),
+        )
+        magical_dmg = max(
+            0,
+            int(stats.magical_damage * stats.spell_power / 50 + critical_dmg_addition),
+        )
+        return (physical_dmg, magical_dmg, debuffs)
 
     def face_damage(
         self,
         physical_dmg: int,
         magical_damage: int,
-        debuff_dict: Dict[str, Tuple[int, int]],
+        debuffs: Tuple[Tuple[str, Tuple[float, int]], ...],
     ) -> None:
         """
         Applies damage to the player and handles debuffs.
 
         :param physical_dmg: The physical damage to be applied.
         :param magical_damage: The magical damage to be applied.
-        :param debuff_dict: Dictionary of debuffs to be applied.
+        :param debuffs: The debuffs to be applied, as (name, (value, duration)).
         """
-        # Apply debuffs to the player
-        for debuff_name, (debuff_val, debuff_duration) in debuff_dict.items():
+        stats = self.get_player_stat()
+
+        # Apply debuffs to the player, each lasting until the hit it is due
+        for debuff_name, (debuff_val, debuff_duration) in debuffs:
             if debuff_name == "stun":
                 self.set_is_stunned(True)
             else:
-                self.get_debuff_dict()[debuff_name] = (debuff_val, debuff_duration)
-
-        debuffs_to_remove = []
-
-        # Handle existing debuffs and their durations
-        for debuff_name, (
-            debuff_val,
-            debuff_duration,
-        ) in self.get_debuff_dict().items():
-            if debuff_duration > 1:
-                if (
-                    debuff_name in DEBUFF_STAT_MAPPER.keys()
-                    and DEBUFF_STAT_MAPPER[debuff_name] in self.get_player_stat().keys()
-                ):
-                    self.get_player_stat()[DEBUFF_STAT_MAPPER[debuff_name]] -= int(
-                        debuff_val
-                    )
-                    self.get_player_stat()[DEBUFF_STAT_MAPPER[debuff_name]] = max(
-                        0,
-                        self.get_player_stat()[DEBUFF_STAT_MAPPER[debuff_name]],
-                    )
-                self.get_debuff_dict()[debuff_name] = (
-                    debuff_val,
-                    debuff_duration - 1,
+                due_round = self.get_debuff_timeline().schedule(
+                    max(1, debuff_duration), debuff_name
                 )
-            else:
-                if (
-                    debuff_name
-                    in [
-                        "physical_defense_reduction",
-                        "physical_damage_reduction",
-                    ]
-                    and DEBUFF_STAT_MAPPER[debuff_name] in self.get_player_stat().keys()
-                ):
-                    self.get_player_stat()[DEBUFF_STAT_MAPPER[debuff_name]] += int(
-                        debuff_val
-                    )
-                debuffs_to_remove.append(debuff_name)
-
-        # Remove debuffs from the dictionary after the iteration
-        for debuff_name in debuffs_to_remove:
+                self.get_debuff_dict()[debuff_name] = (debuff_val, due_round)
+
+        # Expire the debuffs due on this hit, restoring reduced stats
+        for due_round, debuff_name in self.get_debuff_timeline().advance():
+            if debuff_name not in self.get_debuff_dict():
+                continue
+            debuff_val, debuff_due_round = self.get_debuff_dict()[debuff_name]
+            if debuff_due_round != due_round:
+                continue  # Superseded by a later application of the same debuff
+            if debuff_name in [
+                "physical_defense_reduction",
+                "physical_damage_reduction",
+            ]:
+                stat_name = DEBUFF_STAT_MAPPER[debuff_name]
+                stats.set(stat_name, stats.get(stat_name) + int(debuff_val))
             del self.get_debuff_dict()[debuff_name]
 
+        # Apply the remaining debuffs, at most one per debuffed stat
+        for debuff_name, (debuff_val, _) in self.get_debuff_dict().items():
+            if debuff_name in DEBUFF_STAT_MAPPER:
+                stat_name = DEBUFF_STAT_MAPPER[debuff_name]
+                stats.set(stat_name, max(0, stats.get(stat_name) - int(debuff_val)))
+
         # Calculate damage with defense modifiers
-        physical_dmg *= 1 - self.get_player_stat()["physical_defense"] / 400
-        magical_damage *= 1 - self.get_player_stat()["magical_defense"] / 400
+        physical_dmg *= 1 - stats.physical_defense / 400
+        magical_damage *= 1 - stats.magical_defense / 400
         physical_dmg = max(0, physical_dmg)
         magical_damage = max(0, magical_damage)
         total_dmg = physical_dmg + magical_damage
 
-        # Apply absorption if available
-        if "absorption" in self.get_player_stat().keys():
-            total_dmg = max(0, total_dmg - self.get_player_stat()["absorption"])
+        # Apply absorption
+        total_dmg = max(0, total_dmg - stats.absorption)
 
         # Reduce health points by total damage
-        self.get_player_stat()["health_points"] = max(
-            0, self.get_player_stat()["health_points"] - int(total_dmg)
-        )
+        stats.health_points = max(0, stats.health_points - int(total_dmg))
 
     def regenerate(self) -> None:
         """
         Regenerates health and mana points for the player based on their regeneration rates.
         """
+        stats = self.get_player_stat()
+        stats_cap = self.get_player_stat_cap()
         # Regenerate health points
-        if "health_regeneration" in self.get_player_stat().keys():
-            self.get_player_stat()["health_points"] = min_max_bound(
-                0,
-                self.get_player_stat_cap()["health_points"],
-                self.get_player_stat()["health_points"]
-                + self.get_player_stat()["health_regeneration"],
-            )
+        stats.health_points = min_max_bound(
+            0, stats_cap.health_points, stats.health_points + stats.health_regeneration
+        )
         # Regenerate mana points
-        if "mana_regeneration" in self.get_player_stat().keys():
-            self.get_player_stat()["mana_points"] = min_max_bound(
-                0,
-                self.get_player_stat_cap()["mana_points"],
-                self.get_player_stat()["mana_points"]
-                + self.get_player_stat()["mana_regeneration"],
-            )
+        stats.mana_points = min_max_bound(
+            0, stats_cap.mana_points, stats.mana_points + stats.mana_regeneration
+        )
 
     # Getters and setters with docstrings
 
-    def get_player_stat(self) -> Dict[str, int]:
+    def get_player_stat(self) -> StatBlock:
         """
         Gets the player's current stats.
 
-        :return: A dictionary of the player's current stats.
+        :return: The player's current stats.
         """
         return self.__player_stat
 
-    def set_player_stat(self, stats: Dict[str, int]) -> None:
+    def set_player_stat(self, stats: StatBlock) -> None:
         """
         Sets the player's current stats.
 
-        :param stats: A dictionary of the player's new stats.
+        :param stats: The player's new stats.
         """
         self.__player_stat = stats
 
-    def get_player_stat_cap(self) -> Dict[str, int]:
+    def get_player_stat_cap(self) -> StatBlock:
         """
         Gets the player's stats cap.
 
-        :return: A dictionary of the player's stats cap.
+        :return: The player's stats cap.
         """
         return self.__player_stat_cap
 
-    def set_player_stat_cap(self, stats_cap: Dict[str, int]) -> None:
+    def set_player_stat_cap(self, stats_cap: StatBlock) -> None:
         """
         Sets the player's stats cap.
 
-        :param stats_cap: A dictionary of the player's new stats cap.
+        :param stats_cap: The player's new stats cap.
         """
         self.__player_stat_cap = stats_cap
 
@@ -337,7 +299,7 @@ class CombatController:
         """
         Gets the player's debuff dictionary.
 
-        :return: A dictionary of the player's debuffs.
+        :return: A dictionary of the player's debuffs, mapping each debuff to its value and due round.
         """
         return self.__debuff_dict
 
@@ -345,31 +307,47 @@ class CombatController:
         """
         Sets the player's debuff dictionary.
 
-        :param debuff_dict: A dictionary of the player's new debuffs.
+        :param debuff_dict: A dictionary of the player's new debuffs, mapping each debuff to its value and due round.
         """
         self.__debuff_dict = debuff_dict
 
-    def get_ability_histories(self) -> List[Ability]:
+    def get_debuff_timeline(self) -> Timeline:
+        """
+        Gets the timeline of debuff expiries, advanced once per hit taken.
+
+        :return: The debuff timeline.
         """
-        Gets the player's ability history.
+        return self.__debuff_timeline
 
-        :return: A list of the player's ability history.
+    def set_debuff_timeline(self, debuff_timeline: Timeline) -> None:
         """
-        return self.__ability_histories
+        Sets the timeline of debuff expiries.
 
-    def set_ability_histories(self, ability_histories: List[Ability]) -> None:
+        :param debuff_timeline: The new debuff timeline.
         """
-        Sets the player's ability history.
+        self.__debuff_timeline = debuff_timeline
 
-        :param ability_histories: A list of the player's new ability history.
+    def get_buff_timeline(self) -> Timeline:
         """
-        self.__ability_histories = ability_histories
+        Gets the timeline of buff reverts, advanced once per turn.
+
+        :return: The buff timeline.
+        """
+        return self.__buff_timeline
+
+    def set_buff_timeline(self, buff_timeline: Timeline) -> None:
+        """
+        Sets the timeline of buff reverts.
+
+        :param buff_timeline: The new buff timeline.
+        """
+        self.__buff_timeline = buff_timeline
 
     def get_cooldown_abilities(self) -> Dict[str, int]:
         """
         Gets the player's cooldown abilities.
 
-        :return: A dictionary of the player's cooldown abilities.
+        :return: A dictionary mapping each ability on cooldown to the attack round it comes off cooldown.
         """
         return self.__cooldown_abilities
 
@@ -381,21 +359,37 @@ class CombatController:
         """
         self.__cooldown_abilities = cooldown_abilities
 
-    def get_player_sprite(self) -> UIImage:
+    def get_cooldown_timeline(self) -> Timeline:
+        """
+        Gets the timeline of cooldown expiries, advanced once per attack.
+
+        :return: The cooldown timeline.
+        """
+        return self.__cooldown_timeline
+
+    def set_cooldown_timeline(self, cooldown_timeline: Timeline) -> None:
+        """
+        Sets the timeline of cooldown expiries.
+
+        :param cooldown_timeline: The new cooldown timeline.
         """
-        Gets the player's sprite.
+        self.__cooldown_timeline = cooldown_timeline
 
-        :return: The player's sprite.
+    def get_sprite_height(self) -> float:
         """
-        return self.__player_sprite
+        Gets the sprite height used to scale the critical rate.
 
-    def set_player_sprite(self, player_sprite: UIImage) -> None:
+        :return: The sprite height.
         """
-        Sets the player's sprite.
+        return self.__sprite_height
 
-        :param player_sprite: The new player's sprite.
+    def set_sprite_height(self, sprite_height: float) -> None:
         """
-        self.__player_sprite = player_sprite
+        Sets the sprite height used to scale the critical rate.
+
+        :param sprite_height: The new sprite height.
+        """
+        self.__sprite_height = sprite_height
 
     def get_is_stunned(self) -> bool:
         """
@@ -412,3 +406,19 @@ class CombatController:
         :param is_stunned: The new stunned status.
         """
         self.__is_stunned = is_stunned
+
+    def get_rng(self) -> random.Random:
+        """
+        Gets the random stream used for critical rolls.
+
+        :return: The random stream.
+        """
+        return self.__rng
+
+    def set_rng(self, rng: random.Random) -> None:
+        """
+        Sets the random stream used for critical rolls.
+
+        :param rng: The new random stream.
+        """
+        self.__rng = rng
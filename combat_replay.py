@@ -0,0 +1,367 @@
+import argparse
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+from ability import Ability
+from characters.base_character import BaseCharacter
+from characters.players.base_player import BasePlayer
+from characters.enemies.base_enemy import BaseEnemy
+from combat_simulator import CombatSimulator, FightResult
+from balance_matrix import PLAYER_CLASSES, ENEMY_CLASSES
+from save_worker import SaveWorker
+from utilities.json_utility import read_json, write_json_atomic
+from user_settings import DEFAULT_USER_DATA
+
+# Where the fight screen saves the record of the last fight
+LAST_FIGHT_PATH = "settings/last_fight.json"
+
+
+def ability_index(character: BaseCharacter, ability: Optional[Ability]) -> int:
+    """
+    Gets the position of an ability in the character's class ability list, which
+    unlike the player's unlocked abilities keeps the same order between runs.
+
+    :param character: The player or enemy character.
+    :param ability: The ability, or None for a normal attack.
+    :return: The ability's index, or -1 for a normal attack.
+    """
+    if ability is None:
+        return -1
+    return next(
+        index
+        for index, class_ability in enumerate(character.get_abilities())
+        if class_ability.get_name() == ability.get_name()
+    )
+
+
+def ability_at_index(player: BasePlayer, index: int) -> Optional[Ability]:
+    """
+    Gets the player's unlocked ability at a position of the class ability list.
+
+    :param player: The player character.
+    :param index: The ability's index, or -1 for a normal attack.
+    :return: The unlocked (possibly upgraded) ability, or None for a normal attack.
+    """
+    if index < 0:
+        return None
+    ability_name = player.get_abilities()[index].get_name()
+    return next(
+        ability
+        for ability in player.get_unlocked_abilities()
+        if ability.get_name() == ability_name
+    )
+
+
+class CombatRecorder:
+    """
+    CombatRecorder class capturing everything needed to replay a fight: the seed of its
+    random stream, the characters involved, the player's input on every turn and the
+    enemy's choice on every turn (it is searched against a clock, so not reproducible).
+    """
+
+    __seed: int = 0
+    __player_name: str = ""
+    __character_level: int = 1
+    __unlocked_abilities: List[str] = []
+    __enemy_name: str = ""
+    __sprite_height: float = 0
+    __inputs: List[Tuple[int, float]] = []
+    __enemy_inputs: Optional[List[int]] = []
+
+    def __init__(
+        self,
+        seed: int,
+        player: BasePlayer,
+        enemy: BaseEnemy,
+        sprite_height: float,
+    ) -> None:
+        """
+        Initializes the CombatRecorder class.
+
+        :param seed: The seed of the fight's random stream.
+        :param player: The player character at the start of the fight.
+        :param enemy: The enemy character.
+        :param sprite_height: The sprite height the player's hit height is measured against.
+        """
+        self.set_seed(seed)
+        self.set_player_name(player.get_name())
+        self.set_character_level(player.get_character_level())
+        self.set_unlocked_abilities(
+            [ability.get_name() for ability in player.get_unlocked_abilities()]
+        )
+        self.set_enemy_name(enemy.get_name())
+        self.set_sprite_height(sprite_height)
+        self.set_inputs([])
+        self.set_enemy_inputs([])
+
+    def record_input(self, ability_index: int, hit_height: float) -> None:
+        """
+        Records the player's input for one turn.
+
+        :param ability_index: The index from ability_index, -1 for a normal attack.
+        :param hit_height: How high up the enemy sprite the player hit.
+        """
+        self.get_inputs().append((ability_index, hit_height))
+
+    def record_enemy_input(self, ability_index: int) -> None:
+        """
+        Records the enemy's choice for one turn.
+
+        :param ability_index: The index from ability_index, -1 for a normal attack.
+        """
+        self.get_enemy_inputs().append(ability_index)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converts the record to a JSON-compatible dictionary.
+
+        :return: The record as a dictionary.
+        """
+        return {
+            "seed": self.get_seed(),
+            "player": self.get_player_name(),
+            "character_level": self.get_character_level(),
+            "unlocked_abilities": self.get_unlocked_abilities(),
+            "enemy": self.get_enemy_name(),
+            "sprite_height": self.get_sprite_height(),
+            "inputs": [list(player_input) for player_input in self.get_inputs()],
+            "enemy_inputs": self.get_enemy_inputs(),
+        }
+
+    @staticmethod
+    def from_dict(record: Dict[str, Any]) -> "CombatRecorder":
+        """
+        Creates a record from a dictionary made by to_dict.
+
+        :param record: The record as a dictionary.
+        :return: The record.
+        """
+        recorder = CombatRecorder.__new__(CombatRecorder)
+        recorder.set_seed(record["seed"])
+        recorder.set_player_name(record["player"])
+        recorder.set_character_level(record["character_level"])
+        recorder.set_unlocked_abilities(record["unlocked_abilities"])
+        recorder.set_enemy_name(record["enemy"])
+        recorder.set_sprite_height(record["sprite_height"])
+        recorder.set_inputs(
+            [(ability_index, hit_height) for ability_index, hit_height in record["inputs"]]
+        )
+        # Records made before the enemy search have no enemy inputs
+        enemy_inputs = record.get("enemy_inputs")
+        recorder.set_enemy_inputs(
+            list(enemy_inputs) if enemy_inputs is not None else None
+        )
+        return recorder
+
+    def save(self, save_worker: SaveWorker, file_path: str = LAST_FIGHT_PATH) -> None:
+        """
+        Saves the record to a JSON file atomically, on the save worker's thread.
+
+        :param save_worker: The worker writing the file, e.g. the settings store's.
+        :param file_path: Path to the file.
+        """
+        # The worker gets its own copy, the record is not read again on this thread
+        snapshot = copy.deepcopy(self.to_dict())
+        fsync_policy = save_worker.get_fsync_policy()
+        save_worker.submit_task(
+            lambda: write_json_atomic(file_path, snapshot, fsync_policy)
+        )
+
+    @staticmethod
+    def load(file_path: str = LAST_FIGHT_PATH) -> "CombatRecorder":
+        """
+        Loads a record from a JSON file.
+
+        :param file_path: Path to the file.
+        :return: The record.
+        """
+        return CombatRecorder.from_dict(read_json(file_path))
+
+    # Getters and setters with docstrings
+
+    def get_seed(self) -> int:
+        """
+        Gets the seed of the fight's random stream.
+
+        :return: The seed.
+        """
+        return self.__seed
+
+    def set_seed(self, seed: int) -> None:
+        """
+        Sets the seed of the fight's random stream.
+
+        :param seed: The seed.
+        """
+        self.__seed = seed
+
+    def get_player_name(self) -> str:
+        """
+        Gets the player class name.
+
+        :return: The player class name.
+        """
+        return self.__player_name
+
+    def set_player_name(self, player_name: str) -> None:
+        """
+        Sets the player class name.
+
+        :param player_name: The player class name.
+        """
+        self.__player_name = player_name
+
+    def get_character_level(self) -> int:
+        """
+        Gets the player's character level.
+
+        :return: The character level.
+        """
+        return self.__character_level
+
+    def set_character_level(self, character_level: int) -> None:
+        """
+        Sets the player's character level.
+
+        :param character_level: The character level.
+        """
+        self.__character_level = character_level
+
+    def get_unlocked_abilities(self) -> List[str]:
+        """
+        Gets the names of the player's unlocked abilities.
+
+        :return: The unlocked ability names.
+        """
+        return self.__unlocked_abilities
+
+    def set_unlocked_abilities(self, unlocked_abilities: List[str]) -> None:
+        """
+        Sets the names of the player's unlocked abilities.
+
+        :param unlocked_abilities: The unlocked ability names.
+        """
+        self.__unlocked_abilities = unlocked_abilities
+
+    def get_enemy_name(self) -> str:
+        """
+        Gets the enemy class name.
+
+        :return: The enemy class name.
+        """
+        return self.__enemy_name
+
+    def set_enemy_name(self, enemy_name: str) -> None:
+        """
+        Sets the enemy class name.
+
+        :param enemy_name: The enemy class name.
+        """
+        self.__enemy_name = enemy_name
+
+    def get_sprite_height(self) -> float:
+        """
+        Gets the sprite height the player's hit height is measured against.
+
+        :return: The sprite height.
+        """
+        return self.__sprite_height
+
+    def set_sprite_height(self, sprite_height: float) -> None:
+        """
+        Sets the sprite height the player's hit height is measured against.
+
+        :param sprite_height: The sprite height.
+        """
+        self.__sprite_height = sprite_height
+
+    def get_inputs(self) -> List[Tuple[int, float]]:
+        """
+        Gets the player's recorded (ability index, hit height) inputs.
+
+        :return: The recorded inputs.
+        """
+        return self.__inputs
+
+    def set_inputs(self, inputs: List[Tuple[int, float]]) -> None:
+        """
+        Sets the player's recorded (ability index, hit height) inputs.
+
+        :param inputs: The recorded inputs.
+        """
+        self.__inputs = inputs
+
+    def get_enemy_inputs(self) -> Optional[List[int]]:
+        """
+        Gets the enemy's recorded ability indices.
+
+        :return: The recorded enemy inputs, or None if the record has none.
+        """
+        return self.__enemy_inputs
+
+    def set_enemy_inputs(self, enemy_inputs: Optional[List[int]]) -> None:
+        """
+        Sets the enemy's recorded ability indices.
+
+        :param enemy_inputs: The recorded enemy inputs, or None if the record has none.
+        """
+        self.__enemy_inputs = enemy_inputs
+
+
+def replay_fight(recorder: CombatRecorder) -> FightResult:
+    """
+    Replays a recorded fight headlessly, reproducing it exactly.
+
+    :param recorder: The record of the fight.
+    :return: The result of the fight.
+    :raises ValueError: If the record has no enemy inputs, as the enemy's searched
+        choices cannot be reproduced without them.
+    """
+    if recorder.get_enemy_inputs() is None:
+        raise ValueError(
+            "The record has no enemy inputs: it predates recording the enemy's "
+            "choices and cannot be replayed"
+        )
+    user_data = copy.deepcopy(DEFAULT_USER_DATA)
+    user_data["character_level"][recorder.get_player_name()] = (
+        recorder.get_character_level()
+    )
+    user_data["character_abilities"][recorder.get_player_name()] = list(
+        recorder.get_unlocked_abilities()
+    )
+    player = PLAYER_CLASSES[recorder.get_player_name()]("", user_data)
+    enemy = ENEMY_CLASSES[recorder.get_enemy_name()]("")
+
+    enemy_inputs = iter(
+        [
+            None if ability_index < 0 else enemy.get_abilities()[ability_index]
+            for ability_index in recorder.get_enemy_inputs()
+        ]
+    )
+    simulator = CombatSimulator(
+        player,
+        enemy,
+        sprite_height=recorder.get_sprite_height(),
+        enemy_policy=lambda abilities, controller: next(enemy_inputs, None),
+    )
+    player_inputs = iter(
+        [
+            (ability_at_index(player, ability_index), hit_height)
+            for ability_index, hit_height in recorder.get_inputs()
+        ]
+    )
+    return simulator.run_fight(recorder.get_seed(), player_inputs)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a recorded fight headlessly.")
+    parser.add_argument(
+        "record", nargs="?", default=LAST_FIGHT_PATH, help="recorded fight .json file"
+    )
+    args = parser.parse_args()
+
+    result = replay_fight(CombatRecorder.load(args.record))
+    print(
+        f"winner: {result.get_winner()}, rounds: {result.get_rounds()}, "
+        f"player damage: {result.get_player_damage()}, "
+        f"enemy damage: {result.get_enemy_damage()}"
+    )
@@ -0,0 +1,464 @@
+from characters.base_character import BaseCharacter
+from characters.players.base_player import BasePlayer
+from combat_controller import CombatController
+from ability import Ability
+from typing import Callable, Iterator, List, Optional, Tuple
+import random
+
+
+def random_policy(
+    abilities: List[Ability], controller: CombatController
+) -> Optional[Ability]:
+    """
+    Picks a random action out of the normal attack and every ability off cooldown,
+    drawing from the controller's random stream. Used for both the player and the enemy.
+
+    :param abilities: The character's abilities.
+    :param controller: The character's combat controller.
+    :return: The chosen ability, or None for a normal attack.
+    """
+    choices: List[Optional[Ability]] = [None]
+    for ability in abilities:
+        if not controller.is_ability_on_cooldown(ability):
+            choices.append(ability)
+    return controller.get_rng().choice(choices)
+
+
+def auto_player_policy(
+    abilities: List[Ability], controller: CombatController
+) -> Optional[Ability]:
+    """
+    Picks the first ability that is off cooldown and affordable with the player's
+    current stats, falling back to a normal attack. Used by the fight screen's auto battle.
+
+    :param abilities: The player's unlocked abilities.
+    :param controller: The player's combat controller.
+    :return: The chosen ability, or None for a normal attack.
+    """
+    stats = controller.get_player_stat()
+    for ability in abilities:
+        if not controller.is_ability_on_cooldown(ability) and all(
+            stats.get(stat_name) >= value for stat_name, value in ability.get_cost()
+        ):
+            return ability
+    return None
+
+
+class FightResult:
+    """
+    FightResult class holding the outcome of one simulated fight.
+    """
+
+    __winner: str = ""
+    __rounds: int = 0
+    __player_damage: int = 0
+    __enemy_damage: int = 0
+    __seed: int = 0
+
+    def __init__(
+        self,
+        winner: str,
+        rounds: int,
+        player_damage: int,
+        enemy_damage: int,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initializes the FightResult class.
+
+        :param winner: "player", "enemy" or "draw" if the round limit was reached.
+        :param rounds: The number of rounds played.
+        :param player_damage: Total damage dealt by the player.
+        :param enemy_damage: Total damage dealt by the enemy.
+        :param seed: The seed of the fight's random stream.
+        """
+        self.set_winner(winner)
+        self.set_rounds(rounds)
+        self.set_player_damage(player_damage)
+        self.set_enemy_damage(enemy_damage)
+        self.set_seed(seed)
+
+    # Getters and setters with docstrings
+
+    def get_winner(self) -> str:
+        """
+        Gets the winner of the fight.
+
+        :return: "player", "enemy" or "draw".
+        """
+        return self.__winner
+
+    def set_winner(self, winner: str) -> None:
+        """
+        Sets the winner of the fight.
+
+        :param winner: "player", "enemy" or "draw".
+        """
+        self.__winner = winner
+
+    def get_rounds(self) -> int:
+        """
+        Gets the number of rounds played.
+
+        :return: The number of rounds.
+        """
+        return self.__rounds
+
+    def set_rounds(self, rounds: int) -> None:
+        """
+        Sets the number of rounds played.
+
+        :param rounds: The number of rounds.
+        """
+        self.__rounds = rounds
+
+    def get_player_damage(self) -> int:
+        """
+        Gets the total damage dealt by the player.
+
+        :return: The player's total damage.
+        """
+        return self.__player_damage
+
+    def set_player_damage(self, player_damage: int) -> None:
+        """
+        Sets the total damage dealt by the player.
+
+        :param player_damage: The player's total damage.
+        """
+        self.__player_damage = player_damage
+
+    def get_enemy_damage(self) -> int:
+        """
+        Gets the total damage dealt by the enemy.
+
+        :return: The enemy's total damage.
+        """
+        return self.__enemy_damage
+
+    def set_enemy_damage(self, enemy_damage: int) -> None:
+        """
+        Sets the total damage dealt by the enemy.
+
+        :param enemy_damage: The enemy's total damage.
+        """
+        self.__enemy_damage = enemy_damage
+
+    def get_seed(self) -> int:
+        """
+        Gets the seed of the fight's random stream.
+
+        :return: The seed.
+        """
+        return self.__seed
+
+    def set_seed(self, seed: int) -> None:
+        """
+        Sets the seed of the fight's random stream.
+
+        :param seed: The seed.
+        """
+        self.__seed = seed
+
+
+class CombatSimulator:
+    """
+    CombatSimulator class to resolve whole fights between a player and an enemy
+    without pygame, using the same CombatController rules as the fight screen.
+    """
+
+    __player: BaseCharacter = None
+    __enemy: BaseCharacter = None
+    __hit_height: float = 100
+    __sprite_height: float = 200
+    __max_rounds: int = 500
+    __player_policy: Callable[
+        [List[Ability], CombatController], Optional[Ability]
+    ] = None
+    __enemy_policy: Callable[
+        [List[Ability], CombatController], Optional[Ability]
+    ] = None
+    __rng: random.Random = None
+
+    def __init__(
+        self,
+        player: BaseCharacter,
+        enemy: BaseCharacter,
+        hit_height: float = 100,
+        sprite_height: float = 200,
+        max_rounds: int = 500,
+        player_policy: Callable[
+            [List[Ability], CombatController], Optional[Ability]
+        ] = random_policy,
+        seed: int = None,
+        enemy_policy: Callable[
+            [List[Ability], CombatController], Optional[Ability]
+        ] = random_policy,
+    ) -> None:
+        """
+        Initializes the CombatSimulator class.
+
+        :param player: The player character, left untouched by the simulation.
+        :param enemy: The enemy character, left untouched by the simulation.
+        :param hit_height: How high up the enemy sprite the player hits, in pixels.
+        :param sprite_height: The sprite height the hit height is measured against.
+        :param max_rounds: Round limit after which the fight is a draw.
+        :param player_policy: Picks the player's action each turn.
+        :param seed: Seed for the per-fight seeds, or None for a random one.
+        :param enemy_policy: Picks the enemy's action each turn.
+        """
+        self.set_player(player)
+        self.set_enemy(enemy)
+        self.set_hit_height(hit_height)
+        self.set_sprite_height(sprite_height)
+        self.set_max_rounds(max_rounds)
+        self.set_player_policy(player_policy)
+        self.set_enemy_policy(enemy_policy)
+        self.set_rng(random.Random(seed))
+
+    def run_fights(self, fight_count: int) -> List[FightResult]:
+        """
+        Runs a number of independent fights.
+
+        :param fight_count: The number of fights to run.
+        :return: The result of every fight.
+        """
+        return [self.run_fight() for _ in range(fight_count)]
+
+    def run_fight(
+        self,
+        seed: int = None,
+        player_inputs: Iterator[Tuple[Optional[Ability], float]] = None,
+    ) -> FightResult:
+        """
+        Runs one fight to completion, alternating player and enemy turns like the fight screen.
+
+        :param seed: Seed of the fight's random stream, or None to draw one.
+        :param player_inputs: Recorded (ability, hit height) inputs for the player's turns,
+            used instead of the player policy. The fight stops when they run out.
+        :return: The result of the fight.
+        """
+        if seed is None:
+            seed = self.get_rng().getrandbits(32)
+        rng = random.Random(seed)
+        player = self.create_combatant(self.get_player())
+        enemy = self.create_combatant(self.get_enemy())
+        player_controller = CombatController(player, self.get_sprite_height(), rng)
+        enemy_controller = CombatController(enemy, self.get_sprite_height(), rng)
+        player_stats = player.get_stats()
+        enemy_stats = enemy.get_stats()
+
+        round_counter = 0
+        player_damage = enemy_damage = 0
+        while (
+            enemy_stats.health_points > 0
+            and player_stats.health_points > 0
+            and round_counter < self.get_max_rounds()
+        ):
+            if round_counter % 2 == 0:
+                # Player's turn
+                if player_controller.get_is_stunned():
+                    player_controller.stunned_round()
+                else:
+                    if player_inputs is None:
+                        ability = self.get_player_policy()(
+                            player.get_abilities(), player_controller
+                        )
+                        hit_height = self.get_hit_height()
+                    else:
+                        player_input = next(player_inputs, None)
+                        if player_input is None:
+                            break  # The recorded fight ended here
+                        ability, hit_height = player_input
+                    player_controller.regenerate()
+                    enemy_controller.regenerate()
+                    physical_damage, magical_damage, debuffs = (
+                        player_controller.attack(hit_height, ability)
+                    )
+                    enemy_controller.face_damage(
+                        physical_damage, magical_damage, debuffs
+                    )
+                    player_damage += physical_damage + magical_damage
+            else:
+                # Enemy's turn
+                if enemy_controller.get_is_stunned():
+                    enemy_controller.stunned_round()
+                else:
+                    ability = self.get_enemy_policy()(
+                        enemy.get_abilities(), enemy_controller
+                    )
+                    player_controller.regenerate()
+                    enemy_controller.regenerate()
+                    physical_damage, magical_damage, debuffs = (
+                        enemy_controller.attack(0, ability)
+                    )
+                    player_controller.face_damage(
+                        physical_damage, magical_damage, debuffs
+                    )
+                    enemy_damage += physical_damage + magical_damage
+            round_counter += 1
+
+        if enemy_stats.health_points <= 0:
+            winner = "player"
+        elif player_stats.health_points <= 0:
+            winner = "enemy"
+        else:
+            winner = "draw"
+        return FightResult(winner, round_counter, player_damage, enemy_damage, seed)
+
+    def create_combatant(self, character: BaseCharacter) -> BaseCharacter:
+        """
+        Creates a throwaway copy of a character for one fight, so the original stats are not mutated.
+
+        :param character: The character to copy.
+        :return: A new character with its own stats and the abilities usable in combat.
+        """
+        stats = character.get_stats().copy()
+        abilities = (
+            character.get_unlocked_abilities()
+            if isinstance(character, BasePlayer)
+            else character.get_abilities()
+        )
+        return BaseCharacter(
+            character.get_name(), stats, character.get_sprite_location(), abilities
+        )
+
+    # Getters and setters with docstrings
+
+    def get_player(self) -> BaseCharacter:
+        """
+        Gets the player character.
+
+        :return: The player character.
+        """
+        return self.__player
+
+    def set_player(self, player: BaseCharacter) -> None:
+        """
+        Sets the player character.
+
+        :param player: The new player character.
+        """
+        self.__player = player
+
+    def get_enemy(self) -> BaseCharacter:
+        """
+        Gets the enemy character.
+
+        :return: The enemy character.
+        """
+        return self.__enemy
+
+    def set_enemy(self, enemy: BaseCharacter) -> None:
+        """
+        Sets the enemy character.
+
+        :param enemy: The new enemy character.
+        """
+        self.__enemy = enemy
+
+    def get_hit_height(self) -> float:
+        """
+        Gets the height at which the player hits the enemy.
+
+        :return: The hit height.
+        """
+        return self.__hit_height
+
+    def set_hit_height(self, hit_height: float) -> None:
+        """
+        Sets the height at which the player hits the enemy.
+
+        :param hit_height: The new hit height.
+        """
+        self.__hit_height = hit_height
+
+    def get_sprite_height(self) -> float:
+        """
+        Gets the sprite height the hit height is measured against.
+
+        :return: The sprite height.
+        """
+        return self.__sprite_height
+
+    def set_sprite_height(self, sprite_height: float) -> None:
+        """
+        Sets the sprite height the hit height is measured against.
+
+        :param sprite_height: The new sprite height.
+        """
+        self.__sprite_height = sprite_height
+
+    def get_max_rounds(self) -> int:
+        """
+        Gets the round limit after which a fight is a draw.
+
+        :return: The round limit.
+        """
+        return self.__max_rounds
+
+    def set_max_rounds(self, max_rounds: int) -> None:
+        """
+        Sets the round limit after which a fight is a draw.
+
+        :param max_rounds: The new round limit.
+        """
+        self.__max_rounds = max_rounds
+
+    def get_player_policy(
+        self,
+    ) -> Callable[[List[Ability], CombatController], Optional[Ability]]:
+        """
+        Gets the policy that picks the player's action each turn.
+
+        :return: The player policy.
+        """
+        return self.__player_policy
+
+    def set_player_policy(
+        self,
+        player_policy: Callable[[List[Ability], CombatController], Optional[Ability]],
+    ) -> None:
+        """
+        Sets the policy that picks the player's action each turn.
+
+        :param player_policy: The new player policy.
+        """
+        self.__player_policy = player_policy
+
+    def get_enemy_policy(
+        self,
+    ) -> Callable[[List[Ability], CombatController], Optional[Ability]]:
+        """
+        Gets the policy that picks the enemy's action each turn.
+
+        :return: The enemy policy.
+        """
+        return self.__enemy_policy
+
+    def set_enemy_policy(
+        self,
+        enemy_policy: Callable[[List[Ability], CombatController], Optional[Ability]],
+    ) -> None:
+        """
+        Sets the policy that picks the enemy's action each turn.
+
+        :param enemy_policy: The new enemy policy.
+        """
+        self.__enemy_policy = enemy_policy
+
+    def get_rng(self) -> random.Random:
+        """
+        Gets the random stream the per-fight seeds are drawn from.
+
+        :return: The random stream.
+        """
+        return self.__rng
+
+    def set_rng(self, rng: random.Random) -> None:
+        """
+        Sets the random stream the per-fight seeds are drawn from.
+
+        :param rng: The new random stream.
+        """
+        self.__rng = rng
@@ -0,0 +1,280 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from ability import Ability
+from combat_controller import CombatController
+from combat_simulator import random_policy
+from typing import List, Optional
+import math
+import random
+import time
+
+
+class EnemySearch:
+    """
+    EnemySearch class picking the enemy's action with Monte Carlo search. Every
+    candidate action (normal attack or ability off cooldown) is played out on cheap
+    clones of both combat controllers, followed by a few turns of random play, and
+    scored by who is ahead at the end. Rollouts are spread over the candidates with
+    UCB1 until the time budget runs out, and the most explored candidate is picked.
+
+    Searches can run on a worker thread through submit, so the frame loop keeps
+    running while the enemy thinks. The search never draws from the fight's own
+    random stream, so it does not change the outcome of the attacks it picks.
+    """
+
+    __budget: float = 50
+    __rollout_turns: int = 8
+    __exploration: float = math.sqrt(2)
+    __rng: random.Random = None
+    __executor: ThreadPoolExecutor = None
+
+    def __init__(
+        self,
+        budget: float = 50,
+        rollout_turns: int = 8,
+        exploration: float = math.sqrt(2),
+        seed: int = None,
+    ) -> None:
+        """
+        Initializes the EnemySearch class.
+
+        :param budget: Thinking time per decision, in milliseconds.
+        :param rollout_turns: Number of turns played out after the candidate action.
+        :param exploration: UCB1 exploration constant.
+        :param seed: Seed for the rollouts, or None for a random one.
+        """
+        self.set_budget(budget)
+        self.set_rollout_turns(rollout_turns)
+        self.set_exploration(exploration)
+        self.set_rng(random.Random(seed))
+        self.set_executor(ThreadPoolExecutor(max_workers=1))
+
+    def submit(
+        self,
+        enemy_abilities: List[Ability],
+        enemy_controller: CombatController,
+        player_abilities: List[Ability],
+        player_controller: CombatController,
+    ) -> Future:
+        """
+        Starts a decision on the worker thread. The controllers are cloned first,
+        so the fight can carry on while the search runs.
+
+        :param enemy_abilities: The enemy's abilities.
+        :param enemy_controller: The enemy's combat controller.
+        :param player_abilities: The player's unlocked abilities.
+        :param player_controller: The player's combat controller.
+        :return: A future resolving to the chosen ability, or None for a normal attack.
+        """
+        return self.get_executor().submit(
+            self.choose,
+            list(enemy_abilities),
+            enemy_controller.clone(),
+            list(player_abilities),
+            player_controller.clone(),
+        )
+
+    def choose(
+        self,
+        enemy_abilities: List[Ability],
+        enemy_controller: CombatController,
+        player_abilities: List[Ability],
+        player_controller: CombatController,
+        budget: float = None,
+    ) -> Optional[Ability]:
+        """
+        Searches for the enemy's best action within the time budget.
+
+        :param enemy_abilities: The enemy's abilities.
+        :param enemy_controller: The enemy's combat controller, left untouched.
+        :param player_abilities: The player's unlocked abilities.
+        :param player_controller: The player's combat controller, left untouched.
+        :param budget: Thinking time in milliseconds, or None for the search's budget.
+            With 0, every candidate is tried once.
+        :return: The chosen ability, or None for a normal attack.
+        """
+        candidates: List[Optional[Ability]] = [None]
+        for ability in enemy_abilities:
+            if not enemy_controller.is_ability_on_cooldown(ability):
+                candidates.append(ability)
+        if len(candidates) == 1:
+            return None
+
+        if budget is None:
+            budget = self.get_budget()
+        deadline = time.perf_counter() + budget / 1000
+        visits = [0] * len(candidates)
+        scores = [0.0] * len(candidates)
+        iteration = 0
+        # Every candidate is tried at least once, even past the deadline
+        while iteration < len(candidates) or time.perf_counter() < deadline:
+            if iteration < len(candidates):
+                index = iteration
+            else:
+                index = max(
+                    range(len(candidates)),
+                    key=lambda i: scores[i] / visits[i]
+                    + self.get_exploration()
+                    * math.sqrt(math.log(iteration) / visits[i]),
+                )
+            visits[index] += 1
+            scores[index] += self.rollout(
+                candidates[index],
+                enemy_abilities,
+                enemy_controller,
+                player_abilities,
+                player_controller,
+            )
+            iteration += 1
+        return candidates[max(range(len(candidates)), key=lambda i: visits[i])]
+
+    def rollout(
+        self,
+        ability: Optional[Ability],
+        enemy_abilities: List[Ability],
+        enemy_controller: CombatController,
+        player_abilities: List[Ability],
+        player_controller: CombatController,
+    ) -> float:
+        """
+        Plays the enemy's candidate action and a few random turns on clones of the controllers.
+
+        :param ability: The candidate ability, or None for a normal attack.
+        :param enemy_abilities: The enemy's abilities.
+        :param enemy_controller: The enemy's combat controller, left untouched.
+        :param player_abilities: The player's unlocked abilities.
+        :param player_controller: The player's combat controller, left untouched.
+        :return: The score of the outcome for the enemy, between 0 and 1.
+        """
+        enemy = enemy_controller.clone(self.get_rng())
+        player = player_controller.clone(self.get_rng())
+
+        player.regenerate()
+        enemy.regenerate()
+        player.face_damage(*enemy.attack(0, ability))
+
+        for turn in range(self.get_rollout_turns()):
+            if (
+                enemy.get_player_stat().health_points <= 0
+                or player.get_player_stat().health_points <= 0
+            ):
+                break
+            # The player moves first after the candidate action
+            attacker, defender = (player, enemy) if turn % 2 == 0 else (enemy, player)
+            if attacker.get_is_stunned():
+                attacker.stunned_round()
+                continue
+            if attacker is player:
+                action = random_policy(player_abilities, player)
+                hit_height = player.get_sprite_height() * self.get_rng().random()
+            else:
+                action = random_policy(enemy_abilities, enemy)
+                hit_height = 0
+            player.regenerate()
+            enemy.regenerate()
+            defender.face_damage(*attacker.attack(hit_height, action))
+
+        return self.evaluate(enemy, player)
+
+    @staticmethod
+    def evaluate(enemy: CombatController, player: CombatController) -> float:
+        """
+        Scores a combat state for the enemy.
+
+        :param enemy: The enemy's combat controller.
+        :param player: The player's combat controller.
+        :return: 1 if the player is dead, 0 if the enemy is dead, otherwise between
+            0 and 1 by the difference in remaining health.
+        """
+        if player.get_player_stat().health_points <= 0:
+            return 1.0
+        if enemy.get_player_stat().health_points <= 0:
+            return 0.0
+        enemy_health = enemy.get_player_stat().health_points / max(
+            1, enemy.get_player_stat_cap().health_points
+        )
+        player_health = player.get_player_stat().health_points / max(
+            1, player.get_player_stat_cap().health_points
+        )
+        return 0.5 + 0.5 * (enemy_health - player_health)
+
+    # Getters and setters with docstrings
+
+    def get_budget(self) -> float:
+        """
+        Gets the thinking time per decision.
+
+        :return: The budget in milliseconds.
+        """
+        return self.__budget
+
+    def set_budget(self, budget: float) -> None:
+        """
+        Sets the thinking time per decision.
+
+        :param budget: The new budget in milliseconds.
+        """
+        self.__budget = budget
+
+    def get_rollout_turns(self) -> int:
+        """
+        Gets the number of turns played out after the candidate action.
+
+        :return: The number of rollout turns.
+        """
+        return self.__rollout_turns
+
+    def set_rollout_turns(self, rollout_turns: int) -> None:
+        """
+        Sets the number of turns played out after the candidate action.
+
+        :param rollout_turns: The new number of rollout turns.
+        """
+        self.__rollout_turns = rollout_turns
+
+    def get_exploration(self) -> float:
+        """
+        Gets the UCB1 exploration constant.
+
+        :return: The exploration constant.
+        """
+        return self.__exploration
+
+    def set_exploration(self, exploration: float) -> None:
+        """
+        Sets the UCB1 exploration constant.
+
+        :param exploration: The new exploration constant.
+        """
+        self.__exploration = exploration
+
+    def get_rng(self) -> random.Random:
+        """
+        Gets the random stream of the rollouts.
+
+        :return: The random stream.
+        """
+        return self.__rng
+
+    def set_rng(self, rng: random.Random) -> None:
+        """
+        Sets the random stream of the rollouts.
+
+        :param rng: The new random stream.
+        """
+        self.__rng = rng
+
+    def get_executor(self) -> ThreadPoolExecutor:
+        """
+        Gets the worker the searches run on.
+
+        :return: The single-thread executor.
+        """
+        return self.__executor
+
+    def set_executor(self, executor: ThreadPoolExecutor) -> None:
+        """
+        Sets the worker the searches run on.
+
+        :param executor: The new executor.
+        """
+        self.__executor = executor
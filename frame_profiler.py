@@ -0,0 +1,350 @@
+import csv
+import time
+from array import array
+from typing import Dict, List, Tuple
+import pygame
+from utilities.general_utility import percentile
+
+# Phases of a frame timed by the state manager, in the order they run
+FRAME_PHASES: Tuple[str, ...] = ("handle_events", "run", "render", "transition")
+
+# Samples kept per state and phase, about ten seconds of frames at 60 FPS
+RING_CAPACITY = 600
+
+# Percentiles shown on the overlay and written to the CSV file
+REPORTED_PERCENTILES: Tuple[int, ...] = (50, 95, 99)
+
+# Time between two redraws of the overlay's text, in nanoseconds
+OVERLAY_REFRESH_NS = 500_000_000
+
+
+class SampleRing:
+    """
+    SampleRing class holding the latest durations of one phase, in nanoseconds. It
+    never grows: once full, each new sample overwrites the oldest one.
+    """
+
+    __samples: array = None
+    __next_index: int = 0
+    __count: int = 0
+
+    def __init__(self, capacity: int = RING_CAPACITY) -> None:
+        """
+        Initializes the SampleRing class.
+
+        :param capacity: The number of samples kept.
+        """
+        self.set_samples(array("q", bytes(8 * capacity)))
+        self.set_next_index(0)
+        self.set_count(0)
+
+    def add(self, duration_ns: int) -> None:
+        """
+        Adds a sample, overwriting the oldest one if the ring is full.
+
+        :param duration_ns: The duration, in nanoseconds.
+        """
+        samples = self.get_samples()
+        samples[self.get_next_index()] = duration_ns
+        self.set_next_index((self.get_next_index() + 1) % len(samples))
+        self.set_count(min(self.get_count() + 1, len(samples)))
+
+    def get_sorted(self) -> List[int]:
+        """
+        Gets the samples kept, in ascending order.
+
+        :return: The durations, in nanoseconds.
+        """
+        return sorted(self.get_samples()[: self.get_count()])
+
+    # Getters and setters with docstrings
+
+    def get_samples(self) -> array:
+        """
+        Gets the sample storage, only the first count entries of which are set
+        until the ring is full.
+
+        :return: The durations, in nanoseconds.
+        """
+        return self.__samples
+
+    def set_samples(self, samples: array) -> None:
+        """
+        Sets the sample storage.
+
+        :param samples: The new storage, its length being the ring's capacity.
+        """
+        self.__samples = samples
+
+    def get_next_index(self) -> int:
+        """
+        Gets the index the next sample is written to.
+
+        :return: The next index.
+        """
+        return self.__next_index
+
+    def set_next_index(self, next_index: int) -> None:
+        """
+        Sets the index the next sample is written to.
+
+        :param next_index: The new next index.
+        """
+        self.__next_index = next_index
+
+    def get_count(self) -> int:
+        """
+        Gets the number of samples kept.
+
+        :return: The sample count.
+        """
+        return self.__count
+
+    def set_count(self, count: int) -> None:
+        """
+        Sets the number of samples kept.
+
+        :param count: The new sample count.
+        """
+        self.__count = count
+
+
+class FrameProfiler:
+    """
+    FrameProfiler class collecting how long each phase of a frame takes in each state,
+    to tell whether a hitch comes from event handling, state logic, rendering or a
+    transition. The state manager records one sample per phase every frame, and a
+    transition's sample is recorded against the state it enters, since starting that
+    state is most of its cost.
+
+    The overlay, when shown, lists the p50/p95/p99 durations of the active state's
+    phases in the top left corner of the screen.
+    """
+
+    __rings: Dict[Tuple[str, str], SampleRing] = None
+    __show_overlay: bool = False
+    __overlay: pygame.Surface = None
+    __overlay_refreshed_ns: int = 0
+    __font: pygame.font.Font = None
+    __csv_path: str = None
+
+    def __init__(self, show_overlay: bool = False, csv_path: str = None) -> None:
+        """
+        Initializes the FrameProfiler class.
+
+        :param show_overlay: Draw the percentiles over the game.
+        :param csv_path: Path to the CSV file written on close, or None.
+        """
+        self.set_rings({})
+        self.set_show_overlay(show_overlay)
+        self.set_csv_path(csv_path)
+
+    def record(self, state_name: str, phase: str, duration_ns: int) -> None:
+        """
+        Records how long a phase took.
+
+        :param state_name: The name of the state the phase ran in.
+        :param phase: One of FRAME_PHASES.
+        :param duration_ns: The duration, in nanoseconds.
+        """
+        ring = self.get_rings().get((state_name, phase))
+        if ring is None:
+            ring = self.get_rings()[(state_name, phase)] = SampleRing()
+        ring.add(duration_ns)
+
+    def get_percentiles(self, state_name: str, phase: str) -> List[float]:
+        """
+        Computes the reported percentiles of a phase.
+
+        :param state_name: The name of the state.
+        :param phase: One of FRAME_PHASES.
+        :return: The durations at REPORTED_PERCENTILES, in milliseconds.
+        """
+        ring = self.get_rings().get((state_name, phase))
+        samples = ring.get_sorted() if ring is not None else []
+        return [percentile(samples, percent) / 1e6 for percent in REPORTED_PERCENTILES]
+
+    def draw_overlay(self, screen: pygame.Surface, state_name: str) -> None:
+        """
+        Draws the overlay over the frame just rendered and shows it, if enabled. The
+        text is only redrawn every OVERLAY_REFRESH_NS so the overlay does not skew
+        the render times it reports.
+
+        :param screen: The screen surface.
+        :param state_name: The name of the active state.
+        """
+        if not self.get_show_overlay():
+            return
+        now_ns = time.perf_counter_ns()
+        if (
+            self.get_overlay() is None
+            or now_ns - self.get_overlay_refreshed_ns() >= OVERLAY_REFRESH_NS
+        ):
+            self.set_overlay(self.create_overlay(state_name))
+            self.set_overlay_refreshed_ns(now_ns)
+        # The state has already shown its frame, so only the overlay area is updated
+        pygame.display.update(screen.blit(self.get_overlay(), (0, 0)))
+
+    def create_overlay(self, state_name: str) -> pygame.Surface:
+        """
+        Renders the overlay's text for a state.
+
+        :param state_name: The name of the state.
+        :return: The overlay surface.
+        """
+        if self.get_font() is None:
+            self.set_font(pygame.font.SysFont("monospace", 14))
+        header = "ms".ljust(14) + "".join(
+            f"p{percent}".rjust(8) for percent in REPORTED_PERCENTILES
+        )
+        lines = [state_name, header] + [
+            phase.ljust(14)
+            + "".join(
+                f"{value:8.2f}" for value in self.get_percentiles(state_name, phase)
+            )
+            for phase in FRAME_PHASES
+        ]
+        rendered = [
+            self.get_font().render(line, True, (255, 255, 255)) for line in lines
+        ]
+        overlay = pygame.Surface(
+            (
+                max(line.get_width() for line in rendered) + 8,
+                sum(line.get_height() for line in rendered) + 8,
+            )
+        )
+        overlay.set_alpha(200)
+        y = 4
+        for line in rendered:
+            overlay.blit(line, (4, y))
+            y += line.get_height()
+        return overlay
+
+    def write_csv(self, file_path: str) -> None:
+        """
+        Writes the percentiles of every state and phase recorded to a CSV file.
+
+        :param file_path: Path to the output file.
+        """
+        with open(file_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(
+                ["state", "phase", "samples"]
+                + [f"p{percent}_ms" for percent in REPORTED_PERCENTILES]
+                + ["max_ms"]
+            )
+            for (state_name, phase), ring in sorted(self.get_rings().items()):
+                samples = ring.get_sorted()
+                writer.writerow(
+                    [state_name, phase, len(samples)]
+                    + [
+                        f"{value:.3f}"
+                        for value in self.get_percentiles(state_name, phase)
+                    ]
+                    + [f"{samples[-1] / 1e6:.3f}"]
+                )
+
+    def close(self) -> None:
+        """
+        Writes the CSV file, if one was asked for, once the game is over.
+        """
+        if self.get_csv_path() is not None and self.get_rings():
+            self.write_csv(self.get_csv_path())
+
+    # Getters and setters with docstrings
+
+    def get_rings(self) -> Dict[Tuple[str, str], SampleRing]:
+        """
+        Gets the samples recorded.
+
+        :return: The sample rings by state name and phase.
+        """
+        return self.__rings
+
+    def set_rings(self, rings: Dict[Tuple[str, str], SampleRing]) -> None:
+        """
+        Sets the samples recorded.
+
+        :param rings: The new sample rings by state name and phase.
+        """
+        self.__rings = rings
+
+    def get_show_overlay(self) -> bool:
+        """
+        Checks if the overlay is drawn.
+
+        :return: True if the overlay is drawn, False otherwise.
+        """
+        return self.__show_overlay
+
+    def set_show_overlay(self, show_overlay: bool) -> None:
+        """
+        Sets whether the overlay is drawn.
+
+        :param show_overlay: The new overlay flag.
+        """
+        self.__show_overlay = show_overlay
+
+    def get_overlay(self) -> pygame.Surface:
+        """
+        Gets the overlay last rendered.
+
+        :return: The overlay surface, or None if not rendered yet.
+        """
+        return self.__overlay
+
+    def set_overlay(self, overlay: pygame.Surface) -> None:
+        """
+        Sets the overlay last rendered.
+
+        :param overlay: The new overlay surface.
+        """
+        self.__overlay = overlay
+
+    def get_overlay_refreshed_ns(self) -> int:
+        """
+        Gets when the overlay was last rendered.
+
+        :return: The time, from time.perf_counter_ns.
+        """
+        return self.__overlay_refreshed_ns
+
+    def set_overlay_refreshed_ns(self, overlay_refreshed_ns: int) -> None:
+        """
+        Sets when the overlay was last rendered.
+
+        :param overlay_refreshed_ns: The new time, from time.perf_counter_ns.
+        """
+        self.__overlay_refreshed_ns = overlay_refreshed_ns
+
+    def get_font(self) -> pygame.font.Font:
+        """
+        Gets the font the overlay is written in.
+
+        :return: The overlay font, or None until the overlay is first rendered.
+        """
+        return self.__font
+
+    def set_font(self, font: pygame.font.Font) -> None:
+        """
+        Sets the font the overlay is written in.
+
+        :param font: The new overlay font.
+        """
+        self.__font = font
+
+    def get_csv_path(self) -> str:
+        """
+        Gets the path to the CSV file written on close.
+
+        :return: The CSV file path, or None if no file is written.
+        """
+        return self.__csv_path
+
+    def set_csv_path(self, csv_path: str) -> None:
+        """
+        Sets the path to the CSV file written on close.
+
+        :param csv_path: The new CSV file path, or None.
+        """
+        self.__csv_path = csv_path
@@ -19,7 +19,8 @@ from characters.enemies.base_enemy import BaseEnemy
 from characters.players.base_player import BasePlayer
 from xp import XP
 from quest import Quest
-from utilities.json_utility import write_default_if_not_exist, read_json
+from settings_store import get_settings_store
+from frame_profiler import FrameProfiler
 
 
 class Game:
@@ -31,9 +32,15 @@ class Game:
     __clock: Clock = None
     __running: bool = True
 
-    def __init__(self) -> None:
+    def __init__(
+        self, retain_ui: bool = False, frame_profiler: FrameProfiler = None
+    ) -> None:
         """
         Initializes the game, sets up pygame, UI, and game states.
+
+        :param retain_ui: Keep each menu's UI between visits, hidden, instead of
+            rebuilding it every time the menu is entered.
+        :param frame_profiler: Profiler timing each phase of every frame, or None.
         """
         # Initialize pygame modules
         pygame.init()
@@ -53,40 +60,15 @@ class Game:
         ui_manager.get_theme().load_theme("settings/combat_theme.json")
         ui_manager.get_theme().load_theme("settings/health_bar.json")
 
-        # Default user data for initialization
-        default_user_data = {
-            "xp": 5000,
-            "quest_progress": {
-                "Fireball": 0,
-                "Kill DreadNoughts": 0,
-            },
-            "quest_claimed": {
-                "Fireball": False,
-                "Kill DreadNoughts": False,
-            },
-            "character_level": {
-                "Warrior": 1,
-                "Mage": 1,
-                "Berserker": 1,
-                "Ranger": 1,
-            },
-            "character_abilities": {
-                "Warrior": ["Power Slash"],
-                "Mage": ["Fireball"],
-                "Berserker": ["Reckless Charge"],
-                "Ranger": ["Arrow Barrage"],
-            },
-        }
         # Write the default user data to file if it doesn't already exist
-        write_default_if_not_exist(
-            "settings/user_settings.json", default_data=default_user_data
-        )
+        get_settings_store().flush()
 
         # Set up the game clock
         self.set_clock(pygame.time.Clock())
 
         # Initialize the game state manager
         self.set_game_state_manager(GameStateManager())
+        self.get_game_state_manager().set_frame_profiler(frame_profiler)
 
         # Create player character instances
         players: list[BasePlayer] = [
@@ -103,8 +85,8 @@ class Game:
             Enigma("assets/characters/enemies/enigma/idle/0000.png"),
         ]
 
-        # Read XP from the user settings file
-        xp = XP(read_json("settings/user_settings.json")["xp"])
+        # Read XP from the user settings
+        xp = XP(get_settings_store().get("xp"))
         # Define quests
         quests: list[Quest] = [
             Quest(
@@ -163,6 +145,11 @@ class Game:
             xp,
         )
 
+        # Opt the states into retained UI mode, states that cannot keep their UI
+        # still rebuild it
+        for state in self.get_game_state_manager().get_states().values():
+            state.set_retain_ui(retain_ui)
+
         # Set the initial game state to the start menu
         self.get_game_state_manager().set_initial_state("start_menu")
 
@@ -176,6 +163,15 @@ class Game:
             time_delta = self.get_clock().tick_busy_loop(60)
             # Update the game state and check if the game should continue running
             self.set_running(self.get_game_state_manager().run(time_delta))
+            # Periodically save the user settings changed in memory
+            get_settings_store().flush_if_due()
+
+        # Save any unsaved user settings and wait for the write before quitting
+        get_settings_store().close()
+
+        # Write the frame times collected, if asked for
+        if self.get_game_state_manager().get_frame_profiler() is not None:
+            self.get_game_state_manager().get_frame_profiler().close()
 
         # Quit pygame and exit the program
         pygame.quit()
@@ -4,6 +4,7 @@ from pygame_gui.elements import UIButton, UIImage, UITextBox, UIPanel
 from ability import Ability
 from pygame_gui.core import ObjectID
 from characters.players.base_player import BasePlayer
+from surface_cache import get_surface_cache
 
 
 class AbilityHUD:
@@ -83,7 +84,7 @@ class AbilityHUD:
                     ),
                     (40, 40),
                 ),
-                image_surface=pygame.image.load(ability.get_icon_URL()),
+                image_surface=get_surface_cache().load(ability.get_icon_URL()),
                 manager=ui_manager,
                 container=container,
             )
@@ -112,7 +113,7 @@ class AbilityHUD:
         ability_button_rect.right = init_ability_button_x
 
         # Initialize the ability button based on unlock status
-        if ability in player.get_unlocked_abilities():
+        if player.has_unlocked_ability(ability):
             self.set_ability_button(
                 UIButton(
                     relative_rect=ability_button_rect,
@@ -146,12 +147,14 @@ class AbilityHUD:
         # Update the ability header (name)
         self.get_ability_header().set_text(ability.get_name())
         # Update the ability icon image
-        self.get_ability_icon().set_image(pygame.image.load(ability.get_icon_URL()))
+        self.get_ability_icon().set_image(
+            get_surface_cache().load(ability.get_icon_URL())
+        )
         # Update the ability description
         self.get_ability_description().set_text(ability.get_description())
 
         # Update the ability button based on unlock status
-        if ability in player.get_unlocked_abilities():
+        if player.has_unlocked_ability(ability):
             self.get_ability_button().set_text(self.get_ability_button_text()[0])
             self.get_ability_button().change_object_id(
                 ObjectID(class_id="@lock_button")
@@ -70,17 +70,14 @@ class EnemyCombatHUD:
                 self.get_ui_manager(),
                 self.get_container(),
                 health_bar_rect,
-                self.get_player().get_stats()["health_points"],
-                self.get_player().get_stats()["health_points"],
+                self.get_player().get_stats().health_points,
+                self.get_player().get_stats().health_points,
                 is_flipped=True,  # Indicates that the health bar is flipped
             )
         )
 
         # Initialize HUD text for each character stat
         for stat_count, stat_name in enumerate(CHARACTER_STAT):
-            if stat_name not in self.get_player().get_stats().keys():
-                self.get_player().get_stats()[stat_name] = 0
-
             if stat_name != "health_points":
                 stat_rect = pygame.Rect(
                     (0, HUD_init_text_y + stat_count * HUD_step), (225, 30)
@@ -88,7 +85,7 @@ class EnemyCombatHUD:
                 stat_rect.right = -HUD_text_x
                 self.get_HUD_text()[stat_name] = UITextBox(
                     html_text=f'<img src="assets/icons_18/{stat_name}.png"> '
-                    f"{convert_snake_to_title(stat_name)}: {self.get_player().get_stats()[stat_name]}",
+                    f"{convert_snake_to_title(stat_name)}: {self.get_player().get_stats().get(stat_name)}",
                     relative_rect=stat_rect,
                     manager=self.get_ui_manager(),
                     anchors=({"right": "right"}),
@@ -104,19 +101,15 @@ class EnemyCombatHUD:
         and updates the text for each stat displayed in the HUD.
         """
         # Update the health bar to reflect the player's current health points
-        self.get_health_bar().update(self.get_player().get_stats()["health_points"])
+        self.get_health_bar().update(self.get_player().get_stats().health_points)
 
         # Loop through each stat name defined in CHARACTER_STAT
         for stat_name in CHARACTER_STAT:
-            # Ensure that every stat name has a value in the player's stats dictionary, defaulting to 0 if not present
-            if stat_name not in self.get_player().get_stats().keys():
-                self.get_player().get_stats()[stat_name] = 0
-
             # Update the HUD text for each stat except for health points
             if stat_name != "health_points":
                 self.get_HUD_text()[stat_name].set_text(
                     html_text=f'<img src="assets/icons_18/{stat_name}.png"> '
-                    f"{convert_snake_to_title(stat_name)}: {self.get_player().get_stats()[stat_name]}"
+                    f"{convert_snake_to_title(stat_name)}: {self.get_player().get_stats().get(stat_name)}"
                 )
 
     def get_ui_manager(self) -> pygame_gui.UIManager:
@@ -73,17 +73,13 @@ class PlayerCombatHUD:
                 self.get_ui_manager(),
                 self.get_container(),
                 health_bar_rect,
-                self.get_player().get_stats()["health_points"],
-                self.get_player().get_stats()["health_points"],
+                self.get_player().get_stats().health_points,
+                self.get_player().get_stats().health_points,
             )
         )
 
         # Initialize HUD text elements for each character stat
         for stat_count, stat_name in enumerate(CHARACTER_STAT):
-            # Ensure all stats have a default value of 0 if not present
-            if stat_name not in self.get_player().get_stats().keys():
-                self.get_player().get_stats()[stat_name] = 0
-
             # Skip health points as it's managed by the health bar
             if stat_name != "health_points":
                 stat_rect = pygame.Rect(
@@ -91,7 +87,7 @@ class PlayerCombatHUD:
                 )
                 self.get_HUD_text()[stat_name] = UITextBox(
                     html_text=f'<img src="assets/icons_18/{stat_name}.png"> '
-                    f"{convert_snake_to_title(stat_name)}: {self.get_player().get_stats()[stat_name]}",
+                    f"{convert_snake_to_title(stat_name)}: {self.get_player().get_stats().get(stat_name)}",
                     relative_rect=stat_rect,
                     manager=self.get_ui_manager(),
                     object_id=ObjectID(object_id="#HUD-text"),
@@ -103,19 +99,16 @@ class PlayerCombatHUD:
         Updates the health bar and other stat texts in the HUD.
         """
         # Update the health bar with current health points
-        self.get_health_bar().update(self.get_player().get_stats()["health_points"])
+        self.get_health_bar().update(self.get_player().get_stats().health_points)
 
         # Update each stat text in the HUD
         for stat_name in CHARACTER_STAT:
-            if stat_name not in self.get_player().get_stats().keys():
-                self.get_player().get_stats()[stat_name] = 0
-
             if (
                 stat_name != "health_points"
             ):  # Health points are managed by the health bar
                 self.get_HUD_text()[stat_name].set_text(
                     html_text=f'<img src="assets/icons_18/{stat_name}.png"> '
-                    f"{convert_snake_to_title(stat_name)}: {self.get_player().get_stats()[stat_name]}"
+                    f"{convert_snake_to_title(stat_name)}: {self.get_player().get_stats().get(stat_name)}"
                 )
 
     def get_ui_manager(self) -> pygame_gui.UIManager:
@@ -4,6 +4,7 @@ from pygame_gui.elements import UITextBox, UIPanel
 from pygame_gui.core import ObjectID
 from gui.statistic_bar import StatisticBar
 from utilities.general_utility import convert_snake_to_title
+from stat_block import StatBlock
 
 
 class StatisticHUD:
@@ -13,7 +14,7 @@ class StatisticHUD:
     Attributes:
         stat_text (UITextBox): The text box displaying the stat name.
         stat_bar (StatisticBar): The bar representing the stat value.
-        stats (dict[str, int]): Dictionary of character stats.
+        stats (StatBlock): The character's stats.
         max_stat_value (int): The maximum value for the stat.
     """
 
@@ -21,7 +22,7 @@ class StatisticHUD:
         self,
         ui_manager: pygame_gui.UIManager,
         container: UIPanel,
-        stats: dict[str, int],
+        stats: StatBlock,
         stat_name: str,
         max_stat_value: int,
         stat_count: int,
@@ -35,7 +36,7 @@ class StatisticHUD:
 
         :param ui_manager: The UI manager to manage the HUD components.
         :param container: The container panel for the HUD.
-        :param stats: Dictionary of character stats.
+        :param stats: The character's stats.
         :param stat_name: The name of the stat to display.
         :param max_stat_value: The maximum value of the stat for normalization.
         :param stat_count: The index of the stat to position it correctly.
@@ -67,7 +68,7 @@ class StatisticHUD:
             (200, 30),
         )
         bar_location.right = -50
-        numerical_stat = stats.get(stat_name, 0)
+        numerical_stat = stats.get(stat_name)
 
         # Create the bar for the stat value
         self.set_stat_bar(
@@ -84,18 +85,18 @@ class StatisticHUD:
 
     def update(
         self,
-        stats: dict[str, int],
+        stats: StatBlock,
         stat_name: str,
         max_stat_value: int,
     ) -> None:
         """
         Updates the HUD to reflect new stat values.
 
-        :param stats: Dictionary of character stats.
+        :param stats: The character's stats.
         :param stat_name: The name of the stat to update.
         :param max_stat_value: The new maximum value of the stat for normalization.
         """
-        numerical_stat = stats.get(stat_name, 0)
+        numerical_stat = stats.get(stat_name)
         self.get_stat_bar().set_text(f"{numerical_stat}/{max_stat_value}")
         self.get_stat_bar().redraw()
 
@@ -117,7 +118,7 @@ class StatisticHUD:
         :return: The progress percentage of the stat bar.
         """
         return (
-            self.get_stats().get(stat_name, 0) / self.get_max_stat_value()
+            self.get_stats().get(stat_name) / self.get_max_stat_value()
             if self.get_max_stat_value() > 0
             else 0
         )
@@ -154,19 +155,19 @@ class StatisticHUD:
         """
         self.__stat_bar = stat_bar
 
-    def get_stats(self) -> dict[str, int]:
+    def get_stats(self) -> StatBlock:
         """
-        Gets the dictionary of character stats.
+        Gets the character's stats.
 
-        :return: The dictionary of character stats.
+        :return: The character's stats.
         """
         return self.__stats
 
-    def set_stats(self, stats: dict[str, int]) -> None:
+    def set_stats(self, stats: StatBlock) -> None:
         """
-        Sets the dictionary of character stats.
+        Sets the character's stats.
 
-        :param stats: The dictionary of character stats to set.
+        :param stats: The character's stats to set.
         """
         self.__stats = stats
 
@@ -1,5 +1,33 @@
+import argparse
+from frame_profiler import FrameProfiler
 from game import Game
+from settings_store import open_settings_store
 
 if __name__ == "__main__":
-    game = Game()
+    parser = argparse.ArgumentParser(description="Play King's Quest.")
+    parser.add_argument(
+        "--profile",
+        help="save slot in the profile database, instead of settings/user_settings.sav",
+    )
+    parser.add_argument(
+        "--retain-ui",
+        action="store_true",
+        help="keep menu UIs alive between visits instead of rebuilding them",
+    )
+    parser.add_argument(
+        "--frame-overlay",
+        action="store_true",
+        help="show p50/p95/p99 frame phase times of the current state",
+    )
+    parser.add_argument(
+        "--frame-csv",
+        help="write frame phase times per state to this .csv file on quit",
+    )
+    args = parser.parse_args()
+
+    open_settings_store(args.profile)
+    frame_profiler = None
+    if args.frame_overlay or args.frame_csv:
+        frame_profiler = FrameProfiler(args.frame_overlay, args.frame_csv)
+    game = Game(retain_ui=args.retain_ui, frame_profiler=frame_profiler)
     game.run()
@@ -0,0 +1,129 @@
+import hashlib
+import io
+import mmap
+import os
+import struct
+from typing import Optional
+import pygame
+from asset_manifest import get_asset_manifest, hash_contents
+from utilities.json_utility import write_bytes_atomic
+
+# Folder holding the decoded pixels of every image loaded, one entry per image
+PIXEL_CACHE_DIR = "assets/.pixel_cache/"
+
+# First bytes of every entry
+PIXEL_CACHE_MAGIC = b"KQPX"
+
+# Version of the entry layout, raised whenever it changes
+PIXEL_CACHE_VERSION = 1
+
+# Magic, version, digest of the source file, width, height and bytes per pixel
+_HEADER = struct.Struct("<4sH16sIIB")
+
+# pygame.image.frombuffer format by bytes per pixel
+_PIXEL_FORMATS = {3: "RGB", 4: "RGBA"}
+
+
+def get_entry_path(path: str) -> str:
+    """
+    Gets where the decoded pixels of an image are cached.
+
+    :param path: Path to the image file.
+    :return: Path to the entry, named after a hash of the image path.
+    """
+    return PIXEL_CACHE_DIR + hashlib.blake2b(path.encode("utf-8")).hexdigest()[:32]
+
+
+def read_entry(entry_path: str, digest: bytes) -> Optional[pygame.Surface]:
+    """
+    Maps an entry into memory and wraps its pixels in a surface, without copying them.
+
+    :param entry_path: Path to the entry.
+    :param digest: Digest of the current source file.
+    :return: The surface, or None if there is no entry or it is stale or corrupted.
+    """
+    try:
+        with open(entry_path, "rb") as file:
+            # Copy-on-write, so drawing on the surface never reaches the entry
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError):
+        return None
+    if len(mapped) < _HEADER.size:
+        return None
+    magic, version, entry_digest, width, height, pixel_size = _HEADER.unpack_from(
+        mapped
+    )
+    if (
+        magic != PIXEL_CACHE_MAGIC
+        or version != PIXEL_CACHE_VERSION
+        or entry_digest != digest
+        or pixel_size not in _PIXEL_FORMATS
+        or len(mapped) != _HEADER.size + width * height * pixel_size
+    ):
+        return None
+    # The surface keeps the mapping alive for as long as it is used
+    return pygame.image.frombuffer(
+        memoryview(mapped)[_HEADER.size :],
+        (width, height),
+        _PIXEL_FORMATS[pixel_size],
+    )
+
+
+def write_entry(entry_path: str, digest: bytes, surface: pygame.Surface) -> None:
+    """
+    Writes the decoded pixels of an image to its entry. Failing to write is ignored,
+    as the image is simply decoded again next time.
+
+    :param entry_path: Path to the entry.
+    :param digest: Digest of the source file.
+    :param surface: The decoded image.
+    """
+    has_alpha = surface.get_flags() & pygame.SRCALPHA
+    pixel_size = 4 if has_alpha else 3
+    header = _HEADER.pack(
+        PIXEL_CACHE_MAGIC,
+        PIXEL_CACHE_VERSION,
+        digest,
+        surface.get_width(),
+        surface.get_height(),
+        pixel_size,
+    )
+    try:
+        os.makedirs(PIXEL_CACHE_DIR, exist_ok=True)
+        write_bytes_atomic(
+            entry_path,
+            header + pygame.image.tobytes(surface, _PIXEL_FORMATS[pixel_size]),
+            "none",
+        )
+    except OSError:
+        pass
+
+
+def load_pixels(path: str) -> pygame.Surface:
+    """
+    Loads an image, from its cached decoded pixels if the image file has not changed
+    since they were written, and decoding it and caching its pixels otherwise. A
+    drop-in replacement for pygame.image.load for images without a colorkey.
+
+    The image file's hash is taken from the asset manifest when the file is
+    unchanged since the manifest was generated, so a cached image is loaded without
+    reading the file at all.
+
+    :param path: Path to the image file.
+    :return: The image, RGBA if the file has transparency and RGB otherwise.
+    """
+    contents = None
+    digest = get_asset_manifest().get_unchanged_hash(path)
+    if digest is None:
+        with open(path, "rb") as file:
+            contents = file.read()
+        digest = hash_contents(contents)
+    entry_path = get_entry_path(path)
+    surface = read_entry(entry_path, digest)
+    if surface is None:
+        if contents is None:
+            with open(path, "rb") as file:
+                contents = file.read()
+        surface = pygame.image.load(io.BytesIO(contents), path)
+        write_entry(entry_path, digest, surface)
+    return surface
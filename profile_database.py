@@ -0,0 +1,226 @@
+import argparse
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, List, Optional
+from save_file import SaveFile
+
+# Location of the database holding every named profile
+PROFILE_DATABASE_PATH = "settings/profiles.db"
+
+
+class ProfileDatabase:
+    """
+    ProfileDatabase class storing many named user profiles (save slots) in one SQLite
+    database in WAL mode, so readers are not blocked by a writer. Every setting entry
+    is its own row keyed by (profile, section, key), so reading or updating one value,
+    e.g. one quest's progress, is an indexed single-row operation.
+
+    Top-level settings such as "xp" are stored with an empty key. Values are JSON encoded.
+    """
+
+    __connection: sqlite3.Connection = None
+    __lock: threading.Lock = None
+
+    def __init__(self, database_path: str = PROFILE_DATABASE_PATH) -> None:
+        """
+        Initializes the ProfileDatabase class, creating the tables if needed.
+
+        :param database_path: Path to the SQLite database file.
+        """
+        self.set_lock(threading.Lock())
+        # The connection is shared with the save worker's thread, guarded by the lock
+        self.set_connection(sqlite3.connect(database_path, check_same_thread=False))
+        with self.get_lock(), self.get_connection() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS profiles (name TEXT PRIMARY KEY)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS settings ("
+                "profile TEXT NOT NULL REFERENCES profiles(name), "
+                "section TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "PRIMARY KEY (profile, section, key)"
+                ") WITHOUT ROWID"
+            )
+
+    def list_profiles(self) -> List[str]:
+        """
+        Lists the names of every profile.
+
+        :return: The profile names in alphabetical order.
+        """
+        with self.get_lock():
+            rows = self.get_connection().execute(
+                "SELECT name FROM profiles ORDER BY name"
+            )
+            return [name for (name,) in rows]
+
+    def load_profile(self, profile: str) -> Optional[Dict[str, Any]]:
+        """
+        Loads every setting of a profile.
+
+        :param profile: The profile name.
+        :return: The settings in the same shape as the user settings file, or None if
+            there is no such profile.
+        """
+        with self.get_lock():
+            connection = self.get_connection()
+            if (
+                connection.execute(
+                    "SELECT 1 FROM profiles WHERE name = ?", (profile,)
+                ).fetchone()
+                is None
+            ):
+                return None
+            rows = connection.execute(
+                "SELECT section, key, value FROM settings WHERE profile = ?",
+                (profile,),
+            ).fetchall()
+        data: Dict[str, Any] = {}
+        for section, key, value in rows:
+            if key == "":
+                data[section] = json.loads(value)
+            else:
+                data.setdefault(section, {})[key] = json.loads(value)
+        return data
+
+    def save_profile(self, profile: str, data: Dict[str, Any]) -> None:
+        """
+        Replaces every setting of a profile, creating it if needed, in one transaction.
+
+        :param profile: The profile name.
+        :param data: The settings in the same shape as the user settings file.
+        """
+        rows = []
+        for section, value in data.items():
+            if isinstance(value, dict):
+                for key, entry in value.items():
+                    rows.append((profile, section, key, json.dumps(entry)))
+            else:
+                rows.append((profile, section, "", json.dumps(value)))
+        with self.get_lock(), self.get_connection() as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO profiles (name) VALUES (?)", (profile,)
+            )
+            connection.execute("DELETE FROM settings WHERE profile = ?", (profile,))
+            connection.executemany(
+                "INSERT INTO settings (profile, section, key, value) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def set_value(self, profile: str, section: str, key: str, value: Any) -> None:
+        """
+        Sets one setting of a profile.
+
+        :param profile: The profile name.
+        :param section: The setting name, e.g. "character_level".
+        :param key: The entry name within the section, or "" for a top-level setting.
+        :param value: The new value.
+        """
+        with self.get_lock(), self.get_connection() as connection:
+            connection.execute(
+                "INSERT INTO settings (profile, section, key, value) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (profile, section, key) DO UPDATE SET value = excluded.value",
+                (profile, section, key, json.dumps(value)),
+            )
+
+    def add_value(self, profile: str, section: str, key: str, delta: int) -> None:
+        """
+        Adds to one counter setting of a profile, e.g. XP or a quest's progress.
+
+        :param profile: The profile name.
+        :param section: The setting name.
+        :param key: The entry name within the section, or "" for a top-level setting.
+        :param delta: The amount to add, negative to subtract.
+        """
+        with self.get_lock(), self.get_connection() as connection:
+            connection.execute(
+                "INSERT INTO settings (profile, section, key, value) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (profile, section, key) "
+                "DO UPDATE SET value = CAST(value AS INTEGER) + ?",
+                (profile, section, key, json.dumps(delta), delta),
+            )
+
+    def delete_profile(self, profile: str) -> None:
+        """
+        Deletes a profile and all of its settings.
+
+        :param profile: The profile name.
+        """
+        with self.get_lock(), self.get_connection() as connection:
+            connection.execute("DELETE FROM settings WHERE profile = ?", (profile,))
+            connection.execute("DELETE FROM profiles WHERE name = ?", (profile,))
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self.get_lock():
+            self.get_connection().close()
+
+    # Getters and setters with docstrings
+
+    def get_connection(self) -> sqlite3.Connection:
+        """
+        Gets the database connection.
+
+        :return: The connection.
+        """
+        return self.__connection
+
+    def set_connection(self, connection: sqlite3.Connection) -> None:
+        """
+        Sets the database connection.
+
+        :param connection: The new connection.
+        """
+        self.__connection = connection
+
+    def get_lock(self) -> threading.Lock:
+        """
+        Gets the lock guarding the connection between threads.
+
+        :return: The lock.
+        """
+        return self.__lock
+
+    def set_lock(self, lock: threading.Lock) -> None:
+        """
+        Sets the lock guarding the connection between threads.
+
+        :param lock: The new lock.
+        """
+        self.__lock = lock
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Manage the saved player profiles.")
+    parser.add_argument(
+        "--database", default=PROFILE_DATABASE_PATH, help="profile database file"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="list every profile")
+    import_parser = subparsers.add_parser(
+        "import", help="copy a user settings .sav or older .json file into a profile"
+    )
+    import_parser.add_argument("profile")
+    import_parser.add_argument("settings_file")
+    delete_parser = subparsers.add_parser("delete", help="delete a profile")
+    delete_parser.add_argument("profile")
+    args = parser.parse_args()
+
+    database = ProfileDatabase(args.database)
+    if args.command == "list":
+        for profile_name in database.list_profiles():
+            print(profile_name)
+    elif args.command == "import":
+        database.save_profile(
+            args.profile, SaveFile(args.settings_file).load_sections()
+        )
+    elif args.command == "delete":
+        database.delete_profile(args.profile)
+    database.close()
@@ -0,0 +1,224 @@
+import json
+import os
+from collections import deque
+from typing import Any, Deque, Dict, List, TextIO
+from save_worker import SaveWorker
+from utilities.json_utility import write_bytes_atomic
+
+# Location of the journal of progress changes made since the last settings snapshot
+PROGRESS_JOURNAL_PATH = "settings/progress_journal.jsonl"
+
+
+class ProgressJournal:
+    """
+    ProgressJournal class appending small delta records, e.g. "+1 Fireball quest
+    progress", to a JSON-lines file. Each record costs one short append however big
+    the profile grows. Records carry increasing sequence numbers, so a snapshot of the
+    settings can note the last record it includes and the journal can be trimmed up to
+    it later.
+
+    Records are buffered and written by the save worker, with its fsync policy, so
+    the main thread never waits on the file. Trimming runs on the save worker too,
+    after the snapshot is written, so the file is only ever touched from one thread.
+    """
+
+    __file_path: str = PROGRESS_JOURNAL_PATH
+    __file: TextIO = None
+    __sequence: int = 0
+    __record_count: int = 0
+    __save_worker: SaveWorker = None
+    __pending_lines: Deque[str] = None
+
+    def __init__(
+        self, save_worker: SaveWorker, file_path: str = PROGRESS_JOURNAL_PATH
+    ) -> None:
+        """
+        Initializes the ProgressJournal class, opening the journal file for appending.
+
+        :param save_worker: The worker writing the records, e.g. the settings store's.
+        :param file_path: Path to the journal file.
+        """
+        self.set_file_path(file_path)
+        self.set_save_worker(save_worker)
+        self.set_pending_lines(deque())
+        records = self.read_records()
+        self.set_sequence(records[-1]["seq"] if records else 0)
+        self.set_record_count(len(records))
+        self.set_file(open(file_path, "a"))
+
+    def append(self, section: str, key: str, delta: int) -> int:
+        """
+        Appends a record adding a delta to a setting. The record is buffered and
+        written on the save worker's thread.
+
+        :param section: The setting name, e.g. "xp" or "quest_progress".
+        :param key: The entry name within the section, or "" for a top-level setting.
+        :param delta: The amount added.
+        :return: The sequence number of the record.
+        """
+        self.set_sequence(self.get_sequence() + 1)
+        record = {
+            "seq": self.get_sequence(),
+            "section": section,
+            "key": key,
+            "delta": delta,
+        }
+        self.get_pending_lines().append(json.dumps(record) + "\n")
+        self.get_save_worker().submit_task(self.write_pending)
+        return self.get_sequence()
+
+    def write_pending(self) -> None:
+        """
+        Writes every buffered record to the journal file, applying the save worker's
+        fsync policy. Runs on the save worker's thread.
+        """
+        pending_lines = self.get_pending_lines()
+        if not pending_lines:
+            # An earlier call already wrote the records this one was queued for
+            return
+        lines = []
+        while pending_lines:
+            lines.append(pending_lines.popleft())
+        self.get_file().write("".join(lines))
+        self.get_file().flush()
+        if self.get_save_worker().get_fsync_policy() != "none":
+            os.fsync(self.get_file().fileno())
+        self.set_record_count(self.get_record_count() + len(lines))
+
+    def read_records(self) -> List[Dict[str, Any]]:
+        """
+        Reads every record in the journal file, ignoring a last line cut off by a crash.
+
+        :return: The records in sequence order.
+        """
+        if not os.path.exists(self.get_file_path()):
+            return []
+        records = []
+        with open(self.get_file_path(), "r") as file:
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+        return records
+
+    def truncate(self, sequence: int) -> None:
+        """
+        Drops the records up to a sequence number, once a snapshot including them is
+        saved. Runs on the save worker's thread, after the records are written.
+
+        :param sequence: The last sequence number to drop.
+        """
+        self.get_file().close()
+        records = [record for record in self.read_records() if record["seq"] > sequence]
+        write_bytes_atomic(
+            self.get_file_path(),
+            "".join(json.dumps(record) + "\n" for record in records).encode("utf-8"),
+            self.get_save_worker().get_fsync_policy(),
+        )
+        self.set_record_count(len(records))
+        self.set_file(open(self.get_file_path(), "a"))
+
+    def close(self) -> None:
+        """
+        Closes the journal file, once the save worker has stopped.
+        """
+        self.get_file().close()
+
+    # Getters and setters with docstrings
+
+    def get_file_path(self) -> str:
+        """
+        Gets the path to the journal file.
+
+        :return: The journal file path.
+        """
+        return self.__file_path
+
+    def set_file_path(self, file_path: str) -> None:
+        """
+        Sets the path to the journal file.
+
+        :param file_path: The new journal file path.
+        """
+        self.__file_path = file_path
+
+    def get_file(self) -> TextIO:
+        """
+        Gets the journal file opened for appending.
+
+        :return: The journal file.
+        """
+        return self.__file
+
+    def set_file(self, file: TextIO) -> None:
+        """
+        Sets the journal file opened for appending.
+
+        :param file: The new journal file.
+        """
+        self.__file = file
+
+    def get_sequence(self) -> int:
+        """
+        Gets the sequence number of the last record.
+
+        :return: The last sequence number, 0 if nothing was journaled.
+        """
+        return self.__sequence
+
+    def set_sequence(self, sequence: int) -> None:
+        """
+        Sets the sequence number of the last record.
+
+        :param sequence: The new last sequence number.
+        """
+        self.__sequence = sequence
+
+    def get_record_count(self) -> int:
+        """
+        Gets the number of records in the journal file, written by the save worker.
+
+        :return: The record count.
+        """
+        return self.__record_count
+
+    def set_record_count(self, record_count: int) -> None:
+        """
+        Sets the number of records in the journal file.
+
+        :param record_count: The new record count.
+        """
+        self.__record_count = record_count
+
+    def get_save_worker(self) -> SaveWorker:
+        """
+        Gets the worker writing the records.
+
+        :return: The save worker.
+        """
+        return self.__save_worker
+
+    def set_save_worker(self, save_worker: SaveWorker) -> None:
+        """
+        Sets the worker writing the records.
+
+        :param save_worker: The new save worker.
+        """
+        self.__save_worker = save_worker
+
+    def get_pending_lines(self) -> Deque[str]:
+        """
+        Gets the records appended but not written yet, as JSON lines.
+
+        :return: The pending lines, oldest first.
+        """
+        return self.__pending_lines
+
+    def set_pending_lines(self, pending_lines: Deque[str]) -> None:
+        """
+        Sets the records appended but not written yet, as JSON lines.
+
+        :param pending_lines: The new pending lines, oldest first.
+        """
+        self.__pending_lines = pending_lines
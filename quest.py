@@ -1,4 +1,4 @@
-from utilities.json_utility import read_json, write_json
+from settings_store import get_settings_store
 
 
 class Quest:
@@ -37,9 +37,9 @@ class Quest:
         self.set_aim(aim)
         self.set_is_temporary(is_temporary)
         if not is_temporary:
-            user_settings = read_json("settings/user_settings.json")
-            self.set_progress(user_settings["quest_progress"].get(name, 0))
-            self.set_is_claimed(user_settings["quest_claimed"].get(name, False))
+            settings_store = get_settings_store()
+            self.set_progress(settings_store.get("quest_progress").get(name, 0))
+            self.set_is_claimed(settings_store.get("quest_claimed").get(name, False))
 
     def copy(self) -> "Quest":
         """
@@ -63,9 +63,7 @@ class Quest:
         """
         self.set_progress(self.get_progress() + increment)
         if not self.get_is_temporary():
-            user_settings = read_json("settings/user_settings.json")
-            user_settings["quest_progress"][self.get_name()] = self.get_progress()
-            write_json("settings/user_settings.json", user_settings)
+            get_settings_store().add("quest_progress", increment, self.get_name())
 
     def is_done(self) -> bool:
         """
@@ -81,9 +79,9 @@ class Quest:
         """
         self.set_is_claimed(True)
         if not self.get_is_temporary():
-            user_settings = read_json("settings/user_settings.json")
-            user_settings["quest_claimed"][self.get_name()] = self.get_is_claimed()
-            write_json("settings/user_settings.json", user_settings)
+            get_settings_store().set_entry(
+                "quest_claimed", self.get_name(), self.get_is_claimed()
+            )
 
     # Getters and setters with docstrings
 
@@ -0,0 +1,262 @@
+import json
+import os
+import struct
+from typing import Any, Callable, Dict, List
+from utilities.json_utility import write_bytes_atomic
+
+# First bytes of every save file
+SAVE_MAGIC = b"KQSV"
+
+# Version of the save layout written by write_save_file, raised whenever it changes
+SAVE_FORMAT_VERSION = 1
+
+# Magic, format version and number of sections
+_HEADER = struct.Struct("<4sHH")
+# Length of a section name, followed by the name itself
+_NAME_LENGTH = struct.Struct("<B")
+# Offset of a section's payload from the start of the file and its length
+_SECTION_RANGE = struct.Struct("<II")
+
+
+def encode_section(value: Any) -> bytes:
+    """
+    Encodes the value of a section into its payload.
+
+    :param value: The section value, e.g. the XP or every character's level.
+    :return: The payload, compact UTF-8 JSON.
+    """
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def decode_section(payload: bytes) -> Any:
+    """
+    Decodes the payload of a section.
+
+    :param payload: The payload written by encode_section.
+    :return: The section value.
+    """
+    return json.loads(payload)
+
+
+def write_save_file(
+    file_path: str, sections: Dict[str, Any], fsync_policy: str = "file"
+) -> None:
+    """
+    Writes sections to a save file atomically. The header and section table come
+    first, so a reader can find any one section without reading the others.
+
+    :param file_path: Path to the save file.
+    :param sections: The section values by name. Values that are bytes are taken to
+        be payloads already encoded by encode_section and are written as is.
+    :param fsync_policy: One of FSYNC_POLICIES from json_utility.
+    """
+    names = [name.encode("utf-8") for name in sections]
+    payloads = [
+        value if isinstance(value, bytes) else encode_section(value)
+        for value in sections.values()
+    ]
+    offset = _HEADER.size + sum(
+        _NAME_LENGTH.size + len(name) + _SECTION_RANGE.size for name in names
+    )
+    parts = [_HEADER.pack(SAVE_MAGIC, SAVE_FORMAT_VERSION, len(names))]
+    for name, payload in zip(names, payloads):
+        parts += [
+            _NAME_LENGTH.pack(len(name)),
+            name,
+            _SECTION_RANGE.pack(offset, len(payload)),
+        ]
+        offset += len(payload)
+    write_bytes_atomic(file_path, b"".join(parts + payloads), fsync_policy)
+
+
+def migrate_from_json(sections: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Upgrades version 0, the indented JSON settings file, to version 1. The settings
+    are unchanged: every top-level entry simply becomes a section.
+
+    :param sections: The version 0 sections.
+    :return: The version 1 sections.
+    """
+    return sections
+
+
+# Upgrades from each older version to the version after it
+MIGRATIONS: Dict[int, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    0: migrate_from_json,
+}
+
+
+class SaveFile:
+    """
+    SaveFile class giving access to the sections of a save file, e.g. "xp" or
+    "quest_progress". Opening a save file only reads its bytes and section table,
+    and each section is decoded when it is first loaded, so a reader only pays for
+    the sections it uses.
+
+    A save file of an older version, including the JSON settings file the game used
+    before, is upgraded through MIGRATIONS and rewritten in place by migrate.
+    """
+
+    __file_path: str = None
+    __version: int = SAVE_FORMAT_VERSION
+    __payloads: Dict[str, bytes] = None
+
+    def __init__(self, file_path: str, legacy_path: str = None) -> None:
+        """
+        Initializes the SaveFile class, reading the save file's section table.
+
+        :param file_path: Path to the save file.
+        :param legacy_path: Path to a JSON settings file read instead if there is no
+            save file yet, or None.
+        :raises ValueError: If the save file is corrupted or from a newer version.
+        """
+        self.set_file_path(file_path)
+        self.set_version(SAVE_FORMAT_VERSION)
+        self.set_payloads({})
+        if os.path.exists(file_path):
+            with open(file_path, "rb") as file:
+                self.read(file.read())
+        elif legacy_path is not None and os.path.exists(legacy_path):
+            with open(legacy_path, "rb") as file:
+                self.read(file.read())
+
+    def read(self, contents: bytes) -> None:
+        """
+        Reads the version and section table from the contents of a save file.
+
+        :param contents: The file contents.
+        :raises ValueError: If the contents are corrupted or from a newer version.
+        """
+        if not contents.startswith(SAVE_MAGIC):
+            # Version 0 is a JSON settings file, every entry of which is a section
+            self.set_version(0)
+            self.set_payloads(
+                {
+                    name: encode_section(value)
+                    for name, value in json.loads(contents).items()
+                }
+            )
+            return
+        try:
+            _, version, section_count = _HEADER.unpack_from(contents)
+            position = _HEADER.size
+            payloads = {}
+            for _ in range(section_count):
+                (name_length,) = _NAME_LENGTH.unpack_from(contents, position)
+                position += _NAME_LENGTH.size
+                name = contents[position : position + name_length].decode("utf-8")
+                position += name_length
+                offset, length = _SECTION_RANGE.unpack_from(contents, position)
+                position += _SECTION_RANGE.size
+                if offset + length > len(contents):
+                    raise ValueError(f"Section {name} is cut off")
+                payloads[name] = contents[offset : offset + length]
+        except struct.error as error:
+            raise ValueError(f"Corrupted save file header: {error}") from error
+        if version > SAVE_FORMAT_VERSION:
+            raise ValueError(f"Save file version {version} is newer than the game")
+        self.set_version(version)
+        self.set_payloads(payloads)
+
+    def load_section(self, name: str) -> Any:
+        """
+        Decodes one section.
+
+        :param name: The section name.
+        :return: The section value.
+        :raises KeyError: If the save file has no such section.
+        """
+        return decode_section(self.get_payloads()[name])
+
+    def load_sections(self) -> Dict[str, Any]:
+        """
+        Decodes every section.
+
+        :return: The section values by name.
+        """
+        return {name: self.load_section(name) for name in self.get_payloads()}
+
+    def has_section(self, name: str) -> bool:
+        """
+        Checks if the save file has a section.
+
+        :param name: The section name.
+        :return: True if the section exists, False otherwise.
+        """
+        return name in self.get_payloads()
+
+    def get_section_names(self) -> List[str]:
+        """
+        Gets the names of every section.
+
+        :return: The section names.
+        """
+        return list(self.get_payloads())
+
+    def migrate(self) -> bool:
+        """
+        Upgrades the save file to the current version and rewrites it in place.
+
+        :return: True if the save file was upgraded, False if it was up to date.
+        """
+        if self.get_version() == SAVE_FORMAT_VERSION:
+            return False
+        sections = self.load_sections()
+        for version in range(self.get_version(), SAVE_FORMAT_VERSION):
+            sections = MIGRATIONS[version](sections)
+        write_save_file(self.get_file_path(), sections)
+        self.set_version(SAVE_FORMAT_VERSION)
+        self.set_payloads(
+            {name: encode_section(value) for name, value in sections.items()}
+        )
+        return True
+
+    # Getters and setters with docstrings
+
+    def get_file_path(self) -> str:
+        """
+        Gets the path to the save file.
+
+        :return: The save file path.
+        """
+        return self.__file_path
+
+    def set_file_path(self, file_path: str) -> None:
+        """
+        Sets the path to the save file.
+
+        :param file_path: The new save file path.
+        """
+        self.__file_path = file_path
+
+    def get_version(self) -> int:
+        """
+        Gets the format version the save file was written in.
+
+        :return: The format version, 0 for a JSON settings file.
+        """
+        return self.__version
+
+    def set_version(self, version: int) -> None:
+        """
+        Sets the format version the save file was written in.
+
+        :param version: The new format version.
+        """
+        self.__version = version
+
+    def get_payloads(self) -> Dict[str, bytes]:
+        """
+        Gets the encoded sections.
+
+        :return: The section payloads by name.
+        """
+        return self.__payloads
+
+    def set_payloads(self, payloads: Dict[str, bytes]) -> None:
+        """
+        Sets the encoded sections.
+
+        :param payloads: The new section payloads by name.
+        """
+        self.__payloads = payloads
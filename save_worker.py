@@ -0,0 +1,250 @@
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from utilities.json_utility import FSYNC_POLICIES, write_json_atomic
+
+
+class SaveWorker:
+    """
+    SaveWorker class writing snapshots on a background thread, so the frame loop
+    never waits on the disk. Snapshots arrive through a queue; when several are
+    waiting for the same file only the newest is written. Every write is atomic
+    (temporary file + os.replace) with a configurable fsync policy. Other storage
+    work, such as database updates, can be queued as tasks, which run in order.
+    """
+
+    __queue: "queue.Queue[Optional[Tuple[str, Any, Callable[[], None]]]]" = None
+    __thread: threading.Thread = None
+    __fsync_policy: str = "file"
+    __write_file: Callable[[str, Any, str], None] = None
+    __error: Optional[Exception] = None
+
+    def __init__(
+        self,
+        fsync_policy: str = "file",
+        write_file: Callable[[str, Any, str], None] = write_json_atomic,
+    ) -> None:
+        """
+        Initializes the SaveWorker class and starts its thread.
+
+        :param fsync_policy: One of FSYNC_POLICIES from json_utility.
+        :param write_file: Writes a snapshot atomically, given the file path, the
+            snapshot and the fsync policy. Writes JSON files by default.
+        :raises ValueError: If the fsync policy is unknown.
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+        self.set_fsync_policy(fsync_policy)
+        self.set_write_file(write_file)
+        self.set_error(None)
+        self.set_queue(queue.Queue())
+        self.set_thread(threading.Thread(target=self.work, daemon=True))
+        self.get_thread().start()
+
+    def submit(
+        self,
+        file_path: str,
+        snapshot: Any,
+        on_written: Callable[[], None] = None,
+    ) -> None:
+        """
+        Queues a snapshot to be written. The snapshot must not be changed afterwards.
+
+        :param file_path: Path to the file.
+        :param snapshot: The data to write.
+        :param on_written: Called on the worker thread once the snapshot, or a newer
+            one of the same file, is written.
+        """
+        self.get_queue().put((file_path, snapshot, on_written))
+
+    def submit_task(self, task: Callable[[], None]) -> None:
+        """
+        Queues a function to run on the worker thread, after everything queued before
+        it: earlier tasks have run and earlier snapshots are written.
+
+        :param task: The function to run.
+        """
+        self.get_queue().put((None, None, task))
+
+    def wait(self) -> None:
+        """
+        Blocks until every queued snapshot is written.
+
+        :raises Exception: The error of a write or task that failed since the last wait.
+        """
+        self.get_queue().join()
+        error = self.get_error()
+        if error is not None:
+            self.set_error(None)
+            raise error
+
+    def stop(self) -> None:
+        """
+        Writes every queued snapshot and stops the thread.
+
+        :raises Exception: The error of a write or task that failed since the last wait.
+        """
+        self.get_queue().put(None)
+        self.get_thread().join()
+        self.wait()
+
+    def work(self) -> None:
+        """
+        Runs on the worker thread, writing snapshots until stopped.
+        """
+        work_queue = self.get_queue()
+        while True:
+            items = [work_queue.get()]
+            # Take everything already waiting, keeping the newest snapshot of each file
+            while True:
+                try:
+                    items.append(work_queue.get_nowait())
+                except queue.Empty:
+                    break
+            is_stopping = None in items
+            try:
+                self.process(items)
+            finally:
+                # Always drain the queue, so wait and stop never block on a failure
+                for _ in items:
+                    work_queue.task_done()
+            if is_stopping:
+                return
+
+    def process(
+        self, items: List[Optional[Tuple[str, Any, Callable[[], None]]]]
+    ) -> None:
+        """
+        Runs the tasks and writes the snapshots among the items taken from the queue,
+        in queue order. Between two tasks only the newest snapshot of each file is
+        written, and it is written before the next task runs. A failing task, write or
+        callback is recorded for wait to raise, and does not stop the others.
+
+        :param items: The queue entries, None being the stop signal.
+        """
+        latest: Dict[str, Any] = {}
+        callbacks: Dict[str, List[Callable[[], None]]] = {}
+        for item in items:
+            if item is None:
+                continue
+            file_path, snapshot, on_written = item
+            if file_path is None:
+                # A task, run once the snapshots queued before it are written
+                self.write_pending(latest, callbacks)
+                try:
+                    on_written()
+                except Exception as error:
+                    self.set_error(error)
+                continue
+            latest[file_path] = snapshot
+            if on_written is not None:
+                callbacks.setdefault(file_path, []).append(on_written)
+        self.write_pending(latest, callbacks)
+
+    def write_pending(
+        self,
+        latest: Dict[str, Any],
+        callbacks: Dict[str, List[Callable[[], None]]],
+    ) -> None:
+        """
+        Writes the pending snapshots and runs their callbacks, then empties both.
+
+        :param latest: The newest pending snapshot by file path.
+        :param callbacks: The callbacks waiting on each file path.
+        """
+        for file_path, snapshot in latest.items():
+            try:
+                self.get_write_file()(file_path, snapshot, self.get_fsync_policy())
+                for on_written in callbacks.get(file_path, []):
+                    on_written()
+            except Exception as error:
+                self.set_error(error)
+        latest.clear()
+        callbacks.clear()
+
+    # Getters and setters with docstrings
+
+    def get_queue(
+        self,
+    ) -> "queue.Queue[Optional[Tuple[str, Any, Callable[[], None]]]]":
+        """
+        Gets the queue of (file path, snapshot, callback) entries waiting to be written.
+
+        :return: The snapshot queue.
+        """
+        return self.__queue
+
+    def set_queue(
+        self,
+        snapshot_queue: "queue.Queue[Optional[Tuple[str, Any, Callable[[], None]]]]",
+    ) -> None:
+        """
+        Sets the queue of (file path, snapshot, callback) entries waiting to be written.
+
+        :param snapshot_queue: The new snapshot queue.
+        """
+        self.__queue = snapshot_queue
+
+    def get_thread(self) -> threading.Thread:
+        """
+        Gets the worker thread.
+
+        :return: The worker thread.
+        """
+        return self.__thread
+
+    def set_thread(self, thread: threading.Thread) -> None:
+        """
+        Sets the worker thread.
+
+        :param thread: The new worker thread.
+        """
+        self.__thread = thread
+
+    def get_fsync_policy(self) -> str:
+        """
+        Gets when writes are forced to disk.
+
+        :return: One of FSYNC_POLICIES from json_utility.
+        """
+        return self.__fsync_policy
+
+    def set_fsync_policy(self, fsync_policy: str) -> None:
+        """
+        Sets when writes are forced to disk.
+
+        :param fsync_policy: One of FSYNC_POLICIES from json_utility.
+        """
+        self.__fsync_policy = fsync_policy
+
+    def get_write_file(self) -> Callable[[str, Any, str], None]:
+        """
+        Gets the function writing a snapshot to its file.
+
+        :return: The write function.
+        """
+        return self.__write_file
+
+    def set_write_file(self, write_file: Callable[[str, Any, str], None]) -> None:
+        """
+        Sets the function writing a snapshot to its file.
+
+        :param write_file: The new write function.
+        """
+        self.__write_file = write_file
+
+    def get_error(self) -> Optional[Exception]:
+        """
+        Gets the last write error not yet raised by wait.
+
+        :return: The error, or None if every write succeeded.
+        """
+        return self.__error
+
+    def set_error(self, error: Optional[Exception]) -> None:
+        """
+        Sets the last write error not yet raised by wait.
+
+        :param error: The error, or None.
+        """
+        self.__error = error
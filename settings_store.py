@@ -0,0 +1,531 @@
+import copy
+import time
+from typing import Any, Dict
+from profile_database import PROFILE_DATABASE_PATH, ProfileDatabase
+from progress_journal import PROGRESS_JOURNAL_PATH, ProgressJournal
+from save_file import SaveFile, write_save_file
+from save_worker import SaveWorker
+from user_settings import (
+    DEFAULT_USER_DATA,
+    LEGACY_USER_SETTINGS_PATH,
+    USER_SETTINGS_PATH,
+)
+
+
+class SettingsStore:
+    """
+    SettingsStore class holding the user settings in memory. The settings file is read
+    once, every change is made to the in-memory copy and marks it dirty, and the file
+    is only rewritten by flush: on state transitions, on a timer and on quit. Flushing
+    hands a snapshot to a SaveWorker, which writes it atomically off the main thread.
+
+    The settings file is a SaveFile, and each of its sections is only decoded when it
+    is first read. Sections never read are written back as they were saved.
+
+    Counters that change often (XP, quest progress) are added to through add instead:
+    the delta is appended to a ProgressJournal rather than dirtying the snapshot. The
+    snapshot notes the last journal record it includes. The journal is replayed and
+    compacted into the snapshot at startup and after every compaction_threshold records.
+
+    Given a ProfileDatabase, the store keeps a named profile there instead of the
+    settings file and journal: each change is queued on the save worker as an update
+    of that one database row.
+    """
+
+    __file_path: str = USER_SETTINGS_PATH
+    __legacy_path: str = LEGACY_USER_SETTINGS_PATH
+    __save_file: SaveFile = None
+    __data: Dict[str, Any] = None
+    __is_dirty: bool = False
+    __flush_interval: float = 5
+    __last_flush_time: float = 0
+    __save_worker: SaveWorker = None
+    __journal: ProgressJournal = None
+    __compaction_threshold: int = 100
+    __database: ProfileDatabase = None
+    __profile: str = ""
+
+    def __init__(
+        self,
+        file_path: str = USER_SETTINGS_PATH,
+        flush_interval: float = 5,
+        fsync_policy: str = "file",
+        journal_path: str = PROGRESS_JOURNAL_PATH,
+        compaction_threshold: int = 100,
+        database: ProfileDatabase = None,
+        profile: str = "",
+        legacy_path: str = LEGACY_USER_SETTINGS_PATH,
+    ) -> None:
+        """
+        Initializes the SettingsStore class and loads the settings file.
+
+        :param file_path: Path to the settings file.
+        :param flush_interval: Seconds between timed flushes.
+        :param fsync_policy: When saves are forced to disk, one of FSYNC_POLICIES from json_utility.
+        :param journal_path: Path to the progress journal file.
+        :param compaction_threshold: Journal records after which the journal is compacted.
+        :param database: Database to keep the profile in, or None to use the settings file.
+        :param profile: The profile name in the database.
+        :param legacy_path: Path to a JSON settings file of an older version of the
+            game, migrated if there is no settings file yet.
+        """
+        self.set_file_path(file_path)
+        self.set_legacy_path(legacy_path)
+        self.set_flush_interval(flush_interval)
+        self.set_compaction_threshold(compaction_threshold)
+        self.set_save_worker(SaveWorker(fsync_policy, write_save_file))
+        self.set_database(database)
+        self.set_profile(profile)
+        self.set_journal(
+            ProgressJournal(self.get_save_worker(), journal_path)
+            if database is None
+            else None
+        )
+        self.load()
+
+    def load(self) -> None:
+        """
+        Opens the settings file, upgrading it if it is from an older version, using the
+        default user data if there is no file, and compacts the progress journaled
+        since the file was saved into it. A database profile is loaded from the
+        database instead.
+        """
+        if self.get_database() is not None:
+            data = self.get_database().load_profile(self.get_profile())
+            self.set_is_dirty(data is None)
+            self.set_data(data if data is not None else copy.deepcopy(DEFAULT_USER_DATA))
+            # Create a new profile before any of its rows are updated
+            self.flush()
+            return
+
+        save_file = SaveFile(self.get_file_path(), self.get_legacy_path())
+        save_file.migrate()
+        self.set_save_file(save_file)
+        # Sections are decoded from the save file when first read
+        is_new = not save_file.get_section_names()
+        self.set_is_dirty(is_new)
+        self.set_data(copy.deepcopy(DEFAULT_USER_DATA) if is_new else {})
+        self.set_last_flush_time(time.monotonic())
+
+        # Replay the records the snapshot does not include yet
+        journal = self.get_journal()
+        snapshot_sequence = self.get("journal_sequence") or 0
+        for record in journal.read_records():
+            if record["seq"] > snapshot_sequence:
+                self.apply_delta(record["section"], record["key"], record["delta"])
+        journal.set_sequence(max(journal.get_sequence(), snapshot_sequence))
+        if journal.get_record_count() > 0:
+            self.compact()
+
+    def get(self, section: str) -> Any:
+        """
+        Gets a top-level setting, e.g. "xp" or "quest_progress".
+
+        :param section: The setting name.
+        :return: The setting value.
+        """
+        data = self.get_data()
+        if section not in data:
+            data[section] = self.load_section(section)
+        return data[section]
+
+    def __getitem__(self, section: str) -> Any:
+        """
+        Gets a top-level setting, so the store reads like the user data dictionary.
+
+        :param section: The setting name.
+        :return: The setting value.
+        """
+        return self.get(section)
+
+    def load_section(self, section: str) -> Any:
+        """
+        Decodes a setting from the settings file, falling back to the default user
+        data for a setting the file does not have.
+
+        :param section: The setting name.
+        :return: The setting value, or None if there is no such setting.
+        """
+        save_file = self.get_save_file()
+        if save_file is not None and save_file.has_section(section):
+            return save_file.load_section(section)
+        return copy.deepcopy(DEFAULT_USER_DATA.get(section))
+
+    def set(self, section: str, value: Any) -> None:
+        """
+        Sets a top-level setting, marking the store dirty if it changed.
+
+        :param section: The setting name.
+        :param value: The new value.
+        """
+        if self.get(section) != value:
+            self.get_data()[section] = value
+            self.save_value(section, "", value)
+
+    def set_entry(self, section: str, key: str, value: Any) -> None:
+        """
+        Sets one entry of a setting section, marking the store dirty if it changed.
+
+        :param section: The section name, e.g. "character_level".
+        :param key: The entry name, e.g. a character or quest name.
+        :param value: The new value.
+        """
+        entries = self.get(section)
+        if key not in entries or entries[key] != value:
+            entries[key] = value
+            self.save_value(section, key, value)
+
+    def save_value(self, section: str, key: str, value: Any) -> None:
+        """
+        Saves a changed setting: queued as a row update for a database profile,
+        otherwise left to the next flush by marking the store dirty.
+
+        :param section: The setting name.
+        :param key: The entry name within the section, or "" for a top-level setting.
+        :param value: The new value.
+        """
+        database = self.get_database()
+        if database is None:
+            self.set_is_dirty(True)
+            return
+        profile = self.get_profile()
+        value = copy.deepcopy(value)
+        self.get_save_worker().submit_task(
+            lambda: database.set_value(profile, section, key, value)
+        )
+
+    def add(self, section: str, delta: int, key: str = "") -> None:
+        """
+        Adds to a counter setting, journaling the change instead of dirtying the settings.
+
+        :param section: The setting name, e.g. "xp" or "quest_progress".
+        :param delta: The amount to add, negative to subtract.
+        :param key: The entry name within the section, or "" for a top-level setting.
+        """
+        self.apply_delta(section, key, delta)
+        database = self.get_database()
+        if database is not None:
+            profile = self.get_profile()
+            self.get_save_worker().submit_task(
+                lambda: database.add_value(profile, section, key, delta)
+            )
+            return
+        sequence = self.get_journal().append(section, key, delta)
+        if (
+            sequence - (self.get("journal_sequence") or 0)
+            >= self.get_compaction_threshold()
+        ):
+            self.compact()
+
+    def apply_delta(self, section: str, key: str, delta: int) -> None:
+        """
+        Adds to a counter setting in memory.
+
+        :param section: The setting name.
+        :param key: The entry name within the section, or "" for a top-level setting.
+        :param delta: The amount to add.
+        """
+        if key == "":
+            self.get_data()[section] = self.get(section) + delta
+        else:
+            entries = self.get(section)
+            entries[key] = entries.get(key, 0) + delta
+
+    def compact(self) -> None:
+        """
+        Saves a snapshot including every journaled change, which then trims the journal.
+        """
+        self.set_is_dirty(True)
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Queues the settings to be written to the settings file if they changed since
+        the last flush. The write happens on the save worker's thread.
+        """
+        self.set_last_flush_time(time.monotonic())
+        if not self.get_is_dirty():
+            return
+        database = self.get_database()
+        if database is not None:
+            profile = self.get_profile()
+            snapshot = copy.deepcopy(self.get_data())
+            self.get_save_worker().submit_task(
+                lambda: database.save_profile(profile, snapshot)
+            )
+            self.set_is_dirty(False)
+            return
+        # The snapshot includes every journaled change so far, which the journal can
+        # drop once it is written
+        journal = self.get_journal()
+        sequence = journal.get_sequence()
+        self.get_data()["journal_sequence"] = sequence
+        # The worker gets its own copy, the in-memory settings keep changing. Sections
+        # never read are passed on still encoded, as they were saved
+        sections: Dict[str, Any] = dict(self.get_save_file().get_payloads())
+        sections.update(copy.deepcopy(self.get_data()))
+        self.get_save_worker().submit(
+            self.get_file_path(), sections, lambda: journal.truncate(sequence)
+        )
+        self.set_is_dirty(False)
+
+    def flush_if_due(self) -> None:
+        """
+        Flushes the settings if the flush interval has passed since the last flush.
+        """
+        if time.monotonic() - self.get_last_flush_time() >= self.get_flush_interval():
+            self.flush()
+
+    def reset(self) -> None:
+        """
+        Replaces the settings with the default user data and waits until they are written.
+        """
+        self.set_data(copy.deepcopy(DEFAULT_USER_DATA))
+        if self.get_save_file() is not None:
+            self.get_save_file().set_payloads({})
+        self.set_is_dirty(True)
+        self.flush()
+        self.get_save_worker().wait()
+
+    def close(self) -> None:
+        """
+        Writes any unsaved settings and stops the save worker, waiting for it to finish.
+        """
+        self.flush()
+        self.get_save_worker().stop()
+        if self.get_journal() is not None:
+            self.get_journal().close()
+        if self.get_database() is not None:
+            self.get_database().close()
+
+    # Getters and setters with docstrings
+
+    def get_file_path(self) -> str:
+        """
+        Gets the path to the settings file.
+
+        :return: The settings file path.
+        """
+        return self.__file_path
+
+    def set_file_path(self, file_path: str) -> None:
+        """
+        Sets the path to the settings file.
+
+        :param file_path: The new settings file path.
+        """
+        self.__file_path = file_path
+
+    def get_legacy_path(self) -> str:
+        """
+        Gets the path to the JSON settings file of an older version of the game.
+
+        :return: The legacy settings file path.
+        """
+        return self.__legacy_path
+
+    def set_legacy_path(self, legacy_path: str) -> None:
+        """
+        Sets the path to the JSON settings file of an older version of the game.
+
+        :param legacy_path: The new legacy settings file path.
+        """
+        self.__legacy_path = legacy_path
+
+    def get_save_file(self) -> SaveFile:
+        """
+        Gets the settings file the sections are decoded from.
+
+        :return: The save file, or None for a database profile.
+        """
+        return self.__save_file
+
+    def set_save_file(self, save_file: SaveFile) -> None:
+        """
+        Sets the settings file the sections are decoded from.
+
+        :param save_file: The new save file, or None for a database profile.
+        """
+        self.__save_file = save_file
+
+    def get_data(self) -> Dict[str, Any]:
+        """
+        Gets the in-memory settings. Sections of the settings file not read yet are
+        left out, use get to read a setting.
+
+        :return: The settings dictionary.
+        """
+        return self.__data
+
+    def set_data(self, data: Dict[str, Any]) -> None:
+        """
+        Sets the in-memory settings.
+
+        :param data: The new settings dictionary.
+        """
+        self.__data = data
+
+    def get_is_dirty(self) -> bool:
+        """
+        Checks if the settings changed since the last flush.
+
+        :return: True if there are unsaved changes, False otherwise.
+        """
+        return self.__is_dirty
+
+    def set_is_dirty(self, is_dirty: bool) -> None:
+        """
+        Sets whether the settings changed since the last flush.
+
+        :param is_dirty: True if there are unsaved changes, False otherwise.
+        """
+        self.__is_dirty = is_dirty
+
+    def get_flush_interval(self) -> float:
+        """
+        Gets the time between timed flushes.
+
+        :return: The flush interval in seconds.
+        """
+        return self.__flush_interval
+
+    def set_flush_interval(self, flush_interval: float) -> None:
+        """
+        Sets the time between timed flushes.
+
+        :param flush_interval: The new flush interval in seconds.
+        """
+        self.__flush_interval = flush_interval
+
+    def get_last_flush_time(self) -> float:
+        """
+        Gets the monotonic time of the last flush.
+
+        :return: The last flush time in seconds.
+        """
+        return self.__last_flush_time
+
+    def set_last_flush_time(self, last_flush_time: float) -> None:
+        """
+        Sets the monotonic time of the last flush.
+
+        :param last_flush_time: The new last flush time in seconds.
+        """
+        self.__last_flush_time = last_flush_time
+
+    def get_save_worker(self) -> SaveWorker:
+        """
+        Gets the worker writing the settings file.
+
+        :return: The save worker.
+        """
+        return self.__save_worker
+
+    def set_save_worker(self, save_worker: SaveWorker) -> None:
+        """
+        Sets the worker writing the settings file.
+
+        :param save_worker: The new save worker.
+        """
+        self.__save_worker = save_worker
+
+    def get_journal(self) -> ProgressJournal:
+        """
+        Gets the journal of counter changes.
+
+        :return: The progress journal.
+        """
+        return self.__journal
+
+    def set_journal(self, journal: ProgressJournal) -> None:
+        """
+        Sets the journal of counter changes.
+
+        :param journal: The new progress journal.
+        """
+        self.__journal = journal
+
+    def get_compaction_threshold(self) -> int:
+        """
+        Gets the number of journal records after which the journal is compacted.
+
+        :return: The compaction threshold.
+        """
+        return self.__compaction_threshold
+
+    def set_compaction_threshold(self, compaction_threshold: int) -> None:
+        """
+        Sets the number of journal records after which the journal is compacted.
+
+        :param compaction_threshold: The new compaction threshold.
+        """
+        self.__compaction_threshold = compaction_threshold
+
+    def get_database(self) -> ProfileDatabase:
+        """
+        Gets the database the profile is kept in.
+
+        :return: The profile database, or None if the settings file is used.
+        """
+        return self.__database
+
+    def set_database(self, database: ProfileDatabase) -> None:
+        """
+        Sets the database the profile is kept in.
+
+        :param database: The profile database, or None to use the settings file.
+        """
+        self.__database = database
+
+    def get_profile(self) -> str:
+        """
+        Gets the profile name in the database.
+
+        :return: The profile name.
+        """
+        return self.__profile
+
+    def set_profile(self, profile: str) -> None:
+        """
+        Sets the profile name in the database.
+
+        :param profile: The new profile name.
+        """
+        self.__profile = profile
+
+
+# The store shared by the whole game, loaded on first use
+_settings_store: SettingsStore = None
+
+
+def open_settings_store(
+    profile: str = None, database_path: str = PROFILE_DATABASE_PATH
+) -> SettingsStore:
+    """
+    Opens the store shared by the whole game, on a named profile of the profile
+    database or on the user settings file. Must be called before the store is first used.
+
+    :param profile: The profile name, or None to use the user settings file.
+    :param database_path: Path to the profile database.
+    :return: The shared settings store.
+    """
+    global _settings_store
+    if profile is None:
+        _settings_store = SettingsStore()
+    else:
+        _settings_store = SettingsStore(
+            database=ProfileDatabase(database_path), profile=profile
+        )
+    return _settings_store
+
+
+def get_settings_store() -> SettingsStore:
+    """
+    Gets the store shared by the whole game, loading the settings file on first use.
+
+    :return: The shared settings store.
+    """
+    global _settings_store
+    if _settings_store is None:
+        _settings_store = SettingsStore()
+    return _settings_store
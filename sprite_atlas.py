@@ -0,0 +1,172 @@
+import argparse
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+import pygame
+
+BASE_IMG_PATH = "assets/"
+
+# Folders holding one subfolder per character, each with a folder per animation
+CHARACTER_FOLDERS: Tuple[str, ...] = (
+    "characters/players",
+    "characters/enemies",
+    "characters/npcs",
+)
+
+# Files written next to a character's animation folders
+ATLAS_IMAGE_NAME = "atlas.png"
+ATLAS_TABLE_NAME = "atlas.json"
+
+# Widest an atlas gets before frames wrap onto a new shelf, in pixels
+MAX_ATLAS_WIDTH = 1024
+
+# Frame position and size in an atlas, as (x, y, width, height)
+FrameRect = Tuple[int, int, int, int]
+
+# Source frame file name, size and modification time in nanoseconds
+FrameSource = Tuple[str, int, int]
+
+# Atlas tables read so far by character folder, None if the folder has no atlas
+_atlas_tables: Dict[str, Optional[Dict[str, List[FrameRect]]]] = {}
+
+
+def pack_frames(
+    sizes: List[Tuple[int, int]], max_width: int = MAX_ATLAS_WIDTH
+) -> Tuple[List[FrameRect], Tuple[int, int]]:
+    """
+    Places frames on shelves, tallest first, each shelf as high as its tallest frame.
+
+    :param sizes: The frame sizes.
+    :param max_width: The widest a shelf gets, unless a single frame is wider.
+    :return: The frame rects, in the order of the sizes, and the atlas size.
+    """
+    rects: List[FrameRect] = [(0, 0, 0, 0)] * len(sizes)
+    x = y = shelf_height = atlas_width = 0
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        width, height = sizes[index]
+        if x > 0 and x + width > max_width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        rects[index] = (x, y, width, height)
+        x += width
+        shelf_height = max(shelf_height, height)
+        atlas_width = max(atlas_width, x)
+    return rects, (atlas_width, y + shelf_height)
+
+
+def stat_sources(animation_path: str) -> List[FrameSource]:
+    """
+    Lists the frame files of an animation with their sizes and modification times,
+    which change whenever a frame is added, removed, renamed or edited.
+
+    :param animation_path: Path to the animation folder.
+    :return: The frame sources, in file name order.
+    """
+    sources: List[FrameSource] = []
+    for img_name in sorted(os.listdir(animation_path)):
+        stat = os.stat(animation_path + "/" + img_name)
+        sources.append((img_name, stat.st_size, stat.st_mtime_ns))
+    return sources
+
+
+def pack_character(folder: str, max_width: int = MAX_ATLAS_WIDTH) -> int:
+    """
+    Packs every animation frame of a character into one atlas image and writes the
+    frame table beside it, with the size and modification time of every source
+    frame. Frames are copied exactly, alpha included.
+
+    :param folder: The character folder, relative to the assets folder.
+    :param max_width: The widest the atlas gets, unless a single frame is wider.
+    :return: The number of frames packed.
+    """
+    frames: List[Tuple[str, pygame.Surface]] = []
+    sources: Dict[str, List[FrameSource]] = {}
+    for animation in sorted(os.listdir(BASE_IMG_PATH + folder)):
+        animation_path = BASE_IMG_PATH + folder + "/" + animation
+        if not os.path.isdir(animation_path):
+            continue
+        sources[animation] = stat_sources(animation_path)
+        for img_name, _, _ in sources[animation]:
+            frames.append(
+                (animation, pygame.image.load(animation_path + "/" + img_name))
+            )
+    rects, atlas_size = pack_frames(
+        [frame.get_size() for _, frame in frames], max_width
+    )
+
+    atlas = pygame.Surface(atlas_size, pygame.SRCALPHA)
+    table: Dict[str, List[FrameRect]] = {}
+    for (animation, frame), rect in zip(frames, rects):
+        # Taking the maximum over the transparent atlas copies the pixels unblended
+        atlas.blit(frame, rect[:2], special_flags=pygame.BLEND_RGBA_MAX)
+        table.setdefault(animation, []).append(rect)
+    pygame.image.save(atlas, BASE_IMG_PATH + folder + "/" + ATLAS_IMAGE_NAME)
+    with open(BASE_IMG_PATH + folder + "/" + ATLAS_TABLE_NAME, "w") as file:
+        json.dump({"animations": table, "sources": sources}, file, indent=4)
+    return len(frames)
+
+
+def read_atlas_table(folder: str) -> Optional[Dict[str, List[FrameRect]]]:
+    """
+    Reads the frame table of a character's atlas, once per folder. Animations whose
+    frames changed since the atlas was packed are left out, so they are loaded frame
+    by frame until the atlas is packed again.
+
+    :param folder: The character folder, relative to the assets folder.
+    :return: The frame rects by animation name, or None if the folder has no atlas.
+    """
+    if folder not in _atlas_tables:
+        table_path = BASE_IMG_PATH + folder + "/" + ATLAS_TABLE_NAME
+        table = None
+        if os.path.exists(table_path) and os.path.exists(
+            BASE_IMG_PATH + folder + "/" + ATLAS_IMAGE_NAME
+        ):
+            with open(table_path) as file:
+                atlas_table = json.load(file)
+            # Tables packed before sources were recorded count as changed
+            sources = atlas_table.get("sources", {})
+            table = {}
+            for animation, rects in atlas_table["animations"].items():
+                animation_path = BASE_IMG_PATH + folder + "/" + animation
+                try:
+                    is_unchanged = stat_sources(animation_path) == [
+                        tuple(source) for source in sources.get(animation, [])
+                    ]
+                except OSError:
+                    is_unchanged = False
+                if is_unchanged:
+                    table[animation] = [tuple(rect) for rect in rects]
+        _atlas_tables[folder] = table
+    return _atlas_tables[folder]
+
+
+def find_atlas(path: str) -> Optional[Tuple[str, List[FrameRect]]]:
+    """
+    Finds the atlas holding the frames of an animation folder.
+
+    :param path: The animation folder, relative to the assets folder, e.g.
+        "characters/players/warrior/idle".
+    :return: The path to the atlas image and the animation's frame rects, in file
+        name order, or None if the animation is not packed.
+    """
+    folder, animation = os.path.split(path)
+    table = read_atlas_table(folder)
+    if table is None or animation not in table:
+        return None
+    return BASE_IMG_PATH + folder + "/" + ATLAS_IMAGE_NAME, table[animation]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Pack each character's animation frames into one atlas image."
+    )
+    parser.add_argument(
+        "--max-width", type=int, default=MAX_ATLAS_WIDTH, help="atlas width in pixels"
+    )
+    args = parser.parse_args()
+
+    for character_folder in CHARACTER_FOLDERS:
+        for character in sorted(os.listdir(BASE_IMG_PATH + character_folder)):
+            folder = character_folder + "/" + character
+            if not os.path.isdir(BASE_IMG_PATH + folder):
+                continue
+            print(f"{folder}: {pack_character(folder, args.max_width)} frames")
@@ -0,0 +1,89 @@
+from typing import Dict, List, Tuple
+
+# Fixed schema of every character stat, in storage order
+STAT_NAMES: List[str] = [
+    "health_points",
+    "physical_defense",
+    "magical_defense",
+    "spell_power",
+    "physical_power",
+    "health_regeneration",
+    "mana_regeneration",
+    "mana_points",
+    "physical_damage",
+    "magical_damage",
+    "absorption",
+]
+
+
+class StatBlock:
+    """
+    StatBlock class holding a character's stats in a fixed schema.
+
+    Every stat in STAT_NAMES is a slot that always exists and defaults to 0, so stats
+    are read and written as plain attributes (e.g. stats.health_points) without
+    key-existence checks. Stats only known by name at runtime, such as ability
+    modifiers, go through get and set.
+    """
+
+    __slots__ = tuple(STAT_NAMES)
+
+    def __init__(self, stats: Dict[str, int] = None) -> None:
+        """
+        Initializes the StatBlock class.
+
+        :param stats: Initial stat values by name, stats left out are 0.
+        """
+        for stat_name in STAT_NAMES:
+            setattr(self, stat_name, 0)
+        if stats is not None:
+            for stat_name, value in stats.items():
+                self.set(stat_name, value)
+
+    def copy(self) -> "StatBlock":
+        """
+        Creates a copy of the stats.
+
+        :return: A new StatBlock with the same values.
+        """
+        stat_block = StatBlock.__new__(StatBlock)
+        for stat_name in STAT_NAMES:
+            setattr(stat_block, stat_name, getattr(self, stat_name))
+        return stat_block
+
+    def get(self, stat_name: str) -> int:
+        """
+        Gets a stat by name.
+
+        :param stat_name: The stat name, one of STAT_NAMES.
+        :return: The stat value.
+        """
+        return getattr(self, stat_name)
+
+    def set(self, stat_name: str, value: int) -> None:
+        """
+        Sets a stat by name.
+
+        :param stat_name: The stat name, one of STAT_NAMES.
+        :param value: The new stat value.
+        """
+        setattr(self, stat_name, value)
+
+    def items(self) -> List[Tuple[str, int]]:
+        """
+        Gets every stat in schema order.
+
+        :return: A list of (stat name, value) pairs.
+        """
+        return [(stat_name, getattr(self, stat_name)) for stat_name in STAT_NAMES]
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Converts the stats to a dictionary.
+
+        :return: A dictionary of every stat by name.
+        """
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return f"StatBlock({self.to_dict()})"
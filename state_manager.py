@@ -1,4 +1,7 @@
-import copy
+import time
+from asset_prefetcher import get_asset_prefetcher
+from frame_profiler import FrameProfiler
+from settings_store import get_settings_store
 
 
 class GameStateManager:
@@ -8,6 +11,7 @@ class GameStateManager:
 
     __active_state = None
     __states = {}
+    __frame_profiler: FrameProfiler = None
 
     def __init__(self) -> None:
         """
@@ -36,33 +40,64 @@ class GameStateManager:
         """
         # Check if there is an active state
         if self.get_active_state() is not None:
+            state_name = self.get_active_state().get_state_name()
             # Handle events for the active state
+            started_ns = time.perf_counter_ns()
             self.get_active_state().handle_events()
+            events_done_ns = time.perf_counter_ns()
             # Run the logic for the active state
             self.get_active_state().run()
+            run_done_ns = time.perf_counter_ns()
             # Render the active state
             self.get_active_state().render(time_delta)
+            render_done_ns = time.perf_counter_ns()
             # Reset event polling to prepare for the next frame
             self.get_active_state().reset_event_polling()
 
+            if self.get_frame_profiler() is not None:
+                self.get_frame_profiler().record(
+                    state_name, "handle_events", events_done_ns - started_ns
+                )
+                self.get_frame_profiler().record(
+                    state_name, "run", run_done_ns - events_done_ns
+                )
+                self.get_frame_profiler().record(
+                    state_name, "render", render_done_ns - run_done_ns
+                )
+                self.get_frame_profiler().draw_overlay(
+                    self.get_active_state().get_screen(), state_name
+                )
+
             # Check if a state transition is required
             if self.get_active_state().get_time_to_transition():
+                transition_started_ns = time.perf_counter_ns()
                 # Reset the transition flag
                 self.get_active_state().set_time_to_transition(False)
                 # Get the name of the target state for the transition
                 new_state_name = self.get_active_state().get_target_state_name()
-                # End the current state
-                self.get_active_state().end()
-                # Make a deep copy of the outgoing transition data
-                outgoing_data_copy = copy.deepcopy(
+                # End the current state, or suspend it in retained UI mode
+                self.get_active_state().leave()
+                # Save the settings changed in the state that just ended
+                get_settings_store().flush()
+                # The outgoing transition message is immutable, so it is handed over
+                # as is rather than copied
+                transition_message = (
                     self.get_active_state().get_outgoing_transition_data()
                 )
                 # Set the new active state
                 self.set_active_state(self.get_states()[new_state_name])
-                # Pass the transition data to the new active state
-                self.get_active_state().set_incoming_transition_data(outgoing_data_copy)
-                # Start the new active state
-                self.get_active_state().start()
+                # Pass the transition message to the new active state
+                self.get_active_state().set_incoming_transition_data(transition_message)
+                # Start the new active state, or resume it in retained UI mode
+                self.get_active_state().enter()
+                # Warm the assets of the state likely to come next
+                self.prefetch_successor()
+                if self.get_frame_profiler() is not None:
+                    self.get_frame_profiler().record(
+                        new_state_name,
+                        "transition",
+                        time.perf_counter_ns() - transition_started_ns,
+                    )
 
             # Check if the application should quit
             if self.get_active_state().get_time_to_quit_app():
@@ -81,7 +116,31 @@ class GameStateManager:
             # Set the active state to the initial state
             self.set_active_state(self.get_states()[initial_state_name])
             # Start the initial state
-            self.get_active_state().start()
+            self.get_active_state().enter()
+            self.prefetch_successor()
+
+    def prefetch(self, state_name: str, transition_message) -> None:
+        """
+        Starts decoding the assets a state loads when entered with a transition
+        message, on the asset prefetcher's worker thread.
+
+        :param state_name: The name of the state.
+        :param transition_message: The message the state would be entered with.
+        """
+        if state_name in self.get_states():
+            get_asset_prefetcher().prefetch_all(
+                self.get_states()[state_name].get_prefetch_folders(transition_message)
+            )
+
+    def prefetch_successor(self) -> None:
+        """
+        Starts decoding the assets of the active state's target state, as entered with
+        the active state's current outgoing transition message.
+        """
+        self.prefetch(
+            self.get_active_state().get_target_state_name(),
+            self.get_active_state().get_outgoing_transition_data(),
+        )
 
     # Getters and setters with docstrings
 
@@ -116,3 +175,19 @@ class GameStateManager:
         :param states: The new dictionary of registered states.
         """
         self.__states = states
+
+    def get_frame_profiler(self) -> FrameProfiler:
+        """
+        Gets the profiler timing each phase of a frame.
+
+        :return: The frame profiler, or None if frames are not profiled.
+        """
+        return self.__frame_profiler
+
+    def set_frame_profiler(self, frame_profiler: FrameProfiler) -> None:
+        """
+        Sets the profiler timing each phase of a frame.
+
+        :param frame_profiler: The new frame profiler, or None to stop profiling.
+        """
+        self.__frame_profiler = frame_profiler
@@ -1,5 +1,6 @@
 import abc
 from state_manager import GameStateManager
+from transition_messages import TransitionMessage
 import pygame
 import pygame_gui
 
@@ -15,10 +16,12 @@ class BaseState(abc.ABC):
         ui_manager (pygame_gui.UIManager): Manages UI elements for the state.
         target_state_name (str): The name of the target state to transition to.
         state_name (str): The name of the current state.
-        outgoing_transition_data (dict): Data to pass to the next state during transition.
-        incoming_transition_data (dict): Data received from the previous state during transition.
+        outgoing_transition_data (TransitionMessage): Message to pass to the next state during transition.
+        incoming_transition_data (TransitionMessage): Message received from the previous state during transition.
         time_to_quit_app (bool): Flag to indicate if it's time to quit the application.
         time_to_transition (bool): Flag to indicate if it's time to transition to another state.
+        retain_ui (bool): Flag to keep the state's UI between visits, hidden, instead of rebuilding it.
+        is_ui_built (bool): Flag to indicate if the state's UI exists, either shown or suspended.
     """
 
     __target_state_name: str = ""
@@ -26,10 +29,12 @@ class BaseState(abc.ABC):
     __screen: pygame.Surface = None
     __game_state_manager: GameStateManager = None
     __ui_manager: pygame_gui.UIManager = None
-    __outgoing_transition_data: dict = {}
-    __incoming_transition_data: dict = {}
+    __outgoing_transition_data: TransitionMessage = None
+    __incoming_transition_data: TransitionMessage = None
     __time_to_quit_app: bool = False
     __time_to_transition: bool = False
+    __retain_ui: bool = False
+    __is_ui_built: bool = False
 
     def __init__(
         self,
@@ -62,6 +67,69 @@ class BaseState(abc.ABC):
         """
         self.set_time_to_transition(True)
 
+    def enter(self) -> None:
+        """
+        Enters the state, resuming its suspended UI in retained UI mode and starting
+        it otherwise.
+        """
+        if self.get_retain_ui() and self.get_is_ui_built():
+            self.resume()
+        else:
+            self.start()
+            self.set_is_ui_built(True)
+
+    def leave(self) -> None:
+        """
+        Leaves the state, suspending it in retained UI mode and ending it otherwise.
+        """
+        if self.get_retain_ui():
+            self.suspend()
+        else:
+            self.end()
+            self.set_is_ui_built(False)
+
+    def suspend(self) -> None:
+        """
+        Suspends the state in retained UI mode. States that can keep their UI hide it
+        here, to be shown again by resume. By default the state ends instead, and is
+        started again when entered.
+        """
+        self.end()
+        self.set_is_ui_built(False)
+
+    def resume(self) -> None:
+        """
+        Resumes a state whose UI was kept by suspend, showing it again and refreshing
+        the data it displays.
+        """
+        self.start()
+
+    def get_prefetch_folders(self, transition_message: TransitionMessage) -> list[str]:
+        """
+        Lists the image folders the state loads when entered with a transition message,
+        so they can be decoded ahead of the transition. States loading none return an
+        empty list.
+
+        :param transition_message: The message the state would be entered with.
+        :return: The folders, relative to the assets folder.
+        """
+        return []
+
+    def hint_successor(
+        self, transition_message: TransitionMessage, state_name: str = None
+    ) -> None:
+        """
+        Hints that the state will likely move on to a successor with a transition
+        message, so the successor's assets are decoded in the background.
+
+        :param transition_message: The message the successor would be entered with.
+        :param state_name: The successor's name, or None for the target state.
+        """
+        self.get_game_state_manager().prefetch(
+            state_name if state_name is not None else self.get_target_state_name(),
+            transition_message,
+        )
+
     @abc.abstractmethod
     def start(self):
         """
@@ -186,38 +254,74 @@ class BaseState(abc.ABC):
         """
         self.__target_state_name = target_state_name
 
-    def get_outgoing_transition_data(self) -> dict:
+    def get_outgoing_transition_data(self) -> TransitionMessage:
         """
-        Gets the outgoing transition data.
+        Gets the outgoing transition message.
 
-        :return: The outgoing transition data.
+        :return: The outgoing transition message, or None.
         """
         return self.__outgoing_transition_data
 
-    def set_outgoing_transition_data(self, outgoing_transition_data: dict) -> None:
+    def set_outgoing_transition_data(
+        self, outgoing_transition_data: TransitionMessage
+    ) -> None:
         """
-        Sets the outgoing transition data.
+        Sets the outgoing transition message.
 
-        :param outgoing_transition_data: The outgoing transition data to set.
+        :param outgoing_transition_data: The outgoing transition message, or None.
         """
         self.__outgoing_transition_data = outgoing_transition_data
 
-    def get_incoming_transition_data(self) -> dict:
+    def get_incoming_transition_data(self) -> TransitionMessage:
         """
-        Gets the incoming transition data.
+        Gets the incoming transition message.
 
-        :return: The incoming transition data.
+        :return: The incoming transition message, or None.
         """
         return self.__incoming_transition_data
 
-    def set_incoming_transition_data(self, incoming_transition_data: dict) -> None:
+    def set_incoming_transition_data(
+        self, incoming_transition_data: TransitionMessage
+    ) -> None:
         """
-        Sets the incoming transition data.
+        Sets the incoming transition message.
 
-        :param incoming_transition_data: The incoming transition data to set.
+        :param incoming_transition_data: The incoming transition message, or None.
         """
         self.__incoming_transition_data = incoming_transition_data
 
+    def get_retain_ui(self) -> bool:
+        """
+        Checks if the state keeps its UI between visits.
+
+        :return: True in retained UI mode, False otherwise.
+        """
+        return self.__retain_ui
+
+    def set_retain_ui(self, retain_ui: bool) -> None:
+        """
+        Sets whether the state keeps its UI between visits.
+
+        :param retain_ui: True for retained UI mode, False otherwise.
+        """
+        self.__retain_ui = retain_ui
+
+    def get_is_ui_built(self) -> bool:
+        """
+        Checks if the state's UI exists, either shown or suspended.
+
+        :return: True if the UI is built, False otherwise.
+        """
+        return self.__is_ui_built
+
+    def set_is_ui_built(self, is_ui_built: bool) -> None:
+        """
+        Sets whether the state's UI exists.
+
+        :param is_ui_built: True if the UI is built, False otherwise.
+        """
+        self.__is_ui_built = is_ui_built
+
     def set_time_to_quit_app(self, time_to_quit_app: bool) -> None:
         """
         Sets the flag indicating it's time to quit the application.
@@ -4,6 +4,8 @@ from pygame_gui.elements import UIButton, UIImage, UITextBox, UIPanel
 from pygame_gui.core import ObjectID
 from state_manager import GameStateManager
 from characters.players.base_player import BasePlayer
+from transition_messages import PlayerSelected
+from surface_cache import get_surface_cache
 from xp import XP
 from typing import Any
 from gui.ability_hud import AbilityHUD
@@ -106,11 +108,12 @@ class CharacterSelectionMenu(BaseState):
                     (0, -75),
                     (self.get_screen().height * 0.8, self.get_screen().width * 0.48),
                 ),
-                image_surface=pygame.image.load(
+                image_surface=get_surface_cache().load(
                     self.get_characters()[
                         self.get_selection_page()
-                    ].get_sprite_location()
-                ).convert_alpha(),
+                    ].get_sprite_location(),
+                    convert="convert_alpha",
+                ),
                 manager=self.get_ui_manager(),
                 anchors=({"center": "center"}),
                 container=self.get_character_picture_panel(),
@@ -390,9 +393,9 @@ class CharacterSelectionMenu(BaseState):
         """
         if self.get_navigate_level_selection():
             # If the player has selected to navigate to the level selection screen,
-            # set the outgoing transition data with the current player and trigger the transition.
+            # send a copy of the current player and trigger the transition.
             self.set_outgoing_transition_data(
-                {"player": self.get_characters()[self.get_selection_page()].copy()}
+                PlayerSelected(self.get_characters()[self.get_selection_page()].copy())
             )
             self.set_time_to_transition(True)
             return
@@ -482,10 +485,11 @@ class CharacterSelectionMenu(BaseState):
 
         if (
             self.get_purchase_ability()
-            and self.get_characters()[self.get_selection_page()].get_abilities()[2]
-            not in self.get_characters()[
+            and not self.get_characters()[
                 self.get_selection_page()
-            ].get_unlocked_abilities()
+            ].has_unlocked_ability(
+                self.get_characters()[self.get_selection_page()].get_abilities()[2]
+            )
         ):
             # If the ability is purchased and it is not already unlocked,
             # open the ability purchase panel.
@@ -565,11 +569,12 @@ class CharacterSelectionMenu(BaseState):
 
             # Update the character picture in the HUD
             self.get_character_picture().set_image(
-                pygame.image.load(
+                get_surface_cache().load(
                     self.get_characters()[
                         self.get_selection_page()
-                    ].get_sprite_location()
-                ).convert_alpha()
+                    ].get_sprite_location(),
+                    convert="convert_alpha",
+                )
             )
 
             # Update the text and style of the upgrade button based on character level
@@ -618,6 +623,25 @@ class CharacterSelectionMenu(BaseState):
         self.set_update_GUI(False)
         self.set_navigate_level_selection(False)
 
+    def suspend(self) -> None:
+        """
+        Suspends the character selection menu in retained UI mode by hiding its UI.
+        """
+        self.get_character_picture_panel().hide()
+        self.get_character_info_panel().hide()
+        self.get_ability_menu().hide()
+        [upgrade_panel.hide() for upgrade_panel in self.get_upgrade_character_panel()]
+        self.get_screen().fill((0, 0, 0))
+
+    def resume(self) -> None:
+        """
+        Resumes the character selection menu by showing its UI again, refreshing the
+        selected character's details on the next render.
+        """
+        self.get_character_picture_panel().show()
+        self.get_character_info_panel().show()
+        self.set_update_GUI(True)
+
     def end(self) -> None:
         """
         Ends the character selection menu by killing all UI elements.
@@ -5,6 +5,7 @@ import pygame_gui
 from pygame_gui.elements import UIButton, UITextBox
 from pygame_gui.core import ObjectID
 from xp import XP
+from surface_cache import get_surface_cache
 import random
 
 
@@ -48,13 +49,10 @@ class EndMenu(BaseState):
         """
         Starts the end menu by setting up UI elements and background image.
         """
-        # Set the outgoing transition data to be the same as the incoming transition data
-        self.set_outgoing_transition_data(self.get_incoming_transition_data())
-
         # Load and scale the background image to fit the screen size
         self.set_background_image(
-            pygame.transform.scale(
-                pygame.image.load("assets/background_image.png"),
+            get_surface_cache().load(
+                "assets/background_image.png",
                 (self.get_screen().get_width(), self.get_screen().get_height()),
             )
         )
@@ -86,12 +84,12 @@ class EndMenu(BaseState):
         )
 
         # Check the winner from the incoming transition data
-        if self.get_incoming_transition_data()["winner"] == "enemy":
+        if self.get_incoming_transition_data().winner == "enemy":
             # If the enemy won, update the heading to "You Lost!"
             self.get_game_heading().set_text("You Lost!")
 
             # Check if the quest was completed
-            if "temp_quest_completion" in self.get_incoming_transition_data().keys():
+            if self.get_incoming_transition_data().temp_quest_completion is not None:
                 # If the quest was completed, update the description and add quest XP
                 self.get_game_description().set_text(
                     f"Better luck next time!\nHowever, you did complete the quest.\nYou earned {xp_quest} XP!"
@@ -107,7 +105,7 @@ class EndMenu(BaseState):
             self.get_xp().gain_xp(xp_won)
 
             # Check if the quest was completed
-            if "temp_quest_completion" in self.get_incoming_transition_data().keys():
+            if self.get_incoming_transition_data().temp_quest_completion is not None:
                 # If the quest was completed, update the description and add quest XP
                 self.get_game_description().set_text(
                     f"You have gained {xp_won} XP for beating the boss!\nAlso, you did complete the quest.\nYou earned an additional {xp_quest} XP!"
@@ -119,13 +117,6 @@ class EndMenu(BaseState):
                     f"You have gained {xp_won} XP for beating the boss!\nUnfortunately, you did fail the quest master's quest!"
                 )
 
-        # Prepare outgoing transition data by removing "winner" and "temp_quest_completion" keys
-        outgoing_dict_without_winner_key = self.get_incoming_transition_data()
-        del outgoing_dict_without_winner_key["winner"]
-        if "temp_quest_completion" in outgoing_dict_without_winner_key.keys():
-            del outgoing_dict_without_winner_key["temp_quest_completion"]
-        self.set_outgoing_transition_data(outgoing_dict_without_winner_key)
-
         # Create the button to navigate back to the start menu
         self.set_navigate_start_menu_button(
             UIButton(
@@ -154,15 +145,8 @@ class EndMenu(BaseState):
         Runs the logic for the end menu, such as navigating to the start menu.
         """
         if self.get_navigate_start_menu():
-            # Retrieve the current outgoing transition data
-            outgoing_dict_without_character_keys = self.get_outgoing_transition_data()
-
-            # Remove the "player" and "enemy" keys from the transition data
-            del outgoing_dict_without_character_keys["player"]
-            del outgoing_dict_without_character_keys["enemy"]
-
-            # Set the updated transition data without the "player" and "enemy" keys
-            self.set_outgoing_transition_data(outgoing_dict_without_character_keys)
+            # The start menu needs nothing from the fight
+            self.set_outgoing_transition_data(None)
 
             # Indicate that it's time to transition to the next state
             self.set_time_to_transition(True)
@@ -4,6 +4,8 @@ import pygame, pygame_gui
 from pygame_gui.elements import UIButton, UIImage, UITextBox, UIPanel
 from pygame_gui.core import ObjectID
 from characters.enemies.base_enemy import BaseEnemy
+from transition_messages import FightStarted
+from surface_cache import get_surface_cache
 from utilities.general_utility import convert_snake_to_title
 
 FIRST_COLUMN_STAT_NAMES: list[str] = [
@@ -76,10 +78,12 @@ class LevelSelectionMenu(BaseState):
         Starts the level selection menu by setting up UI elements and background image.
         """
         self.set_outgoing_transition_data(self.get_incoming_transition_data())
+        # Aim at the fight again after a hop to another menu, so it is prefetched
+        self.set_target_state_name("turn_based_fight")
 
         self.set_background_image(
-            pygame.transform.scale(
-                pygame.image.load("assets/background_image.png"),
+            get_surface_cache().load(
+                "assets/background_image.png",
                 (self.get_screen().get_width(), self.get_screen().get_height()),
             )
         )
@@ -206,9 +210,10 @@ class LevelSelectionMenu(BaseState):
         self.set_enemy_icon(
             UIImage(
                 pygame.Rect((0, 100), (100, 100)),
-                pygame.image.load(
-                    self.get_enemies()[0].get_sprite_location()
-                ).convert_alpha(),
+                get_surface_cache().load(
+                    self.get_enemies()[0].get_sprite_location(),
+                    convert="convert_alpha",
+                ),
                 self.get_ui_manager(),
                 container=self.get_combat_entry_panel(),
                 anchors=({"centerx": "centerx"}),
@@ -221,11 +226,7 @@ class LevelSelectionMenu(BaseState):
         second_col_x = 200
 
         for stat_count, stat_name in enumerate(FIRST_COLUMN_STAT_NAMES):
-            numerical_stat = (
-                self.get_enemies()[0].get_stats()[stat_name]
-                if stat_name in self.get_enemies()[0].get_stats().keys()
-                else 0
-            )
+            numerical_stat = self.get_enemies()[0].get_stats().get(stat_name)
             self.get_stat_text()[stat_count] = UITextBox(
                 html_text=f'<img src="assets/icons_18/{stat_name}.png"> '
                 f"{convert_snake_to_title(stat_name)}: {numerical_stat}",
@@ -240,11 +241,7 @@ class LevelSelectionMenu(BaseState):
             )
 
         for stat_count, stat_name in enumerate(SECOND_COLUMN_STAT_NAMES):
-            numerical_stat = (
-                self.get_enemies()[0].get_stats()[stat_name]
-                if stat_name in self.get_enemies()[0].get_stats().keys()
-                else 0
-            )
+            numerical_stat = self.get_enemies()[0].get_stats().get(stat_name)
             self.get_stat_text()[stat_count + 5] = UITextBox(
                 html_text=f'<img src="assets/icons_18/{stat_name}.png"> '
                 f"{convert_snake_to_title(stat_name)}: {numerical_stat}",
@@ -278,6 +275,14 @@ class LevelSelectionMenu(BaseState):
                 for enemy_button_index in range(len(self.get_enemies())):
                     if event.ui_element == self.get_enemy_buttons()[enemy_button_index]:
                         self.set_show_enemy_info(enemy_button_index)
+                        # Warm the fight's animations while the enemy is inspected
+                        self.hint_successor(
+                            FightStarted(
+                                self.get_incoming_transition_data().player,
+                                self.get_enemies()[enemy_button_index],
+                            ),
+                            "turn_based_fight",
+                        )
 
     def run(self) -> None:
         """
@@ -302,12 +307,13 @@ class LevelSelectionMenu(BaseState):
 
         # Check if the combat menu should be navigated to
         if self.get_navigate_combat():
-            # Get the incoming transition data
-            combat_pair = self.get_incoming_transition_data()
-            # Add enemy information to the transition data
-            combat_pair["enemy"] = self.get_enemies()[self.get_show_enemy_info()].copy()
-            # Set the outgoing transition data
-            self.set_outgoing_transition_data(combat_pair)
+            # Pair the selected player with a copy of the selected enemy
+            self.set_outgoing_transition_data(
+                FightStarted(
+                    self.get_incoming_transition_data().player,
+                    self.get_enemies()[self.get_show_enemy_info()].copy(),
+                )
+            )
             # Set the target state to the turn-based fight
             self.set_target_state_name("turn_based_fight")
             # Mark that a transition should occur
@@ -324,9 +330,10 @@ class LevelSelectionMenu(BaseState):
         if self.get_show_enemy_info() != -1:
             # Load and set the enemy icon image
             self.get_enemy_icon().set_image(
-                pygame.image.load(
-                    self.get_enemies()[self.get_show_enemy_info()].get_sprite_location()
-                ).convert_alpha()
+                get_surface_cache().load(
+                    self.get_enemies()[self.get_show_enemy_info()].get_sprite_location(),
+                    convert="convert_alpha",
+                )
             )
             # Set the enemy name text
             self.get_enemy_name().set_text(
@@ -335,14 +342,11 @@ class LevelSelectionMenu(BaseState):
 
             # Loop through the first column of stat names and display their values
             for stat_count, stat_name in enumerate(FIRST_COLUMN_STAT_NAMES):
-                # Retrieve the numerical stat value, default to 0 if stat not found
+                # Retrieve the numerical stat value
                 numerical_stat = (
-                    self.get_enemies()[self.get_show_enemy_info()].get_stats()[
-                        stat_name
-                    ]
-                    if stat_name
-                    in self.get_enemies()[self.get_show_enemy_info()].get_stats().keys()
-                    else 0
+                    self.get_enemies()[self.get_show_enemy_info()]
+                    .get_stats()
+                    .get(stat_name)
                 )
                 # Set the stat text with an icon
                 self.get_stat_text()[stat_count].set_text(
@@ -352,14 +356,11 @@ class LevelSelectionMenu(BaseState):
 
             # Loop through the second column of stat names and display their values
             for stat_count, stat_name in enumerate(SECOND_COLUMN_STAT_NAMES):
-                # Retrieve the numerical stat value, default to 0 if stat not found
+                # Retrieve the numerical stat value
                 numerical_stat = (
-                    self.get_enemies()[self.get_show_enemy_info()].get_stats()[
-                        stat_name
-                    ]
-                    if stat_name
-                    in self.get_enemies()[self.get_show_enemy_info()].get_stats().keys()
-                    else 0
+                    self.get_enemies()[self.get_show_enemy_info()]
+                    .get_stats()
+                    .get(stat_name)
                 )
                 # Set the stat text with an icon
                 self.get_stat_text()[stat_count + 5].set_text(
@@ -393,6 +394,24 @@ class LevelSelectionMenu(BaseState):
         self.set_navigate_quest(False)
         self.set_navigate_combat(False)
 
+    def suspend(self) -> None:
+        """
+        Suspends the level selection menu in retained UI mode by hiding its UI.
+        """
+        self.get_combat_entry_panel().hide()
+        self.get_static_panel_wrapper().hide()
+        self.set_show_enemy_info(-1)
+        self.get_screen().fill((0, 0, 0))
+
+    def resume(self) -> None:
+        """
+        Resumes the level selection menu, passing the selected player on again. The
+        static panels are shown again on the next render.
+        """
+        self.set_outgoing_transition_data(self.get_incoming_transition_data())
+        # Aim at the fight again after a hop to another menu, so it is prefetched
+        self.set_target_state_name("turn_based_fight")
+
     def end(self) -> None:
         """
         Ends the level selection menu by killing all UI elements.
@@ -6,6 +6,7 @@ from pygame_gui.elements import UIButton, UITextBox, UIPanel
 from pygame_gui.core import ObjectID
 from xp import XP
 from quest import Quest
+from surface_cache import get_surface_cache
 
 
 class QuestMenu(BaseState):
@@ -61,8 +62,8 @@ class QuestMenu(BaseState):
 
         # Load and set the background image for the quest menu
         self.set_background_image(
-            pygame.transform.scale(
-                pygame.image.load("assets/background_image.png"),
+            get_surface_cache().load(
+                "assets/background_image.png",
                 (self.get_screen().get_width(), self.get_screen().get_height()),
             )
         )
@@ -280,6 +281,27 @@ class QuestMenu(BaseState):
         self.set_navigate_lvl_selection(False)
         self.set_claim_quest(False)
 
+    def suspend(self) -> None:
+        """
+        Suspends the quest menu in retained UI mode by hiding its UI.
+        """
+        self.get_quest_overview().hide()
+        self.get_static_panel_wrapper().hide()
+        # Clear the screen
+        self.get_screen().fill((0, 0, 0))
+
+    def resume(self) -> None:
+        """
+        Resumes the quest menu, passing the selected player on again and marking the
+        quests claimed since it was built. The static panels are shown again on the
+        next render.
+        """
+        self.set_outgoing_transition_data(self.get_incoming_transition_data())
+        for quest_button, quest in zip(self.get_quest_buttons(), self.get_quests()):
+            if quest.get_is_claimed() and quest_button.is_enabled:
+                quest_button.set_text("CLAIMED")
+                quest_button.disable()
+
     def end(self) -> None:
         """
         Ends the quest menu by killing all UI elements.
@@ -3,7 +3,8 @@ from state_manager import GameStateManager
 import pygame, pygame_gui
 from pygame_gui.elements import UIButton, UITextBox
 from pygame_gui.core import ObjectID
-from utilities.json_utility import write_default_if_not_exist
+from settings_store import get_settings_store
+from surface_cache import get_surface_cache
 import os
 import sys
 
@@ -74,8 +75,8 @@ class StartMenu(BaseState):
         )
 
         self.set_background_image(
-            pygame.transform.scale(
-                pygame.image.load("assets/background_image.png"),
+            get_surface_cache().load(
+                "assets/background_image.png",
                 (self.get_screen().width, self.get_screen().height),
             )
         )
@@ -99,34 +100,7 @@ class StartMenu(BaseState):
         if self.get_play_button_pressed():
             self.set_time_to_transition(True)
         elif self.get_setting_button_pressed():
-            os.remove("settings/user_settings.json")
-            # Default user data
-            default_user_data = {
-                "xp": 5000,
-                "quest_progress": {
-                    "Fireball": 0,
-                    "Kill DreadNoughts": 0,
-                },
-                "quest_claimed": {
-                    "Fireball": False,
-                    "Kill DreadNoughts": False,
-                },
-                "character_level": {
-                    "Warrior": 1,
-                    "Mage": 1,
-                    "Berserker": 1,
-                    "Ranger": 1,
-                },
-                "character_abilities": {
-                    "Warrior": ["Power Slash"],
-                    "Mage": ["Fireball"],
-                    "Berserker": ["Reckless Charge"],
-                    "Ranger": ["Arrow Barrage"],
-                },
-            }
-            write_default_if_not_exist(
-                "settings/user_settings.json", default_data=default_user_data
-            )
+            get_settings_store().reset()
             os.execl(sys.executable, sys.executable, *sys.argv)
 
     def render(self, time_delta: int) -> None:
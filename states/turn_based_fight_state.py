@@ -9,13 +9,26 @@ from characters.enemies.base_enemy import BaseEnemy
 from gui.player_combat_hud import PlayerCombatHUD
 from gui.enemy_combat_hud import EnemyCombatHUD
 from combat_controller import CombatController
-import random
+from combat_simulator import auto_player_policy
+from enemy_ai import EnemySearch
+from combat_replay import CombatRecorder, ability_index
 from ability import Ability
 from utilities.animation_utility import Animation
 from utilities.img_utility import load_images
+from surface_cache import get_surface_cache
+from settings_store import get_settings_store
 from visual_dialogue import VisualDialogue
 from quest import Quest
-from typing import List, Dict
+from transition_messages import (
+    FightEnded,
+    FightStarted,
+    PlayerSelected,
+    TransitionMessage,
+)
+from tick_scheduler import TickScheduler
+from concurrent.futures import Future
+from typing import List, Dict, Optional, Tuple
+import random
 
 
 class TurnBasedFight(BaseState):
@@ -58,6 +71,20 @@ class TurnBasedFight(BaseState):
     __start_tick: int = 0
     __is_stunned: bool = False
     __quest_master_animation: Animation = None
+    __combat_recorder: CombatRecorder = None
+    __turn_scheduler: TickScheduler = None
+    # Pause in milliseconds between the end of a turn and the next one
+    __TURN_DELAY: int = 250
+    __enemy_search: EnemySearch = None
+    __enemy_decision: Future = None
+    # Thinking time in milliseconds the enemy gets per turn
+    __ENEMY_THINKING_BUDGET: float = 50
+    __auto_battle: bool = False
+    __auto_battle_button: UIButton = None
+    # Auto battle hits the middle of the enemy sprite, like an average click
+    __AUTO_HIT_HEIGHT_RATIO: float = 0.5
+    # Turns resolved per frame in auto battle, so long fights still take a few frames
+    __AUTO_BATTLE_TURNS_PER_FRAME: int = 100
 
     def __init__(
         self,
@@ -85,6 +112,30 @@ class TurnBasedFight(BaseState):
         )
         self.set_quests(quests)
         self.set_temp_quest_template(temp_quest)
+        self.set_enemy_search(EnemySearch(self.__ENEMY_THINKING_BUDGET))
+
+    def get_prefetch_folders(self, transition_message: TransitionMessage) -> list[str]:
+        """
+        Lists the animation folders the fight loads: the quest master's, and the
+        player's and enemy's as far as the message already names them.
+
+        :param transition_message: The message the fight would be started with.
+        :return: The folders, relative to the assets folder.
+        """
+        folders = ["characters/npcs/quest_master/idle"]
+        if isinstance(transition_message, (PlayerSelected, FightStarted)):
+            player_name = transition_message.player.get_name()
+            folders += [
+                f"characters/players/{player_name}/idle",
+                f"characters/players/{player_name}/attack",
+            ]
+        if isinstance(transition_message, FightStarted):
+            enemy_name = transition_message.enemy.get_name()
+            folders += [
+                f"characters/enemies/{enemy_name}/idle",
+                f"characters/enemies/{enemy_name}/attack",
+            ]
+        return folders
 
     def start(self) -> None:
         """
@@ -92,9 +143,10 @@ class TurnBasedFight(BaseState):
         """
         # Copy the temporary quest template to initialize the temp quest
         self.set_temp_quest(self.get_temp_quest_template().copy())
-        # Set the player and enemy using the incoming transition data
-        self.set_player(self.get_incoming_transition_data()["player"])
-        self.set_enemy(self.get_incoming_transition_data()["enemy"])
+        # Set the player and enemy using the incoming transition message, which
+        # hands over ownership of both
+        self.set_player(self.get_incoming_transition_data().player)
+        self.set_enemy(self.get_incoming_transition_data().enemy)
 
         # Load animations for the player, enemy, and quest master
         self.set_animation_assets(
@@ -141,7 +193,7 @@ class TurnBasedFight(BaseState):
                     (0, 0),
                     (self.get_screen().get_width(), self.get_screen().get_height()),
                 ),
-                image_surface=pygame.image.load("assets/fight/1.png"),
+                image_surface=get_surface_cache().load("assets/fight/1.png"),
                 manager=self.get_ui_manager(),
             )
         )
@@ -153,7 +205,7 @@ class TurnBasedFight(BaseState):
                     (self.get_screen().width * 0.3, 300),
                     (200, 200),
                 ),
-                image_surface=pygame.image.load(
+                image_surface=get_surface_cache().load(
                     self.get_player().get_sprite_location()
                 ),
                 manager=self.get_ui_manager(),
@@ -167,12 +219,10 @@ class TurnBasedFight(BaseState):
                     (self.get_screen().width * 0.5, 350),
                     (200, 200),
                 ),
-                image_surface=pygame.transform.flip(
-                    pygame.image.load(
-                        self.get_enemy().get_sprite_location()
-                    ).convert_alpha(),
-                    True,
-                    False,
+                image_surface=get_surface_cache().load(
+                    self.get_enemy().get_sprite_location(),
+                    flip_x=True,
+                    convert="convert_alpha",
                 ),
                 manager=self.get_ui_manager(),
             )
@@ -185,12 +235,10 @@ class TurnBasedFight(BaseState):
                     (self.get_screen().width * 0.7, 400),
                     (200, 200),
                 ),
-                image_surface=pygame.transform.flip(
-                    pygame.image.load(
-                        "assets/characters/npcs/quest_master/idle/0.png"
-                    ).convert_alpha(),
-                    True,
-                    False,
+                image_surface=get_surface_cache().load(
+                    "assets/characters/npcs/quest_master/idle/0.png",
+                    flip_x=True,
+                    convert="convert_alpha",
                 ),
                 manager=self.get_ui_manager(),
             )
@@ -267,8 +315,8 @@ class TurnBasedFight(BaseState):
         init_ability_button_y = 25
 
         normal_attack_tool_tip = (
-            f"Deal {self.get_player().get_stats()['physical_damage'] if 'physical_damage' in self.get_player().get_stats().keys() else 0} "
-            f"physical damage and {self.get_player().get_stats()['magical_damage'] if 'magical_damage' in self.get_player().get_stats().keys() else 0} "
+            f"Deal {self.get_player().get_stats().physical_damage} "
+            f"physical damage and {self.get_player().get_stats().magical_damage} "
             f"magical damage to the enemy"
         )
         self.get_ability_button_list()[0] = UIButton(
@@ -305,6 +353,19 @@ class TurnBasedFight(BaseState):
                 tool_tip_text=ability.get_description(),
             )
 
+        # Create the auto battle toggle below the ability buttons
+        self.set_auto_battle(False)
+        self.set_auto_battle_button(
+            UIButton(
+                text="Auto Battle: Off",
+                relative_rect=pygame.Rect((0, 140), (200, 40)),
+                anchors={"centerx": "centerx"},
+                manager=self.get_ui_manager(),
+                container=self.get_player_choice_container(),
+                tool_tip_text="Resolve the rest of the fight instantly without animations",
+            )
+        )
+
         # Set up the countdown text box
         self.set_count_down(
             UITextBox(
@@ -328,21 +389,41 @@ class TurnBasedFight(BaseState):
             )
         )
 
+        # Seed the fight; combat and dialogue draw from separate streams so the
+        # fight can be replayed headlessly without the dialogue
+        seed = random.getrandbits(32)
+        combat_rng = random.Random(seed)
+
         # Set up the visual dialogue
         self.set_visual_dialogue(
             VisualDialogue(
                 self.get_ui_manager(),
                 self.get_visual_dialogue_container(),
                 self.get_temp_quest(),
+                random.Random(seed),
             )
         )
 
         # Initialize the player and enemy combat controllers
         self.set_player_controller(
-            CombatController(self.get_player(), self.get_player_sprite())
+            CombatController(
+                self.get_player(), self.get_player_sprite().rect.height, combat_rng
+            )
         )
         self.set_enemy_controller(
-            CombatController(self.get_enemy(), self.get_enemy_sprite())
+            CombatController(
+                self.get_enemy(), self.get_enemy_sprite().rect.height, combat_rng
+            )
+        )
+
+        # Record the seed and the player's inputs for replays
+        self.set_combat_recorder(
+            CombatRecorder(
+                seed,
+                self.get_player(),
+                self.get_enemy(),
+                self.get_player_sprite().rect.height,
+            )
         )
 
         # Set initial animations for player, enemy, and quest master
@@ -358,6 +439,9 @@ class TurnBasedFight(BaseState):
         self.set_combat_round_initialized(False)
         self.set_is_player_attacking(False)
         self.set_is_enemy_attacking(False)
+        self.set_ability_selected(-1)
+        self.set_turn_scheduler(TickScheduler())
+        self.set_enemy_decision(None)
 
     def handle_events(self) -> None:
         """
@@ -374,7 +458,13 @@ class TurnBasedFight(BaseState):
 
             # Handle button press events
             if event.type == pygame_gui.UI_BUTTON_PRESSED:
-                if event.ui_element == self.get_ability_button_list()[0]:
+                if event.ui_element == self.get_auto_battle_button():
+                    # Toggle auto battle
+                    self.set_auto_battle(not self.get_auto_battle())
+                    self.get_auto_battle_button().set_text(
+                        f"Auto Battle: {'On' if self.get_auto_battle() else 'Off'}"
+                    )
+                elif event.ui_element == self.get_ability_button_list()[0]:
                     # If the normal attack button is pressed, set ability_selected to None
                     self.set_ability_selected(None)
                 else:
@@ -417,6 +507,9 @@ class TurnBasedFight(BaseState):
         if self.get_time_to_quit_app():
             return
 
+        # Run the turn callbacks that are due, e.g. a paced round advance
+        self.get_turn_scheduler().update(pygame.time.get_ticks())
+
         # Calculate the elapsed time since the start of the round
         seconds = (pygame.time.get_ticks() - self.get_start_tick()) / 1000
 
@@ -428,10 +521,14 @@ class TurnBasedFight(BaseState):
             self.get_count_down().set_text(str(3 - int(seconds)))
 
         # Check if both player and enemy are still alive and if the combat round is initialized
-        if (
-            self.get_enemy().get_stats()["health_points"] > 0
-            and self.get_player().get_stats()["health_points"] > 0
+        if self.get_auto_battle():
+            # Auto battle skips the countdown, animations and dialogue
+            self.resolve_turns_instantly()
+        elif (
+            self.get_enemy().get_stats().health_points > 0
+            and self.get_player().get_stats().health_points > 0
             and self.get_combat_round_initialized()
+            and not self.get_turn_scheduler().has_pending()
         ):
             # Determine if it's the player's turn (even round number) or the enemy's turn (odd round number)
             if self.get_round_counter() % 2 == 0:
@@ -440,17 +537,16 @@ class TurnBasedFight(BaseState):
                     # If the player is stunned, skip their turn
                     self.get_tutorial_text().set_text("You are stunned and cannot act!")
                     self.get_player_controller().stunned_round()
-                    pygame.time.wait(250)
                     self.get_visual_dialogue().set_dialogue(
                         self.get_player().get_name(),
                         self.get_enemy().get_name(),
-                        self.get_player().get_stats()["health_points"],
-                        self.get_player().get_stats()["mana_points"],
+                        self.get_player().get_stats().health_points,
+                        self.get_player().get_stats().mana_points,
                         0,
                         True,
                         None,
                     )
-                    self.set_round_counter(self.get_round_counter() + 1)
+                    self.schedule_round_advance()
                 else:
                     # If the player is not stunned
                     if self.get_ability_selected() == -1:
@@ -470,17 +566,8 @@ class TurnBasedFight(BaseState):
                         ):
                             # If the player clicks to attack or is stunned
                             self.set_is_player_attacking(True)
-                            self.get_player_controller().regenerate()
-                            self.get_enemy_controller().regenerate()
-                            (
-                                physical_damage,
-                                magical_damage,
-                                debuff_dict,
-                            ) = self.get_player_controller().attack(
-                                self.get_enemy_hit_height(), locked_ability_decision
-                            )
-                            self.get_enemy_controller().face_damage(
-                                physical_damage, magical_damage, debuff_dict
+                            damage = self.resolve_player_attack(
+                                locked_ability_decision, self.get_enemy_hit_height()
                             )
                             self.set_player_animation(
                                 self.get_animation_assets()["player/attack"].copy()
@@ -488,22 +575,12 @@ class TurnBasedFight(BaseState):
                             self.get_visual_dialogue().set_dialogue(
                                 self.get_player().get_name(),
                                 self.get_enemy().get_name(),
-                                self.get_player().get_stats()["health_points"],
-                                self.get_player().get_stats()["mana_points"],
-                                (physical_damage + magical_damage),
+                                self.get_player().get_stats().health_points,
+                                self.get_player().get_stats().mana_points,
+                                damage,
                                 False,
                                 locked_ability_decision,
                             )
-                            if locked_ability_decision is not None:
-                                for quest in self.get_quests():
-                                    if (
-                                        quest.get_name() == "Fireball"
-                                        and locked_ability_decision.get_name()
-                                        == "Fireball"
-                                    ):
-                                        quest.increment_progress(1)
-                            else:
-                                self.get_temp_quest().increment_progress(1)
                     elif (
                         self.get_is_player_attacking()
                         and self.get_player_animation().is_done()
@@ -515,8 +592,7 @@ class TurnBasedFight(BaseState):
                         )
                         self.set_ability_selected(-1)
                         self.set_is_player_attacking(False)
-                        pygame.time.wait(250)
-                        self.set_round_counter(self.get_round_counter() + 1)
+                        self.schedule_round_advance()
             else:
                 # Enemy's turn
                 if self.get_enemy_controller().get_is_stunned():
@@ -529,48 +605,31 @@ class TurnBasedFight(BaseState):
                     self.get_visual_dialogue().set_dialogue(
                         self.get_enemy().get_name(),
                         self.get_player().get_name(),
-                        self.get_enemy().get_stats()["health_points"],
-                        self.get_enemy().get_stats()["mana_points"],
+                        self.get_enemy().get_stats().health_points,
+                        self.get_enemy().get_stats().mana_points,
                         0,
                         True,
                         None,
                     )
                 else:
                     if not self.get_is_enemy_attacking():
-                        # Select a random ability for the enemy to use
-                        random_ability_choice = random.randint(
-                            0,
-                            len(self.get_enemy().get_abilities())
-                            - len(self.get_enemy_controller().get_cooldown_abilities()),
-                        )
-                        random_ability_choice = (
-                            None
-                            if random_ability_choice == 0
-                            else self.get_enemy().get_abilities()[
-                                random_ability_choice - 1
-                            ]
-                        )
-                        self.get_player_controller().regenerate()
-                        self.get_enemy_controller().regenerate()
-                        physical_damage, magical_damage, debuff_dict = (
-                            self.get_enemy_controller().attack(0, random_ability_choice)
-                        )
-                        self.get_player_controller().face_damage(
-                            physical_damage, magical_damage, debuff_dict
-                        )
-                        self.set_enemy_animation(
-                            self.get_animation_assets()["enemy/attack"].copy()
-                        )
-                        self.set_is_enemy_attacking(True)
-                        self.get_visual_dialogue().set_dialogue(
-                            self.get_enemy().get_name(),
-                            self.get_player().get_name(),
-                            self.get_enemy().get_stats()["health_points"],
-                            self.get_enemy().get_stats()["mana_points"],
-                            (physical_damage + magical_damage),
-                            False,
-                            random_ability_choice,
-                        )
+                        # Attack once the enemy has picked its ability on the worker
+                        is_decided, enemy_ability = self.poll_enemy_decision()
+                        if is_decided:
+                            damage = self.resolve_enemy_attack(enemy_ability)
+                            self.set_enemy_animation(
+                                self.get_animation_assets()["enemy/attack"].copy()
+                            )
+                            self.set_is_enemy_attacking(True)
+                            self.get_visual_dialogue().set_dialogue(
+                                self.get_enemy().get_name(),
+                                self.get_player().get_name(),
+                                self.get_enemy().get_stats().health_points,
+                                self.get_enemy().get_stats().mana_points,
+                                damage,
+                                False,
+                                enemy_ability,
+                            )
                     elif (
                         self.get_is_enemy_attacking()
                         and self.get_enemy_animation().is_done()
@@ -584,7 +643,7 @@ class TurnBasedFight(BaseState):
                         self.set_round_counter(self.get_round_counter() + 1)
 
         # Check for victory or defeat
-        if self.get_enemy().get_stats()["health_points"] <= 0:
+        if self.get_enemy().get_stats().health_points <= 0:
             # Player wins
             for quest in self.get_quests():
                 if (
@@ -592,25 +651,180 @@ class TurnBasedFight(BaseState):
                     and self.get_enemy().get_name() == "DreadNought"
                 ):
                     quest.increment_progress(1)
-            outgoing_transition_dict = self.get_incoming_transition_data()
-            outgoing_transition_dict["winner"] = "player"
-            if self.get_temp_quest().is_done():
-                outgoing_transition_dict["temp_quest_completion"] = (
-                    self.get_temp_quest()
-                )
-            self.set_outgoing_transition_data(outgoing_transition_dict)
+            self.set_outgoing_transition_data(self.create_fight_ended("player"))
+            self.get_combat_recorder().save(get_settings_store().get_save_worker())
             self.set_time_to_transition(True)
-        elif self.get_player().get_stats()["health_points"] <= 0:
+        elif self.get_player().get_stats().health_points <= 0:
             # Enemy wins
-            outgoing_transition_dict = self.get_incoming_transition_data()
-            outgoing_transition_dict["winner"] = "enemy"
-            if self.get_temp_quest().is_done():
-                outgoing_transition_dict["temp_quest_completion"] = (
-                    self.get_temp_quest()
-                )
-            self.set_outgoing_transition_data(outgoing_transition_dict)
+            self.set_outgoing_transition_data(self.create_fight_ended("enemy"))
+            self.get_combat_recorder().save(get_settings_store().get_save_worker())
             self.set_time_to_transition(True)
 
+    def create_fight_ended(self, winner: str) -> FightEnded:
+        """
+        Creates the message telling the end menu how the fight ended.
+
+        :param winner: "player" or "enemy".
+        :return: The fight ended message.
+        """
+        return FightEnded(
+            self.get_player(),
+            self.get_enemy(),
+            winner,
+            self.get_temp_quest() if self.get_temp_quest().is_done() else None,
+        )
+
+    def advance_round(self) -> None:
+        """
+        Moves the fight on to the next turn.
+        """
+        self.set_round_counter(self.get_round_counter() + 1)
+
+    def schedule_round_advance(self) -> None:
+        """
+        Moves the fight on to the next turn after a short pause, while the frame loop
+        keeps rendering and handling input.
+        """
+        self.get_turn_scheduler().schedule(
+            pygame.time.get_ticks(), self.__TURN_DELAY, self.advance_round
+        )
+
+    def resolve_player_attack(self, ability: Optional[Ability], hit_height: float) -> int:
+        """
+        Resolves the player's attack on the enemy and the quest progress it makes.
+
+        :param ability: The ability used, or None for a normal attack.
+        :param hit_height: How high up the enemy sprite the player hit.
+        :return: The total damage dealt.
+        """
+        self.get_combat_recorder().record_input(
+            ability_index(self.get_player(), ability), hit_height
+        )
+        self.get_player_controller().regenerate()
+        self.get_enemy_controller().regenerate()
+        physical_damage, magical_damage, debuffs = (
+            self.get_player_controller().attack(hit_height, ability)
+        )
+        self.get_enemy_controller().face_damage(
+            physical_damage, magical_damage, debuffs
+        )
+        if ability is not None:
+            for quest in self.get_quests():
+                if quest.get_name() == "Fireball" and ability.get_name() == "Fireball":
+                    quest.increment_progress(1)
+        else:
+            self.get_temp_quest().increment_progress(1)
+        return physical_damage + magical_damage
+
+    def poll_enemy_decision(self) -> Tuple[bool, Optional[Ability]]:
+        """
+        Gets the enemy's action for this turn, starting a search on the worker thread
+        if none is running.
+
+        :return: Whether the enemy has decided, and the ability it picked (None for a normal attack).
+        """
+        if self.get_enemy_decision() is None:
+            self.set_enemy_decision(
+                self.get_enemy_search().submit(
+                    self.get_enemy().get_abilities(),
+                    self.get_enemy_controller(),
+                    self.get_player().get_unlocked_abilities(),
+                    self.get_player_controller(),
+                )
+            )
+        if not self.get_enemy_decision().done():
+            return False, None
+        ability = self.get_enemy_decision().result()
+        self.set_enemy_decision(None)
+        return True, ability
+
+    def resolve_enemy_attack(self, ability: Optional[Ability]) -> int:
+        """
+        Resolves the enemy's attack on the player.
+
+        :param ability: The ability used, or None for a normal attack.
+        :return: The total damage dealt.
+        """
+        self.get_combat_recorder().record_enemy_input(
+            ability_index(self.get_enemy(), ability)
+        )
+        self.get_player_controller().regenerate()
+        self.get_enemy_controller().regenerate()
+        physical_damage, magical_damage, debuffs = (
+            self.get_enemy_controller().attack(0, ability)
+        )
+        self.get_player_controller().face_damage(
+            physical_damage, magical_damage, debuffs
+        )
+        return physical_damage + magical_damage
+
+    def resolve_turns_instantly(self) -> None:
+        """
+        Resolves turns without animations, dialogue or waits, picking the player's
+        actions with the auto policy and the enemy's with a search without thinking
+        time, until the fight ends or the per-frame turn limit is reached.
+        """
+        self.set_combat_round_initialized(True)
+        self.get_count_down().kill()
+
+        # Drop a search started before auto battle was turned on
+        if self.get_enemy_decision() is not None:
+            self.get_enemy_decision().cancel()
+            self.set_enemy_decision(None)
+
+        # Apply a paced round advance straight away
+        self.get_turn_scheduler().flush()
+
+        # Drop any half-made choice, the auto policy picks the player's actions
+        self.set_ability_selected(-1)
+
+        # Finish an attack whose animation is still playing, its damage is already dealt
+        if self.get_is_player_attacking():
+            self.set_player_animation(self.get_animation_assets()["player/idle"].copy())
+            self.set_is_player_attacking(False)
+            self.set_round_counter(self.get_round_counter() + 1)
+        elif self.get_is_enemy_attacking():
+            self.set_enemy_animation(self.get_animation_assets()["enemy/idle"].copy())
+            self.set_is_enemy_attacking(False)
+            self.set_round_counter(self.get_round_counter() + 1)
+
+        for _ in range(self.__AUTO_BATTLE_TURNS_PER_FRAME):
+            if (
+                self.get_enemy().get_stats().health_points <= 0
+                or self.get_player().get_stats().health_points <= 0
+            ):
+                break
+            if self.get_round_counter() % 2 == 0:
+                # Player's turn
+                if self.get_player_controller().get_is_stunned():
+                    self.get_player_controller().stunned_round()
+                else:
+                    self.resolve_player_attack(
+                        auto_player_policy(
+                            self.get_player().get_unlocked_abilities(),
+                            self.get_player_controller(),
+                        ),
+                        self.get_enemy_sprite().rect.height
+                        * self.__AUTO_HIT_HEIGHT_RATIO,
+                    )
+            else:
+                # Enemy's turn
+                if self.get_enemy_controller().get_is_stunned():
+                    self.get_enemy_controller().stunned_round()
+                else:
+                    # Decide on this thread with no thinking time, waiting out the
+                    # budget would hold every enemy turn for a whole frame
+                    self.resolve_enemy_attack(
+                        self.get_enemy_search().choose(
+                            self.get_enemy().get_abilities(),
+                            self.get_enemy_controller(),
+                            self.get_player().get_unlocked_abilities(),
+                            self.get_player_controller(),
+                            budget=0,
+                        )
+                    )
+            self.set_round_counter(self.get_round_counter() + 1)
+
     def reset_event_polling(self) -> None:
         """
         Resets the event polling flags for the next round.
@@ -641,19 +855,19 @@ class TurnBasedFight(BaseState):
         self.get_quest_master_sprite().image = self.get_quest_master_animation().img()
 
         # Update ability button states based on their cooldowns
-        for ability_index, ability in enumerate(
+        for hud_index, ability in enumerate(
             self.get_player().get_unlocked_abilities(), 1
         ):
             if self.get_player_controller().is_ability_on_cooldown(ability):
                 # If the ability is on cooldown, update the button text and disable it
-                self.get_ability_button_list()[ability_index].set_text(
-                    f"Cooldown: {self.get_player_controller().get_cooldown_abilities()[ability.get_name()]}"
+                self.get_ability_button_list()[hud_index].set_text(
+                    f"Cooldown: {self.get_player_controller().get_cooldown_remaining(ability)}"
                 )
-                self.get_ability_button_list()[ability_index].disable()
+                self.get_ability_button_list()[hud_index].disable()
             else:
                 # If the ability is not on cooldown, enable the button and set its text to the ability name
-                self.get_ability_button_list()[ability_index].enable()
-                self.get_ability_button_list()[ability_index].set_text(
+                self.get_ability_button_list()[hud_index].enable()
+                self.get_ability_button_list()[hud_index].set_text(
                     ability.get_name()
                 )
 
@@ -983,3 +1197,99 @@ class TurnBasedFight(BaseState):
         :param quest_master_animation: The new quest master's animation.
         """
         self.__quest_master_animation = quest_master_animation
+
+    def get_combat_recorder(self) -> CombatRecorder:
+        """
+        Gets the recorder of the current fight.
+
+        :return: The combat recorder.
+        """
+        return self.__combat_recorder
+
+    def set_combat_recorder(self, combat_recorder: CombatRecorder) -> None:
+        """
+        Sets the recorder of the current fight.
+
+        :param combat_recorder: The new combat recorder.
+        """
+        self.__combat_recorder = combat_recorder
+
+    def get_auto_battle(self) -> bool:
+        """
+        Gets whether auto battle is on.
+
+        :return: True if auto battle is on, False otherwise.
+        """
+        return self.__auto_battle
+
+    def set_auto_battle(self, auto_battle: bool) -> None:
+        """
+        Sets whether auto battle is on.
+
+        :param auto_battle: True to turn auto battle on, False to turn it off.
+        """
+        self.__auto_battle = auto_battle
+
+    def get_auto_battle_button(self) -> UIButton:
+        """
+        Gets the auto battle toggle button.
+
+        :return: The auto battle button.
+        """
+        return self.__auto_battle_button
+
+    def set_auto_battle_button(self, auto_battle_button: UIButton) -> None:
+        """
+        Sets the auto battle toggle button.
+
+        :param auto_battle_button: The new auto battle button.
+        """
+        self.__auto_battle_button = auto_battle_button
+
+    def get_turn_scheduler(self) -> TickScheduler:
+        """
+        Gets the scheduler pacing the turns.
+
+        :return: The turn scheduler.
+        """
+        return self.__turn_scheduler
+
+    def set_turn_scheduler(self, turn_scheduler: TickScheduler) -> None:
+        """
+        Sets the scheduler pacing the turns.
+
+        :param turn_scheduler: The new turn scheduler.
+        """
+        self.__turn_scheduler = turn_scheduler
+
+    def get_enemy_search(self) -> EnemySearch:
+        """
+        Gets the search picking the enemy's actions.
+
+        :return: The enemy search.
+        """
+        return self.__enemy_search
+
+    def set_enemy_search(self, enemy_search: EnemySearch) -> None:
+        """
+        Sets the search picking the enemy's actions.
+
+        :param enemy_search: The new enemy search.
+        """
+        self.__enemy_search = enemy_search
+
+    def get_enemy_decision(self) -> Future:
+        """
+        Gets the enemy's decision being searched on the worker thread.
+
+        :return: The pending decision, or None if no search is running.
+        """
+        return self.__enemy_decision
+
+    def set_enemy_decision(self, enemy_decision: Future) -> None:
+        """
+        Sets the enemy's decision being searched on the worker thread.
+
+        :param enemy_decision: The pending decision, or None if no search is running.
+        """
+        self.__enemy_decision = enemy_decision
@@ -0,0 +1,282 @@
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+import pygame
+from pixel_cache import load_pixels
+
+# Bytes of pixels the shared cache keeps before evicting, enough for the
+# backgrounds, portraits and icons of every menu
+DEFAULT_BYTE_BUDGET = 64 * 1024 * 1024
+
+# How a loaded image is converted: None keeps the decoded format, "convert" and
+# "convert_alpha" call the pygame.Surface methods of the same name, and "colorkey"
+# converts it with black as the transparent colour
+CONVERT_MODES: Tuple[Optional[str], ...] = (
+    None,
+    "convert",
+    "convert_alpha",
+    "colorkey",
+)
+
+# Path, size scaled to (None if not scaled), horizontal flip and convert mode
+SurfaceKey = Tuple[str, Optional[Tuple[int, int]], bool, Optional[str]]
+
+
+class SurfaceCache:
+    """
+    SurfaceCache class keeping loaded images so each one is read from disk, converted,
+    scaled and flipped only once. Images are cached by path and transform, and the
+    least recently used ones are evicted once their pixels exceed the byte budget.
+
+    The surfaces returned are shared between every caller, so they must not be drawn
+    on or changed; pygame_gui elements copy the images they are given.
+    """
+
+    __surfaces: "OrderedDict[SurfaceKey, pygame.Surface]" = None
+    __byte_budget: int = DEFAULT_BYTE_BUDGET
+    __bytes_used: int = 0
+    __hits: int = 0
+    __misses: int = 0
+    __evictions: int = 0
+
+    def __init__(self, byte_budget: int = DEFAULT_BYTE_BUDGET) -> None:
+        """
+        Initializes the SurfaceCache class.
+
+        :param byte_budget: Bytes of pixels kept before evicting.
+        """
+        self.set_surfaces(OrderedDict())
+        self.set_byte_budget(byte_budget)
+        self.set_bytes_used(0)
+        self.set_hits(0)
+        self.set_misses(0)
+        self.set_evictions(0)
+
+    def load(
+        self,
+        path: str,
+        size: Tuple[int, int] = None,
+        flip_x: bool = False,
+        convert: str = None,
+        decode: Callable[[str], pygame.Surface] = load_pixels,
+    ) -> pygame.Surface:
+        """
+        Gets an image, loading and transforming it if it is not cached.
+
+        :param path: Path to the image file.
+        :param size: Size to scale the image to, or None to keep its size.
+        :param flip_x: Flip the image horizontally.
+        :param convert: One of CONVERT_MODES.
+        :param decode: Reads the image file on a miss, from the pixel cache by
+            default, or e.g. picking up an image the asset prefetcher decoded.
+        :return: The shared surface, not to be changed.
+        :raises ValueError: If the convert mode is unknown.
+        """
+        key = self.create_key(path, size, flip_x, convert)
+        surface = self.get_surfaces().get(key)
+        if surface is not None:
+            self.set_hits(self.get_hits() + 1)
+            self.get_surfaces().move_to_end(key)
+            return surface
+
+        self.set_misses(self.get_misses() + 1)
+        surface = decode(path)
+        if convert == "colorkey":
+            surface = surface.convert()
+            surface.set_colorkey((0, 0, 0))
+        elif convert is not None:
+            surface = getattr(surface, convert)()
+        if size is not None:
+            surface = pygame.transform.scale(surface, size)
+        if flip_x:
+            surface = pygame.transform.flip(surface, True, False)
+        self.store(key, surface)
+        return surface
+
+    def contains(
+        self,
+        path: str,
+        size: Tuple[int, int] = None,
+        flip_x: bool = False,
+        convert: str = None,
+    ) -> bool:
+        """
+        Checks if an image is cached, without counting a hit or a miss.
+
+        :param path: Path to the image file.
+        :param size: Size the image is scaled to, or None.
+        :param flip_x: Whether the image is flipped horizontally.
+        :param convert: One of CONVERT_MODES.
+        :return: True if the image is cached, False otherwise.
+        :raises ValueError: If the convert mode is unknown.
+        """
+        return self.create_key(path, size, flip_x, convert) in self.get_surfaces()
+
+    @staticmethod
+    def create_key(
+        path: str, size: Optional[Tuple[int, int]], flip_x: bool, convert: str
+    ) -> SurfaceKey:
+        """
+        Creates the key an image is cached under.
+
+        :param path: Path to the image file.
+        :param size: Size the image is scaled to, or None.
+        :param flip_x: Whether the image is flipped horizontally.
+        :param convert: One of CONVERT_MODES.
+        :return: The cache key.
+        :raises ValueError: If the convert mode is unknown.
+        """
+        if convert not in CONVERT_MODES:
+            raise ValueError(f"Unknown convert mode: {convert}")
+        return (path, tuple(size) if size is not None else None, flip_x, convert)
+
+    def store(self, key: SurfaceKey, surface: pygame.Surface) -> None:
+        """
+        Caches a surface, evicting the least recently used ones over the budget. A
+        surface larger than the whole budget is not cached.
+
+        :param key: The path and transform of the surface.
+        :param surface: The loaded surface.
+        """
+        size = surface.get_pitch() * surface.get_height()
+        if size > self.get_byte_budget():
+            return
+        self.get_surfaces()[key] = surface
+        self.set_bytes_used(self.get_bytes_used() + size)
+        while self.get_bytes_used() > self.get_byte_budget():
+            _, evicted = self.get_surfaces().popitem(last=False)
+            self.set_bytes_used(
+                self.get_bytes_used() - evicted.get_pitch() * evicted.get_height()
+            )
+            self.set_evictions(self.get_evictions() + 1)
+
+    def clear(self) -> None:
+        """
+        Empties the cache, keeping the statistics.
+        """
+        self.get_surfaces().clear()
+        self.set_bytes_used(0)
+
+    def get_hit_rate(self) -> float:
+        """
+        Computes the share of loads served from the cache.
+
+        :return: The hit rate between 0 and 1, or 0 if nothing was loaded.
+        """
+        loads = self.get_hits() + self.get_misses()
+        return self.get_hits() / loads if loads else 0.0
+
+    # Getters and setters with docstrings
+
+    def get_surfaces(self) -> "OrderedDict[SurfaceKey, pygame.Surface]":
+        """
+        Gets the cached surfaces.
+
+        :return: The surfaces by key, least recently used first.
+        """
+        return self.__surfaces
+
+    def set_surfaces(
+        self, surfaces: "OrderedDict[SurfaceKey, pygame.Surface]"
+    ) -> None:
+        """
+        Sets the cached surfaces.
+
+        :param surfaces: The new surfaces by key, least recently used first.
+        """
+        self.__surfaces = surfaces
+
+    def get_byte_budget(self) -> int:
+        """
+        Gets the bytes of pixels kept before evicting.
+
+        :return: The byte budget.
+        """
+        return self.__byte_budget
+
+    def set_byte_budget(self, byte_budget: int) -> None:
+        """
+        Sets the bytes of pixels kept before evicting.
+
+        :param byte_budget: The new byte budget.
+        """
+        self.__byte_budget = byte_budget
+
+    def get_bytes_used(self) -> int:
+        """
+        Gets the bytes of pixels of the cached surfaces.
+
+        :return: The bytes used.
+        """
+        return self.__bytes_used
+
+    def set_bytes_used(self, bytes_used: int) -> None:
+        """
+        Sets the bytes of pixels of the cached surfaces.
+
+        :param bytes_used: The new bytes used.
+        """
+        self.__bytes_used = bytes_used
+
+    def get_hits(self) -> int:
+        """
+        Gets the number of loads served from the cache.
+
+        :return: The hit count.
+        """
+        return self.__hits
+
+    def set_hits(self, hits: int) -> None:
+        """
+        Sets the number of loads served from the cache.
+
+        :param hits: The new hit count.
+        """
+        self.__hits = hits
+
+    def get_misses(self) -> int:
+        """
+        Gets the number of loads read from disk.
+
+        :return: The miss count.
+        """
+        return self.__misses
+
+    def set_misses(self, misses: int) -> None:
+        """
+        Sets the number of loads read from disk.
+
+        :param misses: The new miss count.
+        """
+        self.__misses = misses
+
+    def get_evictions(self) -> int:
+        """
+        Gets the number of surfaces evicted to stay within the budget.
+
+        :return: The eviction count.
+        """
+        return self.__evictions
+
+    def set_evictions(self, evictions: int) -> None:
+        """
+        Sets the number of surfaces evicted to stay within the budget.
+
+        :param evictions: The new eviction count.
+        """
+        self.__evictions = evictions
+
+
+# The cache shared by the whole game, created on first use
+_surface_cache: SurfaceCache = None
+
+
+def get_surface_cache() -> SurfaceCache:
+    """
+    Gets the cache shared by the whole game.
+
+    :return: The shared surface cache.
+    """
+    global _surface_cache
+    if _surface_cache is None:
+        _surface_cache = SurfaceCache()
+    return _surface_cache
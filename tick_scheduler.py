@@ -0,0 +1,105 @@
+import heapq
+from typing import Callable, List, Tuple
+
+
+class TickScheduler:
+    """
+    TickScheduler class running callbacks once a delay in milliseconds has passed,
+    without blocking the frame loop. Callbacks are kept in a min-heap keyed by the
+    tick they are due and run from update, which the owner calls once per frame.
+    """
+
+    __callbacks: List[Tuple[int, int, Callable[[], None]]] = []
+    __sequence: int = 0
+
+    def __init__(self) -> None:
+        """
+        Initializes the TickScheduler class with no callbacks.
+        """
+        self.set_callbacks([])
+        self.set_sequence(0)
+
+    def schedule(self, now: int, delay: int, callback: Callable[[], None]) -> int:
+        """
+        Schedules a callback a number of milliseconds after the current tick.
+
+        :param now: The current tick in milliseconds, e.g. pygame.time.get_ticks().
+        :param delay: The number of milliseconds until the callback is due.
+        :param callback: The function to call once due.
+        :return: The tick the callback is due.
+        """
+        due_tick = now + delay
+        # The sequence number keeps callbacks due on the same tick in scheduling order
+        heapq.heappush(self.get_callbacks(), (due_tick, self.get_sequence(), callback))
+        self.set_sequence(self.get_sequence() + 1)
+        return due_tick
+
+    def update(self, now: int) -> None:
+        """
+        Runs every callback due by the current tick, in due order.
+
+        :param now: The current tick in milliseconds.
+        """
+        callbacks = self.get_callbacks()
+        while callbacks and callbacks[0][0] <= now:
+            _, _, callback = heapq.heappop(callbacks)
+            callback()
+
+    def flush(self) -> None:
+        """
+        Runs every pending callback straight away, in due order.
+        """
+        callbacks = self.get_callbacks()
+        while callbacks:
+            _, _, callback = heapq.heappop(callbacks)
+            callback()
+
+    def clear(self) -> None:
+        """
+        Drops every pending callback without running it.
+        """
+        self.get_callbacks().clear()
+
+    def has_pending(self) -> bool:
+        """
+        Checks if any callback is still waiting to run.
+
+        :return: True if a callback is pending, False otherwise.
+        """
+        return len(self.get_callbacks()) > 0
+
+    # Getters and setters with docstrings
+
+    def get_callbacks(self) -> List[Tuple[int, int, Callable[[], None]]]:
+        """
+        Gets the heap of scheduled callbacks.
+
+        :return: The heap of (due tick, sequence number, callback) entries.
+        """
+        return self.__callbacks
+
+    def set_callbacks(
+        self, callbacks: List[Tuple[int, int, Callable[[], None]]]
+    ) -> None:
+        """
+        Sets the heap of scheduled callbacks.
+
+        :param callbacks: The new heap of (due tick, sequence number, callback) entries.
+        """
+        self.__callbacks = callbacks
+
+    def get_sequence(self) -> int:
+        """
+        Gets the sequence number given to the next scheduled callback.
+
+        :return: The next sequence number.
+        """
+        return self.__sequence
+
+    def set_sequence(self, sequence: int) -> None:
+        """
+        Sets the sequence number given to the next scheduled callback.
+
+        :param sequence: The new next sequence number.
+        """
+        self.__sequence = sequence
@@ -0,0 +1,112 @@
+import heapq
+from typing import Any, List, Tuple
+
+
+class Timeline:
+    """
+    Timeline class scheduling events against a round counter. Events are kept in a
+    min-heap keyed by the absolute round they are due, so advancing the timeline only
+    touches the events that expire in that round.
+    """
+
+    __round: int = 0
+    __events: List[Tuple[int, int, Any]] = []
+    __sequence: int = 0
+
+    def __init__(self) -> None:
+        """
+        Initializes the Timeline class at round 0 with no events.
+        """
+        self.set_round(0)
+        self.set_events([])
+        self.set_sequence(0)
+
+    def schedule(self, delay: int, event: Any) -> int:
+        """
+        Schedules an event a number of rounds after the current round.
+
+        :param delay: The number of rounds until the event is due.
+        :param event: The event to return once due.
+        :return: The absolute round the event is due.
+        """
+        due_round = self.get_round() + delay
+        # The sequence number keeps events due in the same round in scheduling order
+        heapq.heappush(self.get_events(), (due_round, self.get_sequence(), event))
+        self.set_sequence(self.get_sequence() + 1)
+        return due_round
+
+    def copy(self) -> "Timeline":
+        """
+        Creates a copy of the timeline, sharing the (immutable) events but not the heap.
+
+        :return: A new Timeline at the same round with the same pending events.
+        """
+        timeline = Timeline()
+        timeline.set_round(self.get_round())
+        timeline.set_events(list(self.get_events()))
+        timeline.set_sequence(self.get_sequence())
+        return timeline
+
+    def advance(self) -> List[Tuple[int, Any]]:
+        """
+        Moves to the next round and pops every event due by then.
+
+        :return: The due round and event of every popped event, in scheduling order.
+        """
+        self.set_round(self.get_round() + 1)
+        due_events = []
+        events = self.get_events()
+        while events and events[0][0] <= self.get_round():
+            due_round, _, event = heapq.heappop(events)
+            due_events.append((due_round, event))
+        return due_events
+
+    # Getters and setters with docstrings
+
+    def get_round(self) -> int:
+        """
+        Gets the current round.
+
+        :return: The current round.
+        """
+        return self.__round
+
+    def set_round(self, round: int) -> None:
+        """
+        Sets the current round.
+
+        :param round: The new current round.
+        """
+        self.__round = round
+
+    def get_events(self) -> List[Tuple[int, int, Any]]:
+        """
+        Gets the heap of scheduled events.
+
+        :return: The heap of (due round, sequence number, event) entries.
+        """
+        return self.__events
+
+    def set_events(self, events: List[Tuple[int, int, Any]]) -> None:
+        """
+        Sets the heap of scheduled events.
+
+        :param events: The new heap of (due round, sequence number, event) entries.
+        """
+        self.__events = events
+
+    def get_sequence(self) -> int:
+        """
+        Gets the sequence number given to the next scheduled event.
+
+        :return: The next sequence number.
+        """
+        return self.__sequence
+
+    def set_sequence(self, sequence: int) -> None:
+        """
+        Sets the sequence number given to the next scheduled event.
+
+        :param sequence: The new next sequence number.
+        """
+        self.__sequence = sequence
@@ -0,0 +1,47 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+from characters.enemies.base_enemy import BaseEnemy
+from characters.players.base_player import BasePlayer
+from quest import Quest
+
+# Messages hand characters from state to state by reference. A message is immutable,
+# so it can be passed on or kept by any number of states without being copied. The
+# characters it holds are owned by the message: the state creating it puts fresh
+# copies in and does not touch them again, and only the turn-based fight, which
+# receives them last, changes them.
+
+
+@dataclass(frozen=True, slots=True)
+class PlayerSelected:
+    """
+    PlayerSelected message sent once a character is picked, and passed on by the
+    menus visited before a fight.
+    """
+
+    player: BasePlayer
+
+
+@dataclass(frozen=True, slots=True)
+class FightStarted:
+    """
+    FightStarted message sent to the turn-based fight with both combatants.
+    """
+
+    player: BasePlayer
+    enemy: BaseEnemy
+
+
+@dataclass(frozen=True, slots=True)
+class FightEnded:
+    """
+    FightEnded message sent to the end menu with the outcome of the fight.
+    """
+
+    player: BasePlayer
+    enemy: BaseEnemy
+    winner: str  # "player" or "enemy"
+    temp_quest_completion: Optional[Quest] = None  # The quest master's quest, if done
+
+
+# Any message passed between states, None when there is nothing to pass
+TransitionMessage = Union[PlayerSelected, FightStarted, FightEnded, None]
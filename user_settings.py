@@ -0,0 +1,32 @@
+from typing import Any, Dict
+
+# Location of the saved user profile
+USER_SETTINGS_PATH = "settings/user_settings.sav"
+
+# Location of the saved user profile in older versions, migrated on first launch
+LEGACY_USER_SETTINGS_PATH = "settings/user_settings.json"
+
+# Default user data written on first launch and when the game is reset
+DEFAULT_USER_DATA: Dict[str, Any] = {
+    "xp": 5000,
+    "quest_progress": {
+        "Fireball": 0,
+        "Kill DreadNoughts": 0,
+    },
+    "quest_claimed": {
+        "Fireball": False,
+        "Kill DreadNoughts": False,
+    },
+    "character_level": {
+        "Warrior": 1,
+        "Mage": 1,
+        "Berserker": 1,
+        "Ranger": 1,
+    },
+    "character_abilities": {
+        "Warrior": ["Power Slash"],
+        "Mage": ["Fireball"],
+        "Berserker": ["Reckless Charge"],
+        "Ranger": ["Arrow Barrage"],
+    },
+}
@@ -6,6 +6,10 @@ BASE_IMG_PATH = "assets/"
 class Animation:
     """
     Animation class to handle sprite animations.
+
+    The images are converted to the display format, and flipped if needed, once when
+    the animation is created. Copies share these prepared frames, so getting the
+    current image never creates a surface.
     """
 
     __is_flipped: bool = False
@@ -13,6 +17,7 @@ class Animation:
     __frame: int = 0
     __is_loop: bool = True
     __imgs: list[pygame.Surface] = []
+    __frames: list[pygame.Surface] = []
     __img_duration: int = 5
 
     def __init__(
@@ -21,6 +26,7 @@ class Animation:
         image_duration=5,
         loop=True,
         is_flipped=False,
+        frames: list[pygame.Surface] = None,
     ) -> None:
         """
         Initializes the Animation class.
@@ -29,15 +35,56 @@ class Animation:
         :param image_duration: Duration each image is displayed.
         :param loop: Whether the animation should loop.
         :param is_flipped: Whether the animation should be flipped horizontally.
+        :param frames: The frames already prepared from the images, shared with the
+            animation copied, or None to prepare them.
         """
         self.set_imgs(images)
         self.set_is_loop(loop)
         self.set_img_duration(image_duration)
         self.set_is_flipped(is_flipped)
+        if frames is None:
+            self.prepare_frames()
+        else:
+            self.set_frames(frames)
+
+    def prepare_frames(self) -> None:
+        """
+        Converts the images to the display format with per-pixel alpha, flipping them
+        horizontally if the animation is flipped. Images sliced from one atlas are
+        converted, and flipped, as the single area of the atlas they cover and
+        sliced again.
+        """
+        atlas = self.get_imgs()[0].get_parent() if self.get_imgs() else None
+        if atlas is not None and all(
+            img.get_parent() is atlas for img in self.get_imgs()
+        ):
+            # Only the part of the atlas holding this animation's images is prepared
+            rects = [
+                pygame.Rect(img.get_offset(), img.get_size()) for img in self.get_imgs()
+            ]
+            bounds = rects[0].unionall(rects[1:])
+            sheet = atlas.subsurface(bounds).convert_alpha()
+            if self.get_is_flipped():
+                sheet = pygame.transform.flip(sheet, True, False)
+            frames = []
+            for img in self.get_imgs():
+                x, y = img.get_offset()
+                x, y = x - bounds.x, y - bounds.y
+                if self.get_is_flipped():
+                    # The flip mirrors where each image sits in the sheet
+                    x = sheet.get_width() - x - img.get_width()
+                frames.append(sheet.subsurface((x, y), img.get_size()))
+            self.set_frames(frames)
+            return
+
+        frames = [img.convert_alpha() for img in self.get_imgs()]
+        if self.get_is_flipped():
+            frames = [pygame.transform.flip(frame, True, False) for frame in frames]
+        self.set_frames(frames)
 
     def copy(self) -> "Animation":
         """
-        Creates a copy of the animation instance.
+        Creates a copy of the animation instance, sharing its prepared frames.
 
         :return: A new instance of Animation with the same attributes.
         """
@@ -46,6 +93,7 @@ class Animation:
             self.get_img_duration(),
             self.get_is_loop(),
             self.get_is_flipped(),
+            self.get_frames(),
         )
 
     def update(self) -> None:
@@ -71,15 +119,9 @@ class Animation:
         """
         Returns the current image of the animation.
 
-        :return: The current pygame.Surface image.
+        :return: The current pygame.Surface image, shared and not to be modified.
         """
-        current_img = self.get_imgs()[
-            int(self.get_frame() / self.get_img_duration())
-        ].convert_alpha()
-        if self.get_is_flipped():
-            return pygame.transform.flip(current_img, True, False)
-        else:
-            return current_img
+        return self.get_frames()[self.get_frame() // self.get_img_duration()]
 
     def is_done(self) -> bool:
         """
@@ -101,7 +143,8 @@ class Animation:
         """
         Sets the flipped status of the animation.
 
-        :param value: The new flipped status.
+        :param value: The new flipped status, applied to the frames when they are
+            next prepared.
         """
         self.__is_flipped = value
 
@@ -169,6 +212,22 @@ class Animation:
         """
         self.__imgs = value
 
+    def get_frames(self) -> list[pygame.Surface]:
+        """
+        Gets the frames prepared from the images.
+
+        :return: The converted, and possibly flipped, images.
+        """
+        return self.__frames
+
+    def set_frames(self, value: list[pygame.Surface]) -> None:
+        """
+        Sets the frames prepared from the images.
+
+        :param value: The new list of frames.
+        """
+        self.__frames = value
+
     def get_is_done(self) -> bool:
         """
         Gets the done status of the animation.
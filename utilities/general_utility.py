@@ -1,3 +1,6 @@
+from typing import List
+
+
 def min_max_bound(minimum: int, maximum: int, value: int) -> int:
     """
     Ensures that a given value is bounded within the specified minimum and maximum limits.
@@ -28,3 +31,17 @@ def convert_snake_to_title(string: str) -> str:
         str: The converted Title Case string.
     """
     return " ".join(word.capitalize() for word in string.split("_"))
+
+
+def percentile(values: List[int], percent: float) -> int:
+    """
+    Computes a nearest-rank percentile.
+
+    :param values: The values, sorted in ascending order.
+    :param percent: The percentile to compute, between 0 and 100.
+    :return: The percentile value, or 0 if there are no values.
+    """
+    if not values:
+        return 0
+    rank = max(1, int(round(percent / 100 * len(values))))
+    return values[min(rank, len(values)) - 1]
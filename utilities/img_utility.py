@@ -1,19 +1,32 @@
 import pygame
-import os
+from asset_prefetcher import get_asset_prefetcher
+from sprite_atlas import find_atlas
+from surface_cache import get_surface_cache
 
 BASE_IMG_PATH = "assets/"
 
 
-# load a image from a given path into a pygame surface
-def load_image(path: str) -> pygame.Surface:
-    img = pygame.image.load(BASE_IMG_PATH + path).convert()
+# prepare a decoded image for drawing, black being transparent
+def prepare_image(img: pygame.Surface) -> pygame.Surface:
+    img = img.convert()
     img.set_colorkey((0, 0, 0))
     return img
 
 
-# load a group of images from a given folder into a list of pygame surfaces
+# load a image from a given path into a pygame surface, shared through the cache
+def load_image(path: str) -> pygame.Surface:
+    return get_surface_cache().load(BASE_IMG_PATH + path, convert="colorkey")
+
+
+# load a group of images from a given folder into a list of pygame surfaces,
+# sliced from the character's cached atlas if the folder was packed, and picking
+# up the images already decoded if the folder or atlas was prefetched
 def load_images(path: str) -> list[pygame.Surface]:
-    images = []
-    for img_name in sorted(os.listdir(BASE_IMG_PATH + path)):
-        images.append(load_image(path + "/" + img_name))
-    return images
+    atlas = find_atlas(path)
+    if atlas is not None:
+        atlas_path, rects = atlas
+        atlas_img = get_surface_cache().load(
+            atlas_path, convert="colorkey", decode=get_asset_prefetcher().load_image
+        )
+        return [atlas_img.subsurface(rect) for rect in rects]
+    return [prepare_image(img) for img in get_asset_prefetcher().load(path)]
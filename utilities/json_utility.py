@@ -2,6 +2,10 @@ import json
 import os
 from typing import Any, Dict
 
+# When write_bytes_atomic forces data to disk: never, the file before it replaces the
+# old one, or the file and then its directory so the rename itself survives a crash
+FSYNC_POLICIES = ("none", "file", "full")
+
 
 def read_json(file_path: str) -> Dict[str, Any]:
     """
@@ -29,6 +33,52 @@ def write_json(file_path: str, data: Dict[str, Any]) -> None:
         json.dump(data, file, indent=4)
 
 
+def write_bytes_atomic(
+    file_path: str, contents: bytes, fsync_policy: str = "file"
+) -> None:
+    """
+    Writes bytes to a file atomically: the bytes go to a temporary file next to it,
+    which then replaces the file in one step, so a crash mid-write leaves either the
+    old or the new file intact.
+
+    :param file_path: Path to the file.
+    :param contents: Bytes to write to the file.
+    :param fsync_policy: One of FSYNC_POLICIES.
+    :raises ValueError: If the fsync policy is unknown.
+    """
+    if fsync_policy not in FSYNC_POLICIES:
+        raise ValueError(f"Unknown fsync policy: {fsync_policy}")
+    temp_path = f"{file_path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(contents)
+        if fsync_policy != "none":
+            file.flush()
+            os.fsync(file.fileno())
+    os.replace(temp_path, file_path)
+    if fsync_policy == "full" and hasattr(os, "O_DIRECTORY"):
+        directory = os.open(os.path.dirname(file_path) or ".", os.O_DIRECTORY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+
+def write_json_atomic(
+    file_path: str, data: Dict[str, Any], fsync_policy: str = "file"
+) -> None:
+    """
+    Writes a dictionary to a JSON file atomically, see write_bytes_atomic.
+
+    :param file_path: Path to the JSON file.
+    :param data: Dictionary to write to the JSON file.
+    :param fsync_policy: One of FSYNC_POLICIES.
+    :raises ValueError: If the fsync policy is unknown.
+    """
+    write_bytes_atomic(
+        file_path, json.dumps(data, indent=4).encode("utf-8"), fsync_policy
+    )
+
+
 def write_default_if_not_exist(file_path: str, default_data: Dict[str, Any]) -> None:
     """
     Writes a default dictionary to a JSON file if it does not exist.
@@ -0,0 +1,366 @@
+import numpy as np
+from characters.base_character import BaseCharacter
+from stat_block import STAT_NAMES, StatBlock
+from typing import Dict, Tuple
+
+# Row index of every stat in the column-wise stat arrays
+STAT_INDEX: Dict[str, int] = {
+    stat_name: stat_index for stat_index, stat_name in enumerate(STAT_NAMES)
+}
+
+
+def create_stat_columns(stats: StatBlock, fight_count: int) -> np.ndarray:
+    """
+    Creates the column-wise stats of one character repeated across a number of fights.
+
+    :param stats: The character's stats.
+    :param fight_count: The number of fights.
+    :return: An array of shape (len(STAT_NAMES), fight_count).
+    """
+    values = np.array([value for _, value in stats.items()], dtype=np.int64)
+    return np.repeat(values[:, np.newaxis], fight_count, axis=1)
+
+
+def attack(
+    stats: np.ndarray, critical_rate: np.ndarray, rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized CombatController.attack damage formula for a batch of fights.
+
+    :param stats: Column-wise attacker stats.
+    :param critical_rate: Critical rate of every fight.
+    :param rng: Random generator for the critical roll.
+    :return: The physical and magical damage of every fight.
+    """
+    critical_dmg_addition = rng.integers(0, critical_rate.astype(np.int64) + 1)
+    physical_dmg = np.maximum(
+        0,
+        np.trunc(
+            stats[STAT_INDEX["physical_damage"]]
+            * stats[STAT_INDEX["physical_power"]]
+            / 50
+            + critical_dmg_addition
+        ),
+    ).astype(np.int64)
+    magical_dmg = np.maximum(
+        0,
+        np.trunc(
+            stats[STAT_INDEX["magical_damage"]]
+            * stats[STAT_INDEX["spell_power"]]
+            / 50
+            + critical_dmg_addition
+        ),
+    ).astype(np.int64)
+    return physical_dmg, magical_dmg
+
+
+def face_damage(
+    stats: np.ndarray, physical_dmg: np.ndarray, magical_dmg: np.ndarray
+) -> None:
+    """
+    Vectorized CombatController.face_damage formula, reducing health points in place.
+
+    :param stats: Column-wise defender stats.
+    :param physical_dmg: The physical damage of every fight.
+    :param magical_dmg: The magical damage of every fight.
+    """
+    physical = np.maximum(
+        0, physical_dmg * (1 - stats[STAT_INDEX["physical_defense"]] / 400)
+    )
+    magical = np.maximum(
+        0, magical_dmg * (1 - stats[STAT_INDEX["magical_defense"]] / 400)
+    )
+    total_dmg = np.maximum(0, physical + magical - stats[STAT_INDEX["absorption"]])
+    health_points = stats[STAT_INDEX["health_points"]]
+    stats[STAT_INDEX["health_points"]] = np.maximum(
+        0, health_points - total_dmg.astype(np.int64)
+    )
+
+
+def regenerate(stats: np.ndarray, stats_cap: np.ndarray) -> None:
+    """
+    Vectorized CombatController.regenerate, restoring health and mana points in place.
+
+    :param stats: Column-wise stats.
+    :param stats_cap: Column-wise stats cap.
+    """
+    for points, regeneration in (
+        ("health_points", "health_regeneration"),
+        ("mana_points", "mana_regeneration"),
+    ):
+        stats[STAT_INDEX[points]] = np.clip(
+            stats[STAT_INDEX[points]] + stats[STAT_INDEX[regeneration]],
+            0,
+            stats_cap[STAT_INDEX[points]],
+        )
+
+
+class CombatBatch:
+    """
+    CombatBatch class to resolve many independent fights at once as array operations.
+    Every round is a player normal attack followed by an enemy normal attack, the same
+    exchange CombatSimulator plays when neither side uses an ability. Ability effects
+    can be folded in by editing the stat columns between rounds.
+    """
+
+    __player_stats: np.ndarray = None
+    __player_stats_cap: np.ndarray = None
+    __enemy_stats: np.ndarray = None
+    __enemy_stats_cap: np.ndarray = None
+    __critical_rate: np.ndarray = None
+    __rounds: np.ndarray = None
+    __player_damage: np.ndarray = None
+    __rng: np.random.Generator = None
+
+    def __init__(
+        self,
+        player: BaseCharacter,
+        enemy: BaseCharacter,
+        fight_count: int,
+        hit_height: float = 100,
+        sprite_height: float = 200,
+        seed: int = None,
+    ) -> None:
+        """
+        Initializes the CombatBatch class.
+
+        :param player: The player character, left untouched by the simulation.
+        :param enemy: The enemy character, left untouched by the simulation.
+        :param fight_count: The number of fights resolved together.
+        :param hit_height: How high up the enemy sprite the player hits, in pixels.
+        :param sprite_height: The sprite height the hit height is measured against.
+        :param seed: Seed for the critical rolls, or None for a random seed.
+        """
+        self.set_player_stats(create_stat_columns(player.get_stats(), fight_count))
+        self.set_player_stats_cap(self.get_player_stats().copy())
+        self.set_enemy_stats(create_stat_columns(enemy.get_stats(), fight_count))
+        self.set_enemy_stats_cap(self.get_enemy_stats().copy())
+        self.set_critical_rate(
+            np.full(fight_count, hit_height / sprite_height * 100)
+        )
+        self.set_rounds(np.zeros(fight_count, dtype=np.int64))
+        self.set_player_damage(np.zeros(fight_count, dtype=np.int64))
+        self.set_rng(np.random.default_rng(seed))
+
+    def play_round(self) -> None:
+        """
+        Resolves one player turn and one enemy turn for every fight still running.
+        """
+        player_stats = self.get_player_stats()
+        enemy_stats = self.get_enemy_stats()
+        health_index = STAT_INDEX["health_points"]
+
+        # Player's turn for the fights where both sides are alive
+        running = (player_stats[health_index] > 0) & (enemy_stats[health_index] > 0)
+        if not running.any():
+            return
+        self.resolve_turn(
+            player_stats,
+            self.get_player_stats_cap(),
+            enemy_stats,
+            self.get_enemy_stats_cap(),
+            self.get_critical_rate(),
+            running,
+            self.get_player_damage(),
+        )
+        self.get_rounds()[running] += 1
+
+        # Enemy's turn for the fights the player did not just win
+        running &= enemy_stats[health_index] > 0
+        self.resolve_turn(
+            enemy_stats,
+            self.get_enemy_stats_cap(),
+            player_stats,
+            self.get_player_stats_cap(),
+            np.zeros(len(running)),
+            running,
+            None,
+        )
+        self.get_rounds()[running] += 1
+
+    def resolve_turn(
+        self,
+        attacker_stats: np.ndarray,
+        attacker_stats_cap: np.ndarray,
+        defender_stats: np.ndarray,
+        defender_stats_cap: np.ndarray,
+        critical_rate: np.ndarray,
+        running: np.ndarray,
+        damage_tally: np.ndarray,
+    ) -> None:
+        """
+        Resolves one attack for the running fights: both sides regenerate, then the attacker hits.
+
+        :param attacker_stats: Column-wise attacker stats.
+        :param attacker_stats_cap: Column-wise attacker stats cap.
+        :param defender_stats: Column-wise defender stats.
+        :param defender_stats_cap: Column-wise defender stats cap.
+        :param critical_rate: Critical rate of every fight.
+        :param running: Mask of the fights taking this turn.
+        :param damage_tally: Array accumulating the damage dealt, or None.
+        """
+        attacker = attacker_stats[:, running]
+        defender = defender_stats[:, running]
+        regenerate(attacker, attacker_stats_cap[:, running])
+        regenerate(defender, defender_stats_cap[:, running])
+        physical_dmg, magical_dmg = attack(
+            attacker, critical_rate[running], self.get_rng()
+        )
+        face_damage(defender, physical_dmg, magical_dmg)
+        attacker_stats[:, running] = attacker
+        defender_stats[:, running] = defender
+        if damage_tally is not None:
+            damage_tally[running] += physical_dmg + magical_dmg
+
+    def run(self, max_rounds: int = 500) -> np.ndarray:
+        """
+        Plays rounds until every fight is decided or the round limit is reached.
+
+        :param max_rounds: Round limit after which the remaining fights are draws.
+        :return: The winner of every fight: 1 for the player, -1 for the enemy, 0 for a draw.
+        """
+        health_index = STAT_INDEX["health_points"]
+        while self.get_rounds().max(initial=0) < max_rounds:
+            player_alive = self.get_player_stats()[health_index] > 0
+            enemy_alive = self.get_enemy_stats()[health_index] > 0
+            if not (player_alive & enemy_alive).any():
+                break
+            self.play_round()
+
+        winners = np.zeros(len(self.get_rounds()), dtype=np.int64)
+        winners[self.get_enemy_stats()[health_index] <= 0] = 1
+        winners[
+            (self.get_enemy_stats()[health_index] > 0)
+            & (self.get_player_stats()[health_index] <= 0)
+        ] = -1
+        return winners
+
+    # Getters and setters with docstrings
+
+    def get_player_stats(self) -> np.ndarray:
+        """
+        Gets the column-wise player stats.
+
+        :return: The column-wise player stats.
+        """
+        return self.__player_stats
+
+    def set_player_stats(self, player_stats: np.ndarray) -> None:
+        """
+        Sets the column-wise player stats.
+
+        :param player_stats: The new column-wise player stats.
+        """
+        self.__player_stats = player_stats
+
+    def get_player_stats_cap(self) -> np.ndarray:
+        """
+        Gets the column-wise player stats cap.
+
+        :return: The column-wise player stats cap.
+        """
+        return self.__player_stats_cap
+
+    def set_player_stats_cap(self, player_stats_cap: np.ndarray) -> None:
+        """
+        Sets the column-wise player stats cap.
+
+        :param player_stats_cap: The new column-wise player stats cap.
+        """
+        self.__player_stats_cap = player_stats_cap
+
+    def get_enemy_stats(self) -> np.ndarray:
+        """
+        Gets the column-wise enemy stats.
+
+        :return: The column-wise enemy stats.
+        """
+        return self.__enemy_stats
+
+    def set_enemy_stats(self, enemy_stats: np.ndarray) -> None:
+        """
+        Sets the column-wise enemy stats.
+
+        :param enemy_stats: The new column-wise enemy stats.
+        """
+        self.__enemy_stats = enemy_stats
+
+    def get_enemy_stats_cap(self) -> np.ndarray:
+        """
+        Gets the column-wise enemy stats cap.
+
+        :return: The column-wise enemy stats cap.
+        """
+        return self.__enemy_stats_cap
+
+    def set_enemy_stats_cap(self, enemy_stats_cap: np.ndarray) -> None:
+        """
+        Sets the column-wise enemy stats cap.
+
+        :param enemy_stats_cap: The new column-wise enemy stats cap.
+        """
+        self.__enemy_stats_cap = enemy_stats_cap
+
+    def get_critical_rate(self) -> np.ndarray:
+        """
+        Gets the player's critical rate in every fight.
+
+        :return: The critical rates.
+        """
+        return self.__critical_rate
+
+    def set_critical_rate(self, critical_rate: np.ndarray) -> None:
+        """
+        Sets the player's critical rate in every fight.
+
+        :param critical_rate: The new critical rates.
+        """
+        self.__critical_rate = critical_rate
+
+    def get_rounds(self) -> np.ndarray:
+        """
+        Gets the number of rounds played in every fight.
+
+        :return: The rounds played.
+        """
+        return self.__rounds
+
+    def set_rounds(self, rounds: np.ndarray) -> None:
+        """
+        Sets the number of rounds played in every fight.
+
+        :param rounds: The new rounds played.
+        """
+        self.__rounds = rounds
+
+    def get_player_damage(self) -> np.ndarray:
+        """
+        Gets the total damage dealt by the player in every fight.
+
+        :return: The player's total damage.
+        """
+        return self.__player_damage
+
+    def set_player_damage(self, player_damage: np.ndarray) -> None:
+        """
+        Sets the total damage dealt by the player in every fight.
+
+        :param player_damage: The new player's total damage.
+        """
+        self.__player_damage = player_damage
+
+    def get_rng(self) -> np.random.Generator:
+        """
+        Gets the random generator for the critical rolls.
+
+        :return: The random generator.
+        """
+        return self.__rng
+
+    def set_rng(self, rng: np.random.Generator) -> None:
+        """
+        Sets the random generator for the critical rolls.
+
+        :param rng: The new random generator.
+        """
+        self.__rng = rng
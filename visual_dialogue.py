@@ -17,9 +17,14 @@ class VisualDialogue:
     __temp_quest: Quest = None
     __dialogue_UI: UITextBox = None
     __quest_display: UITextBox = None
+    __rng: random.Random = None
 
     def __init__(
-        self, ui_manager: pygame_gui.UIManager, container: UIPanel, temp_quest: Quest
+        self,
+        ui_manager: pygame_gui.UIManager,
+        container: UIPanel,
+        temp_quest: Quest,
+        rng: random.Random = None,
     ) -> None:
         """
         Initializes the VisualDialogue class.
@@ -27,9 +32,11 @@ class VisualDialogue:
         :param ui_manager: The UI manager for pygame_gui.
         :param container: The container UIPanel.
         :param temp_quest: The temporary quest.
+        :param rng: The random stream for picking dialogue, or None for an unseeded one.
         """
         # Setting the initial values using setters
         self.set_temp_quest(temp_quest)
+        self.set_rng(rng if rng is not None else random.Random())
 
         # Initializing the dialogue UITextBox
         self.set_dialogue_UI(
@@ -134,19 +141,19 @@ class VisualDialogue:
             enemy_dialogues.append("That won't happen again!")
 
         # Randomly choose the number of dialogues for player and enemy
-        player_dialogue_number, enemy_dialogue_number = random.choice(
+        player_dialogue_number, enemy_dialogue_number = self.get_rng().choice(
             [(1, 1), (2, 0), (0, 2), (1, 0), (0, 1)]
         )
 
         # Select and format player dialogues
         for _ in range(player_dialogue_number):
-            player_dialogue = random.choice(player_dialogues)
+            player_dialogue = self.get_rng().choice(player_dialogues)
             player_dialogues.pop(player_dialogues.index(player_dialogue))
             player_dialogue_output += f"{player_name}: {player_dialogue}\n"
 
         # Select and format enemy dialogues
         for _ in range(enemy_dialogue_number):
-            enemy_dialogue = random.choice(enemy_dialogues)
+            enemy_dialogue = self.get_rng().choice(enemy_dialogues)
             enemy_dialogues.pop(enemy_dialogues.index(enemy_dialogue))
             enemy_dialogue_output += f"{enemy_name}: {enemy_dialogue}\n"
 
@@ -222,6 +229,22 @@ class VisualDialogue:
         """
         self.__temp_quest = value
 
+    def get_rng(self) -> random.Random:
+        """
+        Gets the random stream for picking dialogue.
+
+        :return: The random stream.
+        """
+        return self.__rng
+
+    def set_rng(self, value: random.Random) -> None:
+        """
+        Sets the random stream for picking dialogue.
+
+        :param value: The new random stream.
+        """
+        self.__rng = value
+
     # Getter and setter for __dialogue
     def get_dialogue_UI(self) -> UITextBox:
         """
@@ -1,4 +1,4 @@
-from utilities.json_utility import read_json, write_json
+from settings_store import get_settings_store
 
 
 class XP:
@@ -16,22 +16,24 @@ class XP:
 
     def gain_xp(self, new_xp: int) -> None:
         """
-        Increases the user's XP by the specified amount and updates the settings file.
+        Increases the user's XP by the specified amount and updates the user settings.
 
         :param new_xp: The amount of XP to gain.
         """
-        self.set_xp(self.get_xp() + new_xp)
+        self.__xp = self.get_xp() + new_xp
+        get_settings_store().add("xp", new_xp)
 
     def lose_xp(self, lost_xp: int) -> None:
         """
         Decreases the user's XP by the specified amount if sufficient XP is available.
-        Updates the settings file. Raises an error if not enough XP.
+        Updates the user settings. Raises an error if not enough XP.
 
         :param lost_xp: The amount of XP to lose.
         :raises ValueError: If not enough XP is available.
         """
         if self.get_xp() - lost_xp >= 0:
-            self.set_xp(self.get_xp() - lost_xp)
+            self.__xp = self.get_xp() - lost_xp
+            get_settings_store().add("xp", -lost_xp)
         else:
             raise ValueError("Not Enough XP!")
 
@@ -45,11 +47,9 @@ class XP:
 
     def set_xp(self, new_xp: int) -> None:
         """
-        Sets the current amount of XP and updates the settings file.
+        Sets the current amount of XP and updates the user settings.
 
         :param new_xp: The new amount of XP.
         """
         self.__xp = new_xp
-        user_setting = read_json("settings/user_settings.json")
-        user_setting["xp"] = self.__xp
-        write_json("settings/user_settings.json", user_setting)
+        get_settings_store().set("xp", self.__xp)